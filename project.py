@@ -3,13 +3,25 @@ from tabulate import tabulate
 from fpdf import FPDF
 from fpdf.fonts import FontFace
 from fpdf.enums import XPos, YPos
-from typing import Type, TypeVar
+from typing import Callable, Iterator, Type, TypeVar
 import matplotlib.pyplot as plt
+import numpy as np
 import pprint as pp
+import subprocess
+import collections
+import concurrent.futures
+import contextlib
 import datetime
+import functools
+import hashlib
+import heapq
+import io
+import json
+import time
 import csv
 import re
 import os
+import sys
 
 
 # Define type for class as to typehint 'cls' when using @classmethod
@@ -21,6 +33,17 @@ H = TypeVar(
     "H", bound="HT"
 )  # HT class (composte material with effective properties estimated by Halpin-Tsai)
 
+# Quantization mode of computed values (see ``set_deferred_quantization``)
+_deferred_quantization: bool = False
+
+# Active sink of printed output (see ``quiet``)
+_output_buffer: "OutputBuffer | None" = None
+
+# Least-recently-used cache of comparison data (see ``comparison_cache_info``)
+_comparison_cache: collections.OrderedDict = collections.OrderedDict()
+_comparison_cache_maxsize: int = 128
+_comparison_cache_stats: dict = {"hits": 0, "misses": 0}
+
 
 class Isotropic:
     """
@@ -87,6 +110,10 @@ class Isotropic:
     `pstrain_bulk_modulus`: Decimal
         Plane-strain bulk modulus of isotropic material  (dependent instance attribute)
 
+    `temperature_table`: tuple[tuple[Decimal, Decimal, Decimal], ...]
+        Optional table of temperature, Young's modulus and Poisson's ratio rows used
+        for temperature-dependent analysis (empty tuple when not defined)
+
     ...
 
     Methods:
@@ -117,6 +144,10 @@ class Isotropic:
         ``@property'': get `pstrain_bulk_modulus` value
         ``@pstrain_bulk_modulus.setter``: set `pstrain_bulk_modulus` value
 
+    ``temperature_table``:
+        ``@property``: get `temperature_table` rows
+        ``@temperature_table.setter``: set `temperature_table` rows
+
     ``get``:
         ``@classmethod``: contains constructor that instantiates ```Isotropic``` object
             based on user inputs
@@ -146,6 +177,10 @@ class Isotropic:
         Returns a dict of ```Isotropic```'s instance attributes with key and value pairs
             for the purpose of preparing the data either to be displayed in table form
             on console screen or to be saved as csv format data
+
+    ``_get_elastic_constants``:
+        Returns the elastic constants needed by Halpin-Tsai formulae as float arrays,
+            optionally interpolated from `temperature_table` at given temperatures
     """
 
     def __init__(
@@ -153,6 +188,7 @@ class Isotropic:
         name: str,
         youngs_modulus: Decimal,
         poissons_ratio: Decimal,
+        temperature_table: dict | None = None,
     ) -> None:
         """
         Initialize instance attributes of instantiated ```Isotropic``` object.
@@ -163,6 +199,10 @@ class Isotropic:
         : type: Decimal
         : param `poissons_ratio`: Poisson's ratio of isotropic material
         : type: Decimal
+        : param `temperature_table`: Optional Young's modulus and Poisson's ratio of
+            isotropic material versus temperature, e.g. {23: (2.8, 0.3), 120: (1.9,
+            0.33)}
+        : type: dict | None
         : rtype: None
 
         ...
@@ -185,6 +225,7 @@ class Isotropic:
         self.poissons_ratio = poissons_ratio
         self.shear_modulus = Isotropic._get_shear_constant(self)
         self.pstrain_bulk_modulus = Isotropic._get_pstrain_bulk_modulus(self)
+        self.temperature_table = temperature_table
 
     def __str__(self) -> str:
         """Prints out the instance attributes and their respective values of the current
@@ -465,7 +506,7 @@ class Isotropic:
             raise ValueError("Missing or invalid shear_modulus value (G > 0)")
         if Decimal(shear_modulus).quantize(
             Decimal("1.000")
-        ) != Isotropic._get_shear_constant(self):
+        ) != Isotropic._get_shear_constant(self).quantize(Decimal("1.000")):
             raise ValueError("Violated shear modulus value based on isotropic formula")
         self._shear_modulus = Decimal(shear_modulus).quantize(Decimal("1.000"))
 
@@ -527,7 +568,7 @@ class Isotropic:
             )
         if Decimal(pstrain_bulk_modulus).quantize(
             Decimal("1.000")
-        ) != Isotropic._get_pstrain_bulk_modulus(self):
+        ) != Isotropic._get_pstrain_bulk_modulus(self).quantize(Decimal("1.000")):
             raise ValueError(
                 "Violated plane-strain bulk modulus value based on isotropic formula"
             )
@@ -535,6 +576,52 @@ class Isotropic:
             Decimal("1.000")
         )
 
+    @property
+    def temperature_table(self) -> tuple:
+        """Get `temperature_table` rows.
+
+        : return: Rows of temperature, Young's modulus and Poisson's ratio of isotropic
+            material sorted by temperature, or empty tuple when no table is defined
+        : rtype: tuple[tuple[Decimal, Decimal, Decimal], ...]
+
+        Examples:
+            >>> obj.temperature_table
+            ((Decimal('23.000'), Decimal('2.800'), Decimal('0.300')), (Decimal('120.0
+            00'), Decimal('1.900'), Decimal('0.330')))
+            >>>
+        """
+        return self._temperature_table
+
+    @temperature_table.setter
+    def temperature_table(self, temperature_table: dict | None) -> None:
+        """Set `temperature_table` rows with the help of ``_get_temperature_rows``
+        helper function where every temperature maps to a tuple of Young's modulus and
+        Poisson's ratio which are validated the same way as `youngs_modulus` and
+        `poissons_ratio`.
+
+        : param `temperature_table`: Young's modulus and Poisson's ratio of isotropic
+            material versus temperature or None when not temperature-dependent
+        : type: dict | None
+        : raise TypeError: If table is not a dict or its values are not tuples of two
+            elastic constants
+        : raise ValueError: If table is empty, or any temperature or elastic constant
+            is invalid
+        : rtype: None
+
+        Examples:
+            >>> obj.temperature_table = {23: (2.8, 0.3), 120: (1.9, 0.33)}
+            >>>
+            >>> obj.temperature_table = {23: (2.8, 0.6)}
+            Traceback (most recent call last):
+                ...
+                ...
+            ValueError: Missing or invalid Poisson's ratio value (0 < v < 0.5 )
+            >>>
+        """
+        self._temperature_table = _get_temperature_rows(
+            temperature_table, ("constant", "ratio")
+        )
+
     @classmethod
     def get(cls: Type[ISO]) -> ISO:
         """
@@ -792,9 +879,9 @@ class Isotropic:
         : return: Computed value of `shear_modulus` of isotropic material
         : rtype: Decimal
         """
-        return (
+        return _quantize(
             self.youngs_modulus / (Decimal("2") * (Decimal("1") + self.poissons_ratio))
-        ).quantize(Decimal("1.000"))
+        )
 
     def _get_pstrain_bulk_modulus(self) -> Decimal:
         """
@@ -807,14 +894,14 @@ class Isotropic:
         : return: Computed value of plane-strain bulk of isotropic material
         : rtype: Decimal
         """
-        return (
+        return _quantize(
             self.youngs_modulus
             / (
                 Decimal("2")
                 * (Decimal("1") + self.poissons_ratio)
                 * (Decimal("1") - (Decimal("2") * self.poissons_ratio))
             )
-        ).quantize(Decimal("1.000"))
+        )
 
     def _get_info(self) -> dict:
         """Return information on its instance attributes (with different names) and
@@ -833,6 +920,47 @@ class Isotropic:
             "Plane-strain\nBulk Modulus,\nK (GPa)": self.pstrain_bulk_modulus,
         }
 
+    def _get_elastic_constants(self, temperatures: np.ndarray | None = None) -> tuple:
+        """Return the elastic constants of isotropic material in the order needed by
+        the vectorized Halpin-Tsai formulae, i.e. axial Young's modulus, major Poisson's
+        ratio, axial shear modulus, transverse shear modulus and plane-strain bulk
+        modulus, where the last four follow from Young's modulus and Poisson's ratio.
+
+        When `temperatures` is given and `temperature_table` is defined, Young's
+        modulus and Poisson's ratio are linearly interpolated from the table at every
+        temperature (constant beyond the first and last row). Otherwise the current
+        values of `youngs_modulus` and `poissons_ratio` are used for every temperature.
+
+        : param `temperatures`: Temperatures where the elastic constants are evaluated
+            or None for the current values
+        : type: np.ndarray | None
+        : return: Five float arrays of elastic constants with the same shape as
+            `temperatures` (zero-dimension arrays when None)
+        : rtype: tuple[np.ndarray, ...]
+        """
+        # Get the two independent elastic constants
+        if temperatures is not None and self.temperature_table:
+            youngs_modulus, poissons_ratio = _interpolate_temperature_rows(
+                self.temperature_table, temperatures
+            )
+        else:
+            shape = () if temperatures is None else np.shape(temperatures)
+            youngs_modulus = np.full(shape, float(self.youngs_modulus))
+            poissons_ratio = np.full(shape, float(self.poissons_ratio))
+
+        # Compute dependent elastic constants with isotropic relations
+        shear_modulus = youngs_modulus / (2.0 * (1.0 + poissons_ratio))
+        pstrain_bulk_modulus = youngs_modulus / (
+            2.0 * (1.0 + poissons_ratio) * (1.0 - 2.0 * poissons_ratio)
+        )
+        return (
+            youngs_modulus,
+            poissons_ratio,
+            shear_modulus,
+            shear_modulus,
+            pstrain_bulk_modulus,
+        )
+
 
 class Transtropic:
     """
@@ -913,6 +1041,10 @@ class Transtropic:
     `pstrain_bulk_modulus`: Decimal
         Plane-strain bulk modulus of transversely isotropic material
 
+    `temperature_table`: tuple[tuple[Decimal, ...], ...]
+        Optional table of temperature and the five independent elastic constants used
+        for temperature-dependent analysis (empty tuple when not defined)
+
     ...
 
     Methods:
@@ -956,6 +1088,10 @@ class Transtropic:
         ``@property``: get `pstrain_bulk_modulus` value
         ``@pstrain_bulk_modulus.setter``: set `pstrain_bulk_modulus` value
 
+    ``temperature_table``:
+        ``@property``: get `temperature_table` rows
+        ``@temperature_table.setter``: set `temperature_table` rows
+
     ``get``:
         ''@classmethod``: constructor that instantiates ```Transtropic``` object based
             on user inputs
@@ -973,6 +1109,10 @@ class Transtropic:
         Returns a dict of ```Isotropic```'s instance attributes with key and value pairs
             for the purpose of preparing the data either to be displayed in table form
             on console screen or to be saved as csv format data
+
+    ``_get_elastic_constants``:
+        Returns the elastic constants needed by Halpin-Tsai formulae as float arrays,
+            optionally interpolated from `temperature_table` at given temperatures
     ....
 
     Instance @staticmethods borrowed from ```Isotropic``` class
@@ -998,6 +1138,7 @@ class Transtropic:
         axial_shear_modulus: Decimal,
         transverse_shear_modulus: Decimal,
         major_poissons_ratio: Decimal,
+        temperature_table: dict | None = None,
     ) -> None:
         """
         Initialize instance attributes of instantiated ```Transtropic`` object.
@@ -1019,6 +1160,10 @@ class Transtropic:
         : param `major_poissons_ratio`: Value of major Poisson's ratio of transversely
             isotropic material
         : type: Decimal
+        : param `temperature_table`: Optional five independent elastic constants of
+            transversely isotropic material versus temperature in the same order as
+            above, e.g. {23: (250, 25, 20, 10, 0.28), 150: (245, 22, 16, 8, 0.28)}
+        : type: dict | None
 
         ...
 
@@ -1040,6 +1185,7 @@ class Transtropic:
         self.transverse_shear_modulus = transverse_shear_modulus
         self.major_poissons_ratio = major_poissons_ratio
         self.pstrain_bulk_modulus = Transtropic._get_pstrain_bulk_modulus(self)
+        self.temperature_table = temperature_table
 
     def __str__(self) -> str:
         """Prints out instance attributes and their respective values of the current
@@ -1617,7 +1763,7 @@ class Transtropic:
             raise ValueError("Missing plane-strain bulk modulus value")
         if Decimal(pstrain_bulk_modulus).quantize(
             Decimal("1.000")
-        ) != Transtropic._get_pstrain_bulk_modulus(self):
+        ) != Transtropic._get_pstrain_bulk_modulus(self).quantize(Decimal("1.000")):
             raise ValueError(
                 "Violated plane-strain bulk modulus value from transverse-isotropic "
                 + "formula"
@@ -1626,6 +1772,55 @@ class Transtropic:
             Decimal("1.000")
         )
 
+    @property
+    def temperature_table(self) -> tuple:
+        """Get `temperature_table` rows.
+
+        : return: Rows of temperature, axial Young's modulus, transverse Young's
+            modulus, axial shear modulus, transverse shear modulus and major Poisson's
+            ratio sorted by temperature, or empty tuple when no table is defined
+        : rtype: tuple[tuple[Decimal, ...], ...]
+
+        Examples:
+            >>> obj.temperature_table
+            ((Decimal('23.000'), Decimal('250.000'), Decimal('25.000'), Decimal('20.00
+            0'), Decimal('10.000'), Decimal('0.280')),)
+            >>>
+        """
+        return self._temperature_table
+
+    @temperature_table.setter
+    def temperature_table(self, temperature_table: dict | None) -> None:
+        """Set `temperature_table` rows with the help of ``_get_temperature_rows``
+        helper function where every temperature maps to a tuple of the five independent
+        elastic constants which are validated the same way as their instance
+        attributes.
+
+        : param `temperature_table`: Five independent elastic constants of
+            transversely isotropic material versus temperature or None when not
+            temperature-dependent
+        : type: dict | None
+        : raise TypeError: If table is not a dict or its values are not tuples of five
+            elastic constants
+        : raise ValueError: If table is empty, or any temperature or elastic constant
+            is invalid
+        : rtype: None
+
+        Examples:
+            >>> obj.temperature_table = {23: (250, 25, 20, 10, 0.28)}
+            >>>
+            >>> obj.temperature_table = {23: (250, 25, 20, 10)}
+            Traceback (most recent call last):
+                ...
+                ...
+            TypeError: Expected every temperature to map to a tuple of 5 elastic constants
+            >>>
+        """
+        self._temperature_table = _get_temperature_rows(
+            temperature_table,
+            ("constant", "constant", "constant", "constant", "ratio"),
+        )
+
     @classmethod
     def get(cls: Type[TI]) -> TI:
         """
@@ -1874,7 +2069,7 @@ class Transtropic:
             material
         : rtype: Decimal
         """
-        return (
+        return _quantize(
             self.transverse_shear_modulus
             * self.transverse_youngs_modulus
             / (
@@ -1888,7 +2083,7 @@ class Transtropic:
                 )
                 / self.axial_youngs_modulus
             )
-        ).quantize(Decimal("1.000"))
+        )
 
     def _get_info(self) -> dict:
         """Return information on its instance attributes (with different names) and
@@ -1910,6 +2105,273 @@ class Transtropic:
             "Plane-strain\nBulk\nModulus,\nK23 (GPa)": self.pstrain_bulk_modulus,
         }
 
+    def _get_elastic_constants(self, temperatures: np.ndarray | None = None) -> tuple:
+        """Return the elastic constants of transversely isotropic material in the order
+        needed by the vectorized Halpin-Tsai formulae, i.e. axial Young's modulus, major
+        Poisson's ratio, axial shear modulus, transverse shear modulus and plane-strain
+        bulk modulus, where the last one follows from the transverse-isotropic relation.
+
+        When `temperatures` is given and `temperature_table` is defined, the five
+        independent elastic constants are linearly interpolated from the table at every
+        temperature (constant beyond the first and last row). Otherwise the current
+        values of the instance attributes are used for every temperature.
+
+        : param `temperatures`: Temperatures where the elastic constants are evaluated
+            or None for the current values
+        : type: np.ndarray | None
+        : return: Five float arrays of elastic constants with the same shape as
+            `temperatures` (zero-dimension arrays when None)
+        : rtype: tuple[np.ndarray, ...]
+        """
+        # Get the five independent elastic constants
+        if temperatures is not None and self.temperature_table:
+            (
+                axial_youngs_modulus,
+                transverse_youngs_modulus,
+                axial_shear_modulus,
+                transverse_shear_modulus,
+                major_poissons_ratio,
+            ) = _interpolate_temperature_rows(self.temperature_table, temperatures)
+        else:
+            shape = () if temperatures is None else np.shape(temperatures)
+            axial_youngs_modulus = np.full(shape, float(self.axial_youngs_modulus))
+            transverse_youngs_modulus = np.full(
+                shape, float(self.transverse_youngs_modulus)
+            )
+            axial_shear_modulus = np.full(shape, float(self.axial_shear_modulus))
+            transverse_shear_modulus = np.full(
+                shape, float(self.transverse_shear_modulus)
+            )
+            major_poissons_ratio = np.full(shape, float(self.major_poissons_ratio))
+
+        # Compute plane-strain bulk modulus with transverse-isotropic relation
+        pstrain_bulk_modulus = (
+            transverse_shear_modulus
+            * transverse_youngs_modulus
+            / (
+                4.0 * transverse_shear_modulus
+                - transverse_youngs_modulus
+                - 4.0
+                * major_poissons_ratio**2
+                * transverse_shear_modulus
+                * transverse_youngs_modulus
+                / axial_youngs_modulus
+            )
+        )
+        return (
+            axial_youngs_modulus,
+            major_poissons_ratio,
+            axial_shear_modulus,
+            transverse_shear_modulus,
+            pstrain_bulk_modulus,
+        )
+
+
+class VfIndex:
+    """An index of a grid of fiber volume fraction that maps any value, rounded off to
+    the decimal places of the grid, to its row position in constant time, i.e. by
+    arithmetic if the grid is uniform or by binary search with an exact match check
+    otherwise. It is the single validating lookup of fiber volume fraction of ```HT```
+    object, e.g. ``HT.E1eff``, ``display`` and ``compare``.
+
+    Example:
+        >>> index = VfIndex(HT._fiber_volfract)
+        >>> index.index(0.71154)
+        71
+        >>> index.indices([0.5, 0.555, 0.6])
+        array([50, 56, 60])
+        >>> VfIndex([0.3, 0.5, 0.55, 0.6]).window(0.5, 0.6)
+        (1, 3)
+        >>>
+    """
+
+    def __init__(self, grid: list | tuple | np.ndarray, decimals: int = 2) -> None:
+        """Constructor method
+
+        : param `grid`: strictly increasing fiber volume fractions
+        : type: list | tuple | np.ndarray
+        : param `decimals`: number of decimal places of grid. Default is 2
+        : type: int
+        : raise TypeError: If `grid` is not a sequence of numbers or `decimals` is not
+            an int
+        : raise ValueError: If `grid` is empty, not strictly increasing or has more
+            decimal places than `decimals`, or `decimals` is negative
+        """
+        # Check for TypeError
+        if grid is None or isinstance(grid, str):
+            raise TypeError("Expect grid of fiber volume fraction to be numbers")
+        try:
+            grid_array: np.ndarray = np.array(grid, dtype=float)
+        except (TypeError, ValueError):
+            raise TypeError("Expect grid of fiber volume fraction to be numbers")
+        if not isinstance(decimals, int) or isinstance(decimals, bool):
+            raise TypeError("Expect decimals to be an int object")
+
+        # Check for ValueError
+        if decimals < 0:
+            raise ValueError("Expect decimals to be zero or a positive int")
+        if grid_array.ndim != 1 or grid_array.size == 0:
+            raise ValueError("Expect grid of fiber volume fraction to be one dimension")
+        if not np.all(np.isfinite(grid_array)):
+            raise ValueError("Expect grid of fiber volume fraction to be finite")
+        self._decimals: int = decimals
+        self._scale: int = 10**decimals
+        self._units: np.ndarray = np.rint(grid_array * self._scale).astype(np.int64)
+        if np.any(np.abs(self._units / self._scale - grid_array) > 1e-9):
+            raise ValueError(
+                f"Expect grid of fiber volume fraction to have {decimals} decimal places"
+            )
+        steps: np.ndarray = np.diff(self._units)
+        if np.any(steps <= 0):
+            raise ValueError("Expect grid of fiber volume fraction to be increasing")
+
+        # Constant step in units of the last decimal place, or 0 for non-uniform grid
+        uniform: bool = bool(steps.size) and bool(np.all(steps == steps[0]))
+        self._step: int = int(steps[0]) if uniform else 0
+        grid_array.flags.writeable = False
+        self._grid: np.ndarray = grid_array
+
+    def __len__(self) -> int:
+        """Get number of fiber volume fractions in grid"""
+        return len(self._grid)
+
+    @property
+    def grid(self) -> np.ndarray:
+        """Get read-only grid of fiber volume fraction
+
+        : return: grid of fiber volume fraction
+        : rtype: np.ndarray
+        """
+        return self._grid
+
+    @property
+    def uniform(self) -> bool:
+        """Get True if grid has a constant step, i.e. positions are found by arithmetic
+
+        : return: True if grid is uniform
+        : rtype: bool
+        """
+        return self._step > 0 or len(self._grid) == 1
+
+    def index(self, value: int | float) -> int:
+        """Get the row position of a fiber volume fraction rounded off to the decimal
+        places of grid.
+
+        : param `value`: fiber volume fraction
+        : type: int | float
+        : raise TypeError: If `value` is not an int or float number
+        : raise ValueError: If `value` rounded off is not on grid
+        : return: row position in grid
+        : rtype: int
+        """
+        if not isinstance(value, int | float) or isinstance(value, bool):
+            raise TypeError(
+                "Expected fiber volume fraction value to be 'float' type number"
+            )
+
+        # Check for ValueError
+        try:
+            unit: int = round(round(value, self._decimals) * self._scale)
+        except (OverflowError, ValueError):
+            raise self._get_off_grid_error()
+        if self._step:
+            position, remainder = divmod(unit - int(self._units[0]), self._step)
+        else:
+            position, remainder = int(np.searchsorted(self._units, unit)), 0
+            if position < len(self._units) and self._units[position] != unit:
+                remainder = 1
+        if remainder or not 0 <= position < len(self._units):
+            raise self._get_off_grid_error()
+        return position
+
+    def indices(self, values: list | tuple | np.ndarray) -> np.ndarray:
+        """Get the row positions of many fiber volume fractions rounded off to the
+        decimal places of grid in one vectorized lookup.
+
+        : param `values`: fiber volume fractions
+        : type: list | tuple | np.ndarray
+        : raise TypeError: If `values` is None or not a sequence of numbers
+        : raise ValueError: If `values` is empty or any value rounded off is not on grid
+        : return: row positions in grid
+        : rtype: np.ndarray
+        """
+        units: np.ndarray = self._get_units(
+            _get_float_array(values, "fiber volume fractions")
+        )
+        size: int = len(self._units)
+        if self._step:
+            offsets: np.ndarray = units - self._units[0]
+            positions: np.ndarray = offsets // self._step
+            found: np.ndarray = (offsets % self._step == 0) & (positions >= 0)
+            found &= positions < size
+        else:
+            positions = np.searchsorted(self._units, units)
+            found = self._units[np.minimum(positions, size - 1)] == units
+        if not np.all(found):
+            raise self._get_off_grid_error()
+        return positions.astype(np.intp)
+
+    def window(
+        self, min: int | float | None = None, max: int | float | None = None
+    ) -> tuple[int, int]:
+        """Validate a window of fiber volume fraction, i.e. full range if both `min`
+        and `max` are None, specific value if `max` is None or a range otherwise, and
+        get its inclusive row positions.
+
+        : param `min`: specific value or start of range of fiber volume fraction
+        : type: int | float | None
+        : param `max`: inclusive end of range of fiber volume fraction or None
+        : type: int | float | None
+        : raise TypeError: If `min` or `max` is not a number
+        : raise ValueError: If `min` is None while `max` is not None, `min` or `max` is
+            not on grid or `min` is greater than `max`
+        : return: start and end row positions of window
+        : rtype: tuple[int, int]
+        """
+        if min is None and max is not None:
+            raise ValueError("Expect min of fiber volume fraction when max is defined")
+        if min is None:
+            return 0, len(self._grid) - 1
+        start: int = self.index(min)
+        end: int = start if max is None else self.index(max)
+        if start > end:
+            raise ValueError(
+                "Expected start of fiber volume fraction range to be smaller than end"
+            )
+        return start, end
+
+    def _get_off_grid_error(self) -> ValueError:
+        """Get the error of a fiber volume fraction that is not on grid
+
+        : return: error to be raised
+        : rtype: ValueError
+        """
+        return ValueError(
+            f"Expected fiber volume fraction to be from {self._grid[0]:g} to "
+            + f"{self._grid[-1]:g} on the grid of {self._decimals} decimal places"
+        )
+
+    def _get_units(self, values: np.ndarray) -> np.ndarray:
+        """Round off fiber volume fractions to the decimal places of grid as ``round``
+        does and express them in units of the last decimal place.
+
+        : param `values`: fiber volume fractions
+        : type: np.ndarray
+        : return: rounded values in units of the last decimal place
+        : rtype: np.ndarray
+        """
+        # Values far off grid are clipped so that scaling cannot overflow
+        scaled: np.ndarray = np.clip(values, -1e9, 1e9) * self._scale
+        units: np.ndarray = np.rint(scaled)
+
+        # Near a tie, scaling may round the binary value differently than ``round``
+        ties: np.ndarray = np.flatnonzero(
+            np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6
+        )
+        for i in ties.tolist():
+            units[i] = round(round(float(values[i]), self._decimals) * self._scale)
+        return units.astype(np.int64)
+
 
 class HT:
     """
@@ -2066,6 +2528,14 @@ class HT:
         Effective in-plane transverse Young's moduli estimated by transversely-isotropic
         formual
 
+    `table`: np.ndarray
+        Read-only float table of fiber volume fraction and all effective elastic
+        properties, cached until the elastic constants of fiber or matrix change
+
+    `Vf_array`, `E1_array`, `E2_array`, `G12_array`, `v12_array`, `G23_array`,
+    `K23_array`: np.ndarray
+        Read-only zero-copy rows of `table`
+
     ...
 
     Instance method
@@ -2149,6 +2619,39 @@ class HT:
         modulus of ```HT``` object based on the respective value or range of values of
         fiber volume fraction defined by user
 
+    ``__array__``:
+        Support ``numpy.asarray`` of ```HT``` object as a zero-copy view of `table`
+
+    ``query``:
+        Return effective elastic properties at an arbitrary set of fiber volume
+        fractions as column arrays in one vectorized lookup
+
+    ``iter_rows``:
+        Yield rows of fiber volume fraction and effective elastic properties lazily,
+        the shared source of the tables of ``display``, ``save`` and ``doc``
+
+    ``table_range``:
+        Return a zero-copy view of `table` on a range of fiber volume fraction
+
+    ``temperature_sweep``:
+        Return all effective elastic properties of ```HT``` object on a grid of
+        temperatures versus fiber volume fraction computed in one vectorized pass from
+        the `temperature_table` of fiber and matrix
+
+    ``void_sweep``:
+        Return all effective elastic properties of ```HT``` object on a grid of void
+        contents versus fiber volume fraction computed in one vectorized pass from the
+        matrix degraded by every void content
+
+    ``_iter_index_rows``:
+        Yield rows of effective elastic properties between two index numbers
+
+    ``_get_property_keys``:
+        ``@staticmethod``: Validate requested effective elastic properties
+
+    ``_get_table``:
+        Return the cached read-only float table of all effective elastic properties
+
     ``_estimate_E1eff``:
         Estimate the effective axial Young's modulus of composite using Halpin-Tsai
         micromechanics method based on the elastic properties of fiber and matrix and
@@ -2184,6 +2687,14 @@ class HT:
         value/s in the tuple of `fiber_volfract` instance attribute as requested by the
         user for the purpose of finding the respective values in the tuples of of
         specific effective elastic property of '''HT''' object requested by user
+
+    ``_get_vf_index``:
+        ``@staticmethod``: Returns the index number of a fiber volume fraction value in
+        `fiber_volfract` by arithmetic of ```VfIndex``` instead of linear search
+
+    ``_get_vf_indices``:
+        ``@staticmethod``: Returns the index numbers of many fiber volume fraction
+        values in `fiber_volfract` in one bulk lookup
     """
 
     # Class attribute for micromechanics method
@@ -2196,6 +2707,44 @@ class HT:
     _fiber_volfract: tuple = tuple(l)
     del l
 
+    # Class attribute for fiber volume fraction as float array for vectorized analysis
+    _fiber_volfract_array: np.ndarray = np.array(_fiber_volfract, dtype=float)
+
+    # Class attribute for index of fiber volume fraction (rounded off to two decimal
+    # places) to its index number in `fiber_volfract`
+    _vf_index: VfIndex = VfIndex(_fiber_volfract)
+
+    # Class attribute for row number of every column of `table`
+    _table_rows: dict = {
+        "Vf": 0,
+        "E1eff": 1,
+        "E2eff": 2,
+        "G12eff": 3,
+        "v12eff": 4,
+        "G23eff": 5,
+        "K23eff": 6,
+    }
+
+    # Class attribute for header and getter of every effective property in rows
+    _row_headers: dict = {
+        "E1eff": ("E1*\n(GPa)", "eff_axial_youngs_moduli"),
+        "E2eff": ("E2*\n(GPa)", "eff_transverse_youngs_moduli"),
+        "G12eff": ("G12*\n(GPa)", "eff_axial_shear_moduli"),
+        "v12eff": ("v12*", "eff_major_poissons_ratios"),
+        "G23eff": ("G23*\n(GPa)", "eff_transverse_shear_moduli"),
+        "K23eff": ("K23*\n(GPa)", "eff_pstrain_bulk_moduli"),
+    }
+
+    # Elastic moduli of fiber and matrix that influence every effective elastic property
+    _constituent_moduli: dict = {
+        "E1eff": ("axial_youngs_modulus",),
+        "E2eff": ("transverse_youngs_modulus",),
+        "G12eff": ("axial_shear_modulus",),
+        "v12eff": ("major_poissons_ratio",),
+        "G23eff": ("transverse_shear_modulus", "pstrain_bulk_modulus"),
+        "K23eff": ("transverse_shear_modulus", "pstrain_bulk_modulus"),
+    }
+
     def __init__(
         self, fiber: Isotropic | Transtropic, matrix: Isotropic | Transtropic
     ) -> None:
@@ -2250,6 +2799,8 @@ class HT:
         self._eff_pstrain_bulk_moduli: tuple = HT._estimate_K23eff(self)
         self._eff_transverse_shear_moduli: tuple = HT._estimate_G23eff(self)
         self._eff_transverse_youngs_moduli: tuple = HT._estimate_E2eff(self)
+        self._table_cache: tuple = ()
+        self._aggregate_cache: tuple = ()
 
     def __str__(self) -> str:
         """
@@ -2729,6 +3280,306 @@ class HT:
         """
         return HT._estimate_E2eff(self)
 
+    @property
+    def table(self) -> np.ndarray:
+        """Get read-only float table of fiber volume fraction and all effective elastic
+        properties, where the rows are 'Vf', 'E1eff', 'E2eff', 'G12eff', 'v12eff',
+        'G23eff' and 'K23eff' and the columns follow `fiber_volfract`. The table is
+        built once from the Decimal values and is rebuilt only when the elastic
+        constants of fiber or matrix change, so every array getter below is a
+        zero-copy view of it.
+
+        : return: read-only table of shape (7, 101)
+        : rtype: np.ndarray
+
+        Example:
+            >>> obj.table.shape
+            (7, 101)
+            >>> np.shares_memory(obj.table, obj.E2_array)
+            True
+            >>>
+        """
+        return self._get_table()
+
+    @property
+    def aggregate_index(self) -> "AggregateIndex":
+        """Get aggregate index of prefix sums and sparse tables of `table` for range
+        aggregate queries in constant time, e.g. the mean of G12eff over a process
+        window of fiber volume fraction. It is built once and rebuilt only when
+        `table` is rebuilt.
+
+        : return: aggregate index of UD composite
+        : rtype: ```AggregateIndex```
+
+        Example:
+            >>> obj.aggregate_index.aggregate(0.55, 0.65, "G12eff", "min")
+            3.178
+            >>>
+        """
+        table: np.ndarray = self._get_table()
+        if not self._aggregate_cache or self._aggregate_cache[0] is not table:
+            self._aggregate_cache = (table, AggregateIndex(table))
+        return self._aggregate_cache[1]
+
+    @property
+    def Vf_array(self) -> np.ndarray:
+        """Get read-only zero-copy float array of `fiber_volfract`
+
+        : return: fiber volume fractions
+        : rtype: np.ndarray
+        """
+        return self._get_table()[0]
+
+    @property
+    def E1_array(self) -> np.ndarray:
+        """Get read-only zero-copy float array of `eff_axial_youngs_moduli`
+
+        : return: effective axial Young's moduli
+        : rtype: np.ndarray
+
+        Example:
+            >>> np.asarray(obj.E1_array)[60]
+            151.12
+            >>>
+        """
+        return self._get_table()[1]
+
+    @property
+    def E2_array(self) -> np.ndarray:
+        """Get read-only zero-copy float array of `eff_transverse_youngs_moduli`
+
+        : return: effective transverse Young's moduli
+        : rtype: np.ndarray
+        """
+        return self._get_table()[2]
+
+    @property
+    def G12_array(self) -> np.ndarray:
+        """Get read-only zero-copy float array of `eff_axial_shear_moduli`
+
+        : return: effective axial shear moduli
+        : rtype: np.ndarray
+        """
+        return self._get_table()[3]
+
+    @property
+    def v12_array(self) -> np.ndarray:
+        """Get read-only zero-copy float array of `eff_major_poissons_ratios`
+
+        : return: effective major Poisson's ratios
+        : rtype: np.ndarray
+        """
+        return self._get_table()[4]
+
+    @property
+    def G23_array(self) -> np.ndarray:
+        """Get read-only zero-copy float array of `eff_transverse_shear_moduli`
+
+        : return: effective transverse shear moduli
+        : rtype: np.ndarray
+        """
+        return self._get_table()[5]
+
+    @property
+    def K23_array(self) -> np.ndarray:
+        """Get read-only zero-copy float array of `eff_pstrain_bulk_moduli`
+
+        : return: effective plane-strain bulk moduli
+        : rtype: np.ndarray
+        """
+        return self._get_table()[6]
+
+    def __array__(self, dtype=None, copy: bool | None = None) -> np.ndarray:
+        """Support ``numpy.asarray(obj)`` as a zero-copy view of `table`, where a copy
+        is only made when requested or when another `dtype` is requested.
+
+        : param `dtype`: requested data type or None for float
+        : param `copy`: True to always copy, or None or False for a view
+        : type: bool | None
+        : return: table of fiber volume fraction and all effective elastic properties
+        : rtype: np.ndarray
+        """
+        table: np.ndarray = self._get_table()
+        if dtype is not None and np.dtype(dtype) != table.dtype:
+            return table.astype(dtype)
+        if copy:
+            return table.copy()
+        return table
+
+    def query(
+        self,
+        vf_values: list | tuple | np.ndarray,
+        properties: str | list | tuple | None = None,
+    ) -> dict:
+        """Get effective elastic properties of UD composite at an arbitrary set of
+        fiber volume fractions, e.g. measured batches, in one vectorized lookup of
+        `table`, where every value is rounded off to two decimal places as in
+        ``E1eff`` and its siblings.
+
+        : param `vf_values`: fiber volume fractions from 0 to 1 in any order
+        : type: list | tuple | np.ndarray
+        : param `properties`: one or several of 'E1eff', 'E2eff', 'G12eff', 'v12eff',
+            'G23eff' and 'K23eff', or None for all of them
+        : type: str | list | tuple | None
+        : raise TypeError: If `vf_values` is not a sequence of numbers or `properties`
+            is neither None, str, list nor tuple
+        : raise ValueError: If any fiber volume fraction is not from 0 to 1 or any
+            property is unknown
+        : return: Rounded fiber volume fractions as 'Vf' and every requested property
+            as a float array in the order of `vf_values`
+        : rtype: dict
+
+        Example:
+            >>> result = obj.query([0.573, 0.6, 0.55], ["E1eff", "E2eff"])
+            >>> result["Vf"]
+            array([0.57, 0.6 , 0.55])
+            >>> result["E2eff"]
+            array([7.191, 7.621, 6.926])
+            >>>
+        """
+        # Check for TypeError and ValueError
+        keys: tuple = HT._get_property_keys(properties)
+        idx: np.ndarray = HT._get_vf_indices(vf_values)
+
+        # Gather requested rows and columns of table in one operation
+        rows: list = [HT._table_rows[key] for key in ("Vf",) + keys]
+        columns: np.ndarray = self._get_table()[np.ix_(rows, idx)]
+        return {key: column for key, column in zip(("Vf",) + keys, columns)}
+
+    def analytics(self, properties: str | list | tuple | None = None) -> dict:
+        """Get the slope and curvature of effective elastic properties versus fiber
+        volume fraction, i.e. dP/dVf and d²P/dVf², as float columns alongside the
+        properties themselves, and the knee of every curve, i.e. the fiber volume
+        fraction farthest from the straight line between both ends of the normalized
+        curve, where added fiber changes from paying off little to paying off much or
+        vice versa. The derivatives are second-order finite differences of the
+        unrounded Halpin-Tsai formulae on the grid of fiber volume fraction.
+
+        : param `properties`: one or several of 'E1eff', 'E2eff', 'G12eff', 'v12eff',
+            'G23eff' and 'K23eff', or None for all of them
+        : type: str | list | tuple | None
+        : raise TypeError: If `properties` is neither None, str, list nor tuple
+        : raise ValueError: If any property is unknown
+        : return: 'Vf' and, for every property, e.g. 'G23eff', its values as 'G23eff',
+            slope as 'dG23eff' and curvature as 'd2G23eff', all as float arrays, and
+            'knee' of fiber volume fraction of every property or None when the curve
+            is a straight line
+        : rtype: dict
+
+        Example:
+            >>> result = obj.analytics("G23eff")
+            >>> result["dG23eff"][[0, 50, 100]]
+            array([ 1.41021673,  4.2076086 , 56.17726795])
+            >>> result["knee"]
+            {'G23eff': 0.72}
+            >>>
+        """
+        # Check for TypeError and ValueError
+        keys: tuple = HT._get_property_keys(properties)
+
+        # Unrounded properties on grid of fiber volume fraction
+        vf: np.ndarray = HT._fiber_volfract_array
+        values: dict = _halpin_tsai(
+            self.fiber._get_elastic_constants(),
+            self.matrix._get_elastic_constants(),
+            vf,
+        )
+
+        # Slope, curvature and knee of every property
+        result: dict = {"Vf": vf, "knee": {}}
+        line: np.ndarray = (vf - vf[0]) / (vf[-1] - vf[0])
+        for key in keys:
+            slope: np.ndarray = np.gradient(values[key], vf, edge_order=2)
+            result[key] = values[key]
+            result[f"d{key}"] = slope
+            result[f"d2{key}"] = np.gradient(slope, vf, edge_order=2)
+            span: float = values[key][-1] - values[key][0]
+            distance: np.ndarray = (
+                np.abs((values[key] - values[key][0]) / span - line)
+                if span
+                else np.zeros_like(vf)
+            )
+            result["knee"][key] = (
+                float(vf[np.argmax(distance)]) if distance.max() > 1e-3 else None
+            )
+        return result
+
+    def iter_rows(
+        self,
+        vf_min: float | None = None,
+        vf_max: float | None = None,
+        properties: str | list | tuple | None = None,
+    ) -> Iterator[dict]:
+        """Yield rows of fiber volume fraction and effective elastic properties of UD
+        composite lazily, one dict per fiber volume fraction keyed by the same headers
+        as ``display`` and ``save``, e.g. "Vf" and "E1*\\n(GPa)". Every requested
+        property is computed once per call and no list of rows is built, so this
+        generator is the shared source of the tables of ``display``, ``save`` and, via
+        the csv files of ``save``, ``doc``.
+
+        : param `vf_min`: start of fiber volume fraction range from 0 to 1 or None for
+            0. It is rounded off to two decimal places
+        : type: float | None
+        : param `vf_max`: inclusive end of fiber volume fraction range from 0 to 1 or
+            None for 1. It is rounded off to two decimal places
+        : type: float | None
+        : param `properties`: one or several of 'E1eff', 'E2eff', 'G12eff', 'v12eff',
+            'G23eff' and 'K23eff', or None for all of them
+        : type: str | list | tuple | None
+        : raise TypeError: If `vf_min` or `vf_max` is not a number, or `properties` is
+            neither None, str, list nor tuple
+        : raise ValueError: If `vf_min` or `vf_max` is not from 0 to 1, `vf_min` is
+            greater than `vf_max`, or any property is unknown
+        : return: generator of rows
+        : rtype: Iterator[dict]
+
+        Example:
+            >>> for row in obj.iter_rows(0.5, 0.52, "E1eff"):
+            ...     print(row)
+            ...
+            {'Vf': Decimal('0.5'), 'E1*\\n(GPa)': Decimal('126.400')}
+            {'Vf': Decimal('0.51'), 'E1*\\n(GPa)': Decimal('128.872')}
+            {'Vf': Decimal('0.52'), 'E1*\\n(GPa)': Decimal('131.344')}
+            >>>
+        """
+        # Check for TypeError and ValueError before the first row is requested
+        keys: tuple = HT._get_property_keys(properties)
+        start: int = 0 if vf_min is None else HT._get_vf_index(vf_min)
+        end: int = 100 if vf_max is None else HT._get_vf_index(vf_max)
+        if start > end:
+            raise ValueError(
+                "Expected start of fiber volume fraction range to be smaller than end"
+            )
+        return self._iter_index_rows(start, end, keys)
+
+    def table_range(self, vf_min: float, vf_max: float) -> np.ndarray:
+        """Get a zero-copy view of `table` on a range of fiber volume fraction, where
+        both ends are rounded off to two decimal places and are inclusive.
+
+        : param `vf_min`: start of fiber volume fraction range from 0 to 1
+        : type: float
+        : param `vf_max`: end of fiber volume fraction range from 0 to 1
+        : type: float
+        : raise TypeError: If `vf_min` or `vf_max` is not a number
+        : raise ValueError: If `vf_min` or `vf_max` is not from 0 to 1, or `vf_min`
+            is greater than `vf_max`
+        : return: read-only view of `table` of shape (7, number of Vf in range)
+        : rtype: np.ndarray
+
+        Example:
+            >>> obj.table_range(0.5, 0.6)[2]  # E2eff from Vf = 0.5 to 0.6
+            array([6.328, 6.441, 6.558, 6.676, 6.8  , 6.926, 7.055, 7.191, 7.331,
+                   7.474, 7.621])
+            >>>
+        """
+        start: int = HT._get_vf_index(vf_min)
+        end: int = HT._get_vf_index(vf_max)
+        if start > end:
+            raise ValueError(
+                "Expected start of fiber volume fraction range to be smaller than end"
+            )
+        return self._get_table()[:, start : end + 1]
+
     def E1eff(self, min: float | None = None, max: float | None = None) -> None:
         """Print value or values of effective axial Young's modulus of UD composite
         based on the user defined fiber volume fraction for quick in-situ analysis.
@@ -2765,14 +3616,15 @@ class HT:
             >>>
         """
         bounds: tuple = HT.__get_index_num(min, max)
-        print("Vf : E1*")
+        values: tuple = self.eff_axial_youngs_moduli
+        _emit("Vf : E1*")
         if bounds[1] is not None:
             for i in range(bounds[0], bounds[1] + 1):
-                print(f"{self.fiber_volfract[i]} : {self.eff_axial_youngs_moduli[i]}")
+                _emit(f"{self.fiber_volfract[i]} : {_present(values[i])}")
         else:
-            print(
+            _emit(
                 f"{self.fiber_volfract[bounds[0]]} : "
-                + f"{self.eff_axial_youngs_moduli[bounds[0]]}"
+                + f"{_present(values[bounds[0]])}"
             )
 
     def E2eff(self, min: float | None = None, max: float | None = None) -> None:
@@ -2812,16 +3664,15 @@ class HT:
             >>>
         """
         bounds: tuple = HT.__get_index_num(min, max)
-        print("Vf : E2*")
+        values: tuple = self.eff_transverse_youngs_moduli
+        _emit("Vf : E2*")
         if bounds[1] is not None:
             for i in range(bounds[0], bounds[1] + 1):
-                print(
-                    f"{self.fiber_volfract[i]} : {self.eff_transverse_youngs_moduli[i]}"
-                )
+                _emit(f"{self.fiber_volfract[i]} : {_present(values[i])}")
         else:
-            print(
+            _emit(
                 f"{self.fiber_volfract[bounds[0]]} : "
-                + f"{self.eff_transverse_youngs_moduli[bounds[0]]}"
+                + f"{_present(values[bounds[0]])}"
             )
 
     def G12eff(self, min: float | None = None, max: float | None = None) -> None:
@@ -2860,14 +3711,15 @@ class HT:
             >>>
         """
         bounds: tuple = HT.__get_index_num(min, max)
-        print("Vf : G12*")
+        values: tuple = self.eff_axial_shear_moduli
+        _emit("Vf : G12*")
         if bounds[1] is not None:
             for i in range(bounds[0], bounds[1] + 1):
-                print(f"{self.fiber_volfract[i]} : {self.eff_axial_shear_moduli[i]}")
+                _emit(f"{self.fiber_volfract[i]} : {_present(values[i])}")
         else:
-            print(
+            _emit(
                 f"{self.fiber_volfract[bounds[0]]} : "
-                + f"{self.eff_axial_shear_moduli[bounds[0]]}"
+                + f"{_present(values[bounds[0]])}"
             )
 
     def G23eff(self, min: float | None = None, max: float | None = None) -> None:
@@ -2906,16 +3758,15 @@ class HT:
             >>>
         """
         bounds: tuple = HT.__get_index_num(min, max)
-        print("Vf : G23*")
+        values: tuple = self.eff_transverse_shear_moduli
+        _emit("Vf : G23*")
         if bounds[1] is not None:
             for i in range(bounds[0], bounds[1] + 1):
-                print(
-                    f"{self.fiber_volfract[i]} : {self.eff_transverse_shear_moduli[i]}"
-                )
+                _emit(f"{self.fiber_volfract[i]} : {_present(values[i])}")
         else:
-            print(
+            _emit(
                 f"{self.fiber_volfract[bounds[0]]} : "
-                + f"{self.eff_transverse_shear_moduli[bounds[0]]}"
+                + f"{_present(values[bounds[0]])}"
             )
 
     def v12eff(self, min: float | None = None, max: float | None = None) -> None:
@@ -2954,14 +3805,15 @@ class HT:
             >>>
         """
         bounds: tuple = HT.__get_index_num(min, max)
-        print("Vf : v12*")
+        values: tuple = self.eff_major_poissons_ratios
+        _emit("Vf : v12*")
         if bounds[1] is not None:
             for i in range(bounds[0], bounds[1] + 1):
-                print(f"{self.fiber_volfract[i]} : {self.eff_major_poissons_ratios[i]}")
+                _emit(f"{self.fiber_volfract[i]} : {_present(values[i], '1.0000')}")
         else:
-            print(
+            _emit(
                 f"{self.fiber_volfract[bounds[0]]} : "
-                + f"{self.eff_major_poissons_ratios[bounds[0]]}"
+                + f"{_present(values[bounds[0]], '1.0000')}"
             )
 
     def K23eff(self, min: float | None = None, max: float | None = None) -> None:
@@ -3000,15 +3852,211 @@ class HT:
             >>>
         """
         bounds: tuple = HT.__get_index_num(min, max)
-        print("Vf : K23*")
+        values: tuple = self.eff_pstrain_bulk_moduli
+        _emit("Vf : K23*")
         if bounds[1] is not None:
             for i in range(bounds[0], bounds[1] + 1):
-                print(f"{self.fiber_volfract[i]} : {self.eff_pstrain_bulk_moduli[i]}")
+                _emit(f"{self.fiber_volfract[i]} : {_present(values[i])}")
         else:
-            print(
+            _emit(
                 f"{self.fiber_volfract[bounds[0]]} : "
-                + f"{self.eff_pstrain_bulk_moduli[bounds[0]]}"
+                + f"{_present(values[bounds[0]])}"
+            )
+
+    def temperature_sweep(self, temperatures: list | tuple | np.ndarray) -> dict:
+        """Compute all effective elastic properties of UD composite on a grid of
+        temperatures versus the full range of fiber volume fraction in one vectorized
+        pass, where the elastic constants of fiber and matrix at every temperature are
+        interpolated from their `temperature_table`. A constituent without
+        `temperature_table` keeps its current elastic constants at every temperature.
+
+        Note: the values are computed in float precision and are not quantized.
+
+        : param `temperatures`: Temperatures where effective properties are computed
+        : type: list | tuple | np.ndarray
+        : raise TypeError: If `temperatures` is None or not a sequence of numbers
+        : raise ValueError: If `temperatures` is empty or contains non-finite values
+        : return: Temperatures as 'T', fiber volume fractions as 'Vf' and every
+            effective elastic property, e.g. 'E1eff', as an array of shape
+            (number of temperatures, number of fiber volume fractions)
+        : rtype: dict
+
+        Example:
+            >>> epoxy = Isotropic("Epoxy", 2.8, 0.3, {23: (2.8, 0.3), 120: (1.9, 0.33)})
+            >>> composite = HT(carbon, epoxy)
+            >>> sweep = composite.temperature_sweep([23, 70, 120])
+            >>> sweep["E2eff"].shape
+            (3, 101)
+            >>> round(sweep["G12eff"][2, 60], 3)
+            2.522
+            >>>
+        """
+        # Check for TypeError and ValueError
+        temperature_array: np.ndarray = _get_float_array(temperatures, "temperatures")
+
+        # Get elastic constants of constituents as column vectors of temperatures
+        fiber_constants: list = [
+            constant[:, np.newaxis]
+            for constant in self.fiber._get_elastic_constants(temperature_array)
+        ]
+        matrix_constants: list = [
+            constant[:, np.newaxis]
+            for constant in self.matrix._get_elastic_constants(temperature_array)
+        ]
+
+        # Compute and return effective properties on temperature versus Vf grid
+        eff_properties: dict = _halpin_tsai(
+            fiber_constants, matrix_constants, HT._fiber_volfract_array
+        )
+        return {
+            "T": temperature_array,
+            "Vf": HT._fiber_volfract_array,
+            **eff_properties,
+        }
+
+    def void_sweep(self, void_contents: list | tuple | np.ndarray) -> dict:
+        """Compute all effective elastic properties of UD composite on a grid of void
+        contents versus the full range of fiber volume fraction in one vectorized pass.
+        At every void content, Vv, the matrix is degraded to a porous matrix by treating
+        the voids as inclusions of zero stiffness with the same Halpin-Tsai formulae,
+        while the Poisson's ratio of matrix is kept unchanged.
+
+        Note: the values are computed in float precision and are not quantized.
+
+        : param `void_contents`: Void contents, 0 <= Vv < 1, e.g. 0.005 to 0.05
+        : type: list | tuple | np.ndarray
+        : raise TypeError: If `void_contents` is None or not a sequence of numbers
+        : raise ValueError: If `void_contents` is empty or any value is not within
+            0 <= Vv < 1
+        : return: Void contents as 'Vv', fiber volume fractions as 'Vf' and every
+            effective elastic property, e.g. 'E1eff', as an array of shape
+            (number of void contents, number of fiber volume fractions)
+        : rtype: dict
+
+        Example:
+            >>> composite = HT(carbon, epoxy)
+            >>> sweep = composite.void_sweep([0, 0.02, 0.05])
+            >>> sweep["G12eff"].shape
+            (3, 101)
+            >>> round(sweep["E2eff"][2, 60], 3)
+            6.796
+            >>>
+        """
+        # Check for TypeError and ValueError
+        void_array: np.ndarray = _get_float_array(void_contents, "void contents")
+        if np.any(void_array < 0) or np.any(void_array >= 1):
+            raise ValueError("Expected void contents to be within 0 <= Vv < 1")
+
+        # Get elastic constants of porous matrix as column vectors of void contents
+        matrix_constants: list = [
+            constant[:, np.newaxis]
+            for constant in _get_porous_matrix_constants(
+                self.matrix._get_elastic_constants(), void_array
+            )
+        ]
+
+        # Compute and return effective properties on void content versus Vf grid
+        eff_properties: dict = _halpin_tsai(
+            self.fiber._get_elastic_constants(),
+            matrix_constants,
+            HT._fiber_volfract_array,
+        )
+        return {"Vv": void_array, "Vf": HT._fiber_volfract_array, **eff_properties}
+
+    def _iter_index_rows(self, start: int, end: int, keys: tuple) -> Iterator[dict]:
+        """Yield rows of fiber volume fraction and effective elastic properties of UD
+        composite from index number `start` to `end` inclusive.
+
+        Note: A helper generator to ``iter_rows`` and the table helpers of ``display``
+        and ``save``.
+
+        : param `start`: index number of first row in `fiber_volfract`
+        : type: int
+        : param `end`: index number of last row in `fiber_volfract`
+        : type: int
+        : param `keys`: effective elastic properties of every row, e.g. 'E1eff'
+        : type: tuple[str, ...]
+        : return: generator of rows
+        : rtype: Iterator[dict]
+        """
+        headers: list = ["Vf"] + [HT._row_headers[key][0] for key in keys]
+        columns: list = [self.fiber_volfract] + [
+            getattr(self, HT._row_headers[key][1]) for key in keys
+        ]
+        for values in zip(*(column[start : end + 1] for column in columns)):
+            yield dict(zip(headers, values))
+
+    @staticmethod
+    def _get_property_keys(properties: str | list | tuple | None = None) -> tuple:
+        """Validate requested effective elastic properties.
+
+        Note: A helper function to ``query`` and ``iter_rows``.
+
+        : param `properties`: one or several of 'E1eff', 'E2eff', 'G12eff', 'v12eff',
+            'G23eff' and 'K23eff', or None for all of them
+        : type: str | list | tuple | None
+        : raise TypeError: If `properties` is neither None, str, list nor tuple
+        : raise ValueError: If any property is unknown
+        : return: requested properties
+        : rtype: tuple[str, ...]
+        """
+        if properties is None:
+            return tuple(HT._row_headers)
+        if isinstance(properties, str):
+            keys: tuple = (properties,)
+        elif isinstance(properties, list | tuple):
+            keys = tuple(properties)
+        else:
+            raise TypeError("Expect properties to be None, a str, list or tuple object")
+        for key in keys:
+            if key not in HT._row_headers:
+                raise ValueError(
+                    "Expect properties to be 'E1eff', 'E2eff', 'G12eff', 'v12eff', "
+                    + "'G23eff' or 'K23eff'"
+                )
+        return keys
+
+    def _get_signature(self) -> tuple:
+        """Return the content signature of UD composite, i.e. the types and elastic
+        constants of fiber and matrix and the quantization mode, which identifies its
+        effective elastic properties.
+
+        : return: hashable content signature
+        : rtype: tuple
+        """
+        return (
+            type(self.fiber),
+            tuple(self.fiber._get_info().values()),
+            type(self.matrix),
+            tuple(self.matrix._get_info().values()),
+            _deferred_quantization,
+        )
+
+    def _get_table(self) -> np.ndarray:
+        """Return the read-only float table of fiber volume fraction and all effective
+        elastic properties, which is cached against the elastic constants of fiber and
+        matrix and the quantization mode, and rebuilt when any of them changes.
+
+        : return: read-only table of shape (7, 101)
+        : rtype: np.ndarray
+        """
+        signature: tuple = self._get_signature()
+        if not self._table_cache or self._table_cache[0] != signature:
+            table: np.ndarray = np.array(
+                (
+                    self.fiber_volfract,
+                    self.eff_axial_youngs_moduli,
+                    self.eff_transverse_youngs_moduli,
+                    self.eff_axial_shear_moduli,
+                    self.eff_major_poissons_ratios,
+                    self.eff_transverse_shear_moduli,
+                    self.eff_pstrain_bulk_moduli,
+                ),
+                dtype=float,
             )
+            table.flags.writeable = False
+            self._table_cache = (signature, table)
+        return self._table_cache[1]
 
     def _estimate_E1eff(self) -> tuple[Decimal, ...]:
         """Compute the effective axial Young's moduli of UD composite using
@@ -3040,10 +4088,10 @@ class HT:
         effective_axial_youngs_moduli: list[Decimal] = []
         for vf in HT._fiber_volfract:
             effective_axial_youngs_moduli.append(
-                (
+                _quantize(
                     fiber_axial_youngs_modulus * vf
                     + matrix_axial_youngs_modulus * (Decimal("1") - vf)
-                ).quantize(Decimal("1.000"))
+                )
             )
 
         # Return effective property
@@ -3078,10 +4126,11 @@ class HT:
         effective_major_poissons_ratios: list[Decimal] = []
         for vf in HT._fiber_volfract:
             effective_major_poissons_ratios.append(
-                (
+                _quantize(
                     fiber_major_poissons_ratio * vf
-                    + matrix_major_poissons_ratio * (Decimal("1.0000") - vf)
-                ).quantize(Decimal("1.0000"))
+                    + matrix_major_poissons_ratio * (Decimal("1.0000") - vf),
+                    "1.0000",
+                )
             )
 
         # Return effective property
@@ -3116,7 +4165,7 @@ class HT:
         effective_axial_shear_moduli: list[Decimal] = []
         for vf in HT._fiber_volfract:
             effective_axial_shear_moduli.append(
-                (
+                _quantize(
                     (
                         (fiber_axial_shear_modulus + matrix_axial_shear_modulus)
                         * matrix_axial_shear_modulus
@@ -3131,7 +4180,7 @@ class HT:
                         * (Decimal("1.000") - vf)
                         + Decimal("2.000") * matrix_axial_shear_modulus * vf
                     )
-                ).quantize(Decimal("1.000"))
+                )
             )
 
         # Return effective property
@@ -3151,216 +4200,2353 @@ class HT:
             micromechanics method
         : rtype: tuple[Decimal, ...]
         """
-        # Get fiber plane-strain bulk modulus and transverse shear modulus
-        if isinstance(self.fiber, Isotropic):
-            fiber_pstrain_bulk_modulus: Decimal = self.fiber.pstrain_bulk_modulus
-        else:
-            fiber_pstrain_bulk_modulus = self.fiber.pstrain_bulk_modulus
-        # Get matrix plane-strain bulk modulus and transverse shear modulus
-        if isinstance(self.matrix, Isotropic):
-            matrix_pstrain_bulk_modulus: Decimal = self.matrix.pstrain_bulk_modulus
-            matrix_transverse_shear_modulus: Decimal = self.matrix.shear_modulus
-        else:
-            matrix_pstrain_bulk_modulus = self.matrix.pstrain_bulk_modulus
-            matrix_transverse_shear_modulus = self.matrix.transverse_shear_modulus
+        # Get fiber plane-strain bulk modulus and transverse shear modulus
+        if isinstance(self.fiber, Isotropic):
+            fiber_pstrain_bulk_modulus: Decimal = self.fiber.pstrain_bulk_modulus
+        else:
+            fiber_pstrain_bulk_modulus = self.fiber.pstrain_bulk_modulus
+        # Get matrix plane-strain bulk modulus and transverse shear modulus
+        if isinstance(self.matrix, Isotropic):
+            matrix_pstrain_bulk_modulus: Decimal = self.matrix.pstrain_bulk_modulus
+            matrix_transverse_shear_modulus: Decimal = self.matrix.shear_modulus
+        else:
+            matrix_pstrain_bulk_modulus = self.matrix.pstrain_bulk_modulus
+            matrix_transverse_shear_modulus = self.matrix.transverse_shear_modulus
+
+        # Compute effective property
+        effective_pstrain_bulk_moduli: list[Decimal] = []
+        for vf in HT._fiber_volfract:
+            effective_pstrain_bulk_moduli.append(
+                _quantize(
+                    (
+                        matrix_pstrain_bulk_modulus
+                        * (fiber_pstrain_bulk_modulus + matrix_transverse_shear_modulus)
+                        * (Decimal("1.000") - vf)
+                        + fiber_pstrain_bulk_modulus
+                        * (
+                            matrix_pstrain_bulk_modulus
+                            + matrix_transverse_shear_modulus
+                        )
+                        * vf
+                    )
+                    / (
+                        (fiber_pstrain_bulk_modulus + matrix_transverse_shear_modulus)
+                        * (Decimal("1.000") - vf)
+                        + (
+                            matrix_pstrain_bulk_modulus
+                            + matrix_transverse_shear_modulus
+                        )
+                        * vf
+                    )
+                )
+            )
+
+        # Return effective property
+        return tuple(effective_pstrain_bulk_moduli)
+
+    def _estimate_G23eff(self) -> tuple[Decimal, ...]:
+        """Compute the effective transverse shear moduli of UD composite using
+        Halpin-Tsai micromechanics formula that depends on the value of `shear_modulus`
+        and/or `transverse_shear_modulus` provided by instance attributes of `fiber` and
+        `matrix`, and also on the values of fiber volume fraction provided by the tuple
+        of `fiber_volfract`. The computed values are then initialized to a class
+        instance attribute - `eff_transverse_shear_moduli`.
+
+        : raise TypeError: if `fiber` and `matrix` is None or neither ```Isotropic```
+            nor ```Transtropic```
+        : return: The computed effective transverse shear moduli by Halpin-Tsai
+            micromechanics method
+        : rtype: tuple[Decimal, ...]
+            >>>
+        """
+        # Get fiber plane-strain bulk modulus and transverse shear modulus
+        if isinstance(self.fiber, Isotropic):
+            fiber_transverse_shear_modulus: Decimal = self.fiber.shear_modulus
+        else:
+            fiber_transverse_shear_modulus = self.fiber.transverse_shear_modulus
+        # Get matrix plane-strain bulk modulus and transverse shear modulus
+        if isinstance(self.matrix, Isotropic):
+            matrix_pstrain_bulk_modulus: Decimal = self.matrix.pstrain_bulk_modulus
+            matrix_transverse_shear_modulus: Decimal = self.matrix.shear_modulus
+        else:
+            matrix_pstrain_bulk_modulus = self.matrix.pstrain_bulk_modulus
+            matrix_transverse_shear_modulus = self.matrix.transverse_shear_modulus
+
+        # Compute effective property
+        effective_transverse_shear_moduli: list[Decimal] = []
+        for vf in HT._fiber_volfract:
+            effective_transverse_shear_moduli.append(
+                _quantize(
+                    (
+                        matrix_transverse_shear_modulus
+                        * (
+                            Decimal("2.000")
+                            * vf
+                            * fiber_transverse_shear_modulus
+                            * (
+                                matrix_pstrain_bulk_modulus
+                                + matrix_transverse_shear_modulus
+                            )
+                            + Decimal("2.000")
+                            * (Decimal("1.000") - vf)
+                            * fiber_transverse_shear_modulus
+                            * matrix_transverse_shear_modulus
+                            + (Decimal("1.000") - vf)
+                            * matrix_pstrain_bulk_modulus
+                            * (
+                                fiber_transverse_shear_modulus
+                                + matrix_transverse_shear_modulus
+                            )
+                        )
+                    )
+                    / (
+                        Decimal("2")
+                        * vf
+                        * matrix_transverse_shear_modulus
+                        * (
+                            matrix_pstrain_bulk_modulus
+                            + matrix_transverse_shear_modulus
+                        )
+                        + Decimal("2")
+                        * (Decimal("1") - vf)
+                        * fiber_transverse_shear_modulus
+                        * matrix_transverse_shear_modulus
+                        + (Decimal("1") - vf)
+                        * matrix_pstrain_bulk_modulus
+                        * (
+                            fiber_transverse_shear_modulus
+                            + matrix_transverse_shear_modulus
+                        )
+                    )
+                )
+            )
+
+        # Return effective property
+        return tuple(effective_transverse_shear_moduli)
+
+    def _estimate_E2eff(self) -> tuple[Decimal, ...]:
+        """Compute the effective transverse Young's modulus of UD composite, i.e. ```HT```
+        object using transversely-isotropic formula that depends on the values of
+        other computed effective properties, e.g. `eff_axial_youngs_moduli`,
+        `eff_pstrain_bulk_moduli`, `eff_transverse_shear_moduli` and
+        `eff_major_poissons_ratios` of ```HT``` instantiated object and of course, on
+        the values of fiber volume fraction provided by the tuple of `fiber_volfract`
+        as well. The computed effective elastic property is then initialized to
+        a class attribute `eff_transverse_youngs_moduli`.
+
+        : raise TypeError: if `fiber` and `matrix` is None or neither ```Isotropic```
+            nor ```Transtropic```
+        : return: The computed effective transverse shear moduli by Halpin-Tsai
+            micromechanics method
+        : rtype: tuple[Decimal]
+        """
+        # Compute effective transverse Young's moduli, E2*
+        return tuple(
+            map(
+                lambda tuple1, tuple2, tuple3, tuple4: _quantize(
+                    (Decimal("4.000") * tuple1 * tuple2)
+                    / (
+                        tuple2
+                        + tuple1
+                        + (Decimal("4.000") * tuple3**2 * tuple1 * tuple2) / tuple4
+                    )
+                ),
+                self.eff_transverse_shear_moduli,
+                self.eff_pstrain_bulk_moduli,
+                self.eff_major_poissons_ratios,
+                self.eff_axial_youngs_moduli,
+            )
+        )
+
+    @staticmethod
+    def __get_index_num(start: float | None = None, end: float | None = None) -> tuple:
+        """Get the index number of a tuple that has 101 element. Basicall, this method
+        is called by other instance methods such as ``E1eff``, ``E2eff``, ``G12eff``,
+        ``v12eff``, ``K23eff``, and ``G23eff`` when user requests to get the value/s of
+        effective property at specific fiber volume fraction or at specific range of
+        fiber volume fraction. This method will then identify the index number/s of the
+        requested fiber volume fraction/s in the `fiber_volfract` tuple so that it or
+        they can be used to cross-reference and fetch the desired value/s of effective
+        property that has the same tuple size as the size of `fiber_volfract` tuple.
+
+        : param `start`: specific volume fraction of fiber for a single value or the
+            start of fiber volume fraction range
+        : type: float | None
+        : param `end`: the end of fiber volume fraction range (inclusive) or None if
+            specific fiber volume fraction is desired by user
+        : type: float | None
+        : raise TypeError and ValueError: if first argument - `start` is None, not an
+            int or float number or its value does not lie between 0 and 1, and also
+            if second argument if provided by user is None, not an int or float
+            number or its value is lesser than the value of first argument or not in
+            between 0 and 1.
+        : return: index number or index numbers of a tuple of size 100.
+        : rtype: tuple[int]
+        """
+        if start is None:
+            raise TypeError(
+                "Expected fiber volume fraction value for first argument to be 'float' "
+                + "type number"
+            )
+        bounds: tuple = HT._vf_index.window(start, end)
+        if end is not None and end <= start:
+            raise ValueError(
+                "Expected value for second argument to be greater than value in the "
+                + "first argument"
+            )
+        return (bounds[0], None if end is None else bounds[1])
+
+    @staticmethod
+    def _get_vf_index(value: int | float) -> int:
+        """Get the index number of a fiber volume fraction value in the tuple of
+        `fiber_volfract` by ```VfIndex``` of the value rounded off to two decimal
+        places, which gives the same index number as searching the tuple of
+        `fiber_volfract` for the quantized value but in constant time.
+
+        : param `value`: fiber volume fraction from 0 to 1
+        : type: int | float
+        : raise TypeError: If `value` is not a number
+        : raise ValueError: If `value` rounded off is not from 0 to 1
+        : return: index number in `fiber_volfract`
+        : rtype: int
+
+        Example:
+            >>> HT._get_vf_index(0.71154)
+            71
+            >>>
+        """
+        return HT._vf_index.index(value)
+
+    @staticmethod
+    def _get_vf_indices(values: list | tuple | np.ndarray) -> np.ndarray:
+        """Get the index numbers of many fiber volume fraction values in the tuple of
+        `fiber_volfract` in one vectorized lookup of ```VfIndex```, where every value
+        is rounded off to two decimal places as in ``_get_vf_index``.
+
+        : param `values`: fiber volume fractions from 0 to 1
+        : type: list | tuple | np.ndarray
+        : raise TypeError: If `values` is None or not a sequence of numbers
+        : raise ValueError: If `values` is empty or any value rounded off is not from
+            0 to 1
+        : return: index numbers in `fiber_volfract`
+        : rtype: np.ndarray
+
+        Example:
+            >>> HT._get_vf_indices([0.5, 0.555, 0.6])
+            array([50, 56, 60])
+            >>>
+        """
+        return HT._vf_index.indices(values)
+
+
+class HybridHT(HT):
+    """
+    A class that represents hybrid unidirectional (UD) composite material made up from
+    two fibers and one matrix, e.g. carbon/glass hybrids, where the two fibers are first
+    combined into an equivalent transversely isotropic fiber by the same Halpin-Tsai
+    formulae at the given hybrid ratio and the equivalent fiber is then combined with
+    the matrix as in ```HT```. Therefore, every method and function that accepts
+    ```HT``` object, e.g. ``display``, ``save`` and ``plot``, also accepts
+    ```HybridHT``` object.
+
+    Attributes:
+
+    `fiber_1`: ```Isotropic``` | ```Transtropic```
+        First fiber material of hybrid UD composite
+
+    `fiber_2`: ```Isotropic``` | ```Transtropic```
+        Second fiber material of hybrid UD composite
+
+    `hybrid_ratio`: Decimal
+        Volume fraction of `fiber_2` in the total fiber volume, 0 <= ratio <= 1
+
+    `fiber`: ```Transtropic```
+        Equivalent fiber of `fiber_1` and `fiber_2` at `hybrid_ratio`
+
+    The other attributes are inherited from ```HT```.
+
+    Methods:
+
+    ``ratio_sweep``:
+        Return all effective elastic properties of hybrid UD composite on a grid of
+        hybrid ratios versus fiber volume fraction computed in one vectorized pass
+
+    ``_get_hybrid_fiber``:
+        ``@staticmethod``: Returns the equivalent ```Transtropic``` fiber of two fibers
+        at a hybrid ratio
+
+    The other methods are inherited from ```HT```.
+    """
+
+    def __init__(
+        self,
+        fiber_1: Isotropic | Transtropic,
+        fiber_2: Isotropic | Transtropic,
+        matrix: Isotropic | Transtropic,
+        hybrid_ratio: str | int | float | Decimal = "0.5",
+    ) -> None:
+        """
+        Initialize instance attributes of ```HybridHT``` object.
+
+        : param `fiber_1`: the first fiber material of hybrid UD composite
+        : type: ```Isotropic``` | ```Transtropic```
+        : param `fiber_2`: the second fiber material of hybrid UD composite
+        : type: ```Isotropic``` | ```Transtropic```
+        : param `matrix`: the matrix material of hybrid UD composite
+        : type: ```Isotropic``` | ```Transtropic```
+        : param `hybrid_ratio`: volume fraction of `fiber_2` in the total fiber volume,
+            0 <= ratio <= 1. Default is 0.5
+        : type: str | int | float | Decimal
+        : raise TypeError: If any constituent is not ```Isotropic``` or
+            ```Transtropic``` object, or if `hybrid_ratio` is None
+        : raise ValueError: If `hybrid_ratio` is not a number within 0 <= ratio <= 1
+        : return: -
+        : rtype: None
+
+        Example:
+            >>> hybrid = HybridHT(carbon, fiberglass, epoxy, 0.3)
+            >>> hybrid.name
+            'Carbon_Fiberglass-Epoxy'
+            >>> hybrid.fiber.name
+            'Carbon_Fiberglass'
+            >>>
+        """
+        # Check for TypeError and ValueError
+        for constituent in (fiber_1, fiber_2, matrix):
+            if not isinstance(constituent, Isotropic | Transtropic):
+                raise TypeError(
+                    "Expect fibers and matrix to be 'Isotropic' or 'Transtropic' object"
+                )
+        if hybrid_ratio is None:
+            raise TypeError("Missing hybrid ratio value")
+        try:
+            ratio: Decimal = Decimal(str(hybrid_ratio).strip())
+        except InvalidOperation:
+            raise ValueError("Missing or invalid hybrid ratio value (0 <= ratio <= 1)")
+        if not ratio.is_finite() or ratio < 0 or ratio > 1:
+            raise ValueError("Missing or invalid hybrid ratio value (0 <= ratio <= 1)")
+
+        self._fiber_1 = fiber_1
+        self._fiber_2 = fiber_2
+        self._hybrid_ratio: Decimal = ratio.quantize(Decimal("1.000"))
+        super().__init__(
+            HybridHT._get_hybrid_fiber(fiber_1, fiber_2, self._hybrid_ratio), matrix
+        )
+
+    @property
+    def fiber_1(self) -> Isotropic | Transtropic:
+        """Get read-only first fiber of hybrid UD composite
+
+        : return: the first fiber material
+        : rtype: ```Isotropic``` | ```Transtropic```
+        """
+        return self._fiber_1
+
+    @property
+    def fiber_2(self) -> Isotropic | Transtropic:
+        """Get read-only second fiber of hybrid UD composite
+
+        : return: the second fiber material
+        : rtype: ```Isotropic``` | ```Transtropic```
+        """
+        return self._fiber_2
+
+    @property
+    def hybrid_ratio(self) -> Decimal:
+        """Get read-only volume fraction of `fiber_2` in the total fiber volume
+
+        : return: hybrid ratio
+        : rtype: Decimal
+
+        Example:
+            >>> hybrid.hybrid_ratio
+            Decimal('0.300')
+            >>>
+        """
+        return self._hybrid_ratio
+
+    def ratio_sweep(self, hybrid_ratios: list | tuple | np.ndarray) -> dict:
+        """Compute all effective elastic properties of hybrid UD composite on a grid of
+        hybrid ratios versus the full range of fiber volume fraction in one vectorized
+        pass, i.e. the design map of the two fibers and the matrix.
+
+        Note: the values are computed in float precision and are not quantized.
+
+        : param `hybrid_ratios`: Volume fractions of `fiber_2` in the total fiber
+            volume, 0 <= ratio <= 1
+        : type: list | tuple | np.ndarray
+        : raise TypeError: If `hybrid_ratios` is None or not a sequence of numbers
+        : raise ValueError: If `hybrid_ratios` is empty or any value is not within
+            0 <= ratio <= 1
+        : return: Hybrid ratios as 'ratio', fiber volume fractions as 'Vf' and every
+            effective elastic property, e.g. 'E1eff', as an array of shape
+            (number of hybrid ratios, number of fiber volume fractions)
+        : rtype: dict
+
+        Example:
+            >>> sweep = hybrid.ratio_sweep([0, 0.25, 0.5, 0.75, 1])
+            >>> sweep["E1eff"].shape
+            (5, 101)
+            >>> round(sweep["E1eff"][2, 60], 3)
+            112.12
+            >>>
+        """
+        # Check for TypeError and ValueError
+        ratio_array: np.ndarray = _get_float_array(hybrid_ratios, "hybrid ratios")
+        if np.any(ratio_array < 0) or np.any(ratio_array > 1):
+            raise ValueError("Expected hybrid ratios to be within 0 <= ratio <= 1")
+
+        # Get elastic constants of equivalent fibers as column vectors of ratios
+        hybrid: dict = _halpin_tsai(
+            self.fiber_2._get_elastic_constants(),
+            self.fiber_1._get_elastic_constants(),
+            ratio_array,
+        )
+        fiber_constants: list = [
+            hybrid[key][:, np.newaxis]
+            for key in ("E1eff", "v12eff", "G12eff", "G23eff", "K23eff")
+        ]
+
+        # Compute and return effective properties on hybrid ratio versus Vf grid
+        eff_properties: dict = _halpin_tsai(
+            fiber_constants,
+            self.matrix._get_elastic_constants(),
+            HT._fiber_volfract_array,
+        )
+        return {"ratio": ratio_array, "Vf": HT._fiber_volfract_array, **eff_properties}
+
+    @staticmethod
+    def _get_hybrid_fiber(
+        fiber_1: Isotropic | Transtropic,
+        fiber_2: Isotropic | Transtropic,
+        hybrid_ratio: Decimal,
+    ) -> Transtropic:
+        """
+        A ``@staticmethod`` that combines two fibers into an equivalent transversely
+        isotropic fiber, where `fiber_2` is mixed into `fiber_1` at `hybrid_ratio` by
+        the same Halpin-Tsai formulae as ```HT```.
+
+        : param `fiber_1`: the first fiber material
+        : type: ```Isotropic``` | ```Transtropic```
+        : param `fiber_2`: the second fiber material
+        : type: ```Isotropic``` | ```Transtropic```
+        : param `hybrid_ratio`: volume fraction of `fiber_2` in the total fiber volume
+        : type: Decimal
+        : return: the equivalent fiber named after both fibers
+        : rtype: ```Transtropic```
+        """
+        hybrid: dict = _halpin_tsai(
+            fiber_2._get_elastic_constants(),
+            fiber_1._get_elastic_constants(),
+            np.array(float(hybrid_ratio)),
+        )
+        return Transtropic(
+            fiber_1.name + "_" + fiber_2.name,
+            round(float(hybrid["E1eff"]), 3),
+            round(float(hybrid["E2eff"]), 3),
+            round(float(hybrid["G12eff"]), 3),
+            round(float(hybrid["G23eff"]), 3),
+            round(float(hybrid["v12eff"]), 3),
+        )
+
+
+class StoredHT(HT):
+    """
+    A class that represents UD composite whose effective elastic properties are read
+    from a ```ResultStore``` instead of being computed, where `table` is a zero-copy
+    slice of the memory-mapped file that is read lazily, and fiber and matrix are
+    instantiated from their stored elastic constants only when they are accessed.
+    Therefore, every method and function that accepts ```HT``` object, e.g.
+    ``display``, ``compare`` and ``plot``, also accepts ```StoredHT``` object.
+
+    Attributes:
+
+    `store`: ```ResultStore```
+        Result store of UD composite
+
+    The other attributes are inherited from ```HT```.
+    """
+
+    def __init__(self, store: "ResultStore", position: int) -> None:
+        """
+        Initialize instance attributes of ```StoredHT``` object.
+
+        : param `store`: result store of UD composite
+        : type: ```ResultStore```
+        : param `position`: position of UD composite in store
+        : type: int
+        : rtype: None
+        """
+        self._store: ResultStore = store
+        self._position: int = position
+        self._fiber: Isotropic | Transtropic | None = None
+        self._matrix: Isotropic | Transtropic | None = None
+        self._table: np.ndarray = store.data[position]
+        self._columns: dict = {}
+        self._table_cache: tuple = ()
+        self._aggregate_cache: tuple = ()
+
+    @property
+    def store(self) -> "ResultStore":
+        """Get read-only `store` value
+
+        : return: result store of UD composite
+        : rtype: ```ResultStore```
+        """
+        return self._store
+
+    @property
+    def name(self) -> str:
+        """Get read-only stored `name` value
+
+        : return: the name of UD composite material
+        : rtype: str
+        """
+        return self._store.names[self._position]
+
+    @property
+    def fiber(self) -> Transtropic | Isotropic:
+        """Get read-only `fiber` value instantiated from its stored elastic constants
+
+        : return: Object which can either be ```Isotropic``` or ```Transtropic```.
+        : rtype: ```Isotropic``` | ```Transtropic```
+        """
+        if self._fiber is None:
+            self._fiber = self._store._get_constituent(self._position, "fiber")
+        return self._fiber
+
+    @property
+    def matrix(self) -> Transtropic | Isotropic:
+        """Get read-only `matrix` value instantiated from its stored elastic constants
+
+        : return: the object which can either be ```Isotropic``` or ```Transtropic```
+        : rtype: ```Isotropic``` | ```Transtropic```
+        """
+        if self._matrix is None:
+            self._matrix = self._store._get_constituent(self._position, "matrix")
+        return self._matrix
+
+    @property
+    def eff_axial_youngs_moduli(self) -> tuple:
+        """Get read-only stored `eff_axial_youngs_moduli` values
+
+        : rtype: tuple[Decimal, ...]
+        """
+        return self._get_column("E1eff")
+
+    @property
+    def eff_major_poissons_ratios(self) -> tuple:
+        """Get read-only stored `eff_major_poissons_ratios` values
+
+        : rtype: tuple[Decimal, ...]
+        """
+        return self._get_column("v12eff", "1.0000")
+
+    @property
+    def eff_axial_shear_moduli(self) -> tuple:
+        """Get read-only stored `eff_axial_shear_moduli` values
+
+        : rtype: tuple[Decimal, ...]
+        """
+        return self._get_column("G12eff")
+
+    @property
+    def eff_pstrain_bulk_moduli(self) -> tuple:
+        """Get read-only stored `eff_pstrain_bulk_moduli` values
+
+        : rtype: tuple[Decimal, ...]
+        """
+        return self._get_column("K23eff")
+
+    @property
+    def eff_transverse_shear_moduli(self) -> tuple:
+        """Get read-only stored `eff_transverse_shear_moduli` values
+
+        : rtype: tuple[Decimal, ...]
+        """
+        return self._get_column("G23eff")
+
+    @property
+    def eff_transverse_youngs_moduli(self) -> tuple:
+        """Get read-only stored `eff_transverse_youngs_moduli` values
+
+        : rtype: tuple[Decimal, ...]
+        """
+        return self._get_column("E2eff")
+
+    def _get_table(self) -> np.ndarray:
+        """Return the read-only float table of UD composite, which is a zero-copy slice
+        of the memory-mapped file of its store.
+
+        : return: read-only table of shape (7, 101)
+        : rtype: np.ndarray
+        """
+        return self._table
+
+    def _get_column(self, key: str, exponent: str = "1.000") -> tuple:
+        """Return the Decimal values of a stored effective elastic property, which are
+        converted once from `table` and quantized as computed by ```HT```.
+
+        : param `key`: 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' or 'K23eff'
+        : type: str
+        : param `exponent`: decimal places of values, e.g. "1.000"
+        : type: str
+        : return: values that follow the increment of fiber volume fraction
+        : rtype: tuple[Decimal, ...]
+        """
+        if key not in self._columns:
+            self._columns[key] = tuple(
+                Decimal(repr(value)).quantize(Decimal(exponent))
+                for value in self._table[HT._table_rows[key]].tolist()
+            )
+        return self._columns[key]
+
+
+class MaterialLibrary:
+    """
+    A class that represents a library of constituent materials, i.e. ```Isotropic```
+    and/or ```Transtropic``` objects, e.g. merged from several supplier libraries read
+    by ``Isotropic.read`` and ``Transtropic.read``.
+
+    The elastic constants of the constituents are held in columnar form with a hash
+    index of name to row, and constituents of the same type whose elastic constants
+    agree within a relative tolerance are collapsed into one unique constituent, so
+    that batch Halpin-Tsai evaluation is done once per unique constituent and its
+    results are mapped back to all of its aliases.
+
+    Attributes:
+
+    `names`: tuple[str, ...]
+        Names of all constituents in the order of insertion
+
+    `unique`: tuple[```Isotropic``` | ```Transtropic```, ...]
+        Unique constituents, i.e. the first constituent added of every group of
+        duplicates
+
+    `tolerance`: float
+        Relative tolerance on elastic constants of duplicates
+
+    Methods:
+
+    ``add``:
+        Add a constituent and return its row index
+
+    ``extend``:
+        Add every constituent of a sequence, e.g. the list returned by ``read``
+
+    ``aliases``:
+        Return names of all constituents that are duplicates of a constituent
+
+    ``batch_sweep``:
+        Return all effective elastic properties of every constituent combined with a
+        partner constituent versus the full range of fiber volume fraction, computed
+        once per unique constituent in one vectorized pass
+
+    ``composites``:
+        Return ```HT``` objects of every constituent combined with a partner
+        constituent, where aliases share the ```HT``` object of their unique
+        constituent
+    """
+
+    def __init__(
+        self, constituents: list | tuple | None = None, tolerance: float = 1e-3
+    ) -> None:
+        """
+        Initialize instance attributes of ```MaterialLibrary``` object.
+
+        : param `constituents`: constituents to be added, or None for empty library
+        : type: list | tuple | None
+        : param `tolerance`: relative tolerance on elastic constants of duplicates, 0
+            for exact duplicates only. Default is 1e-3
+        : type: float
+        : raise TypeError: If `tolerance` is not a number
+        : raise ValueError: If `tolerance` is negative
+        : rtype: None
+
+        Example:
+            >>> library = MaterialLibrary(Isotropic.read("isotropic.csv"))
+            >>> len(library), len(library.unique)
+            (12, 9)
+            >>>
+        """
+        # Check for TypeError and ValueError
+        if not isinstance(tolerance, int | float) or isinstance(tolerance, bool):
+            raise TypeError("Expect tolerance to be an int or float object")
+        if not tolerance >= 0:
+            raise ValueError("Expect tolerance to be zero or positive")
+
+        self._tolerance: float = float(tolerance)
+        self._names: list[str] = []
+        self._index: dict[str, int] = {}
+        self._unique_rows: list[int] = []  # row of every constituent's unique one
+        self._unique: list = []
+
+        # Buffer of doubling capacity whose first len(`_unique`) rows are in use
+        self._constants: np.ndarray = np.empty((0, 5), dtype=float)
+        if constituents is not None:
+            self.extend(constituents)
+
+    def __len__(self) -> int:
+        """
+        : return: number of constituents including duplicates
+        : rtype: int
+        """
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        """
+        : return: True if a constituent of `name` is in library
+        : rtype: bool
+        """
+        return name in self._index
+
+    def __getitem__(self, name: str) -> Isotropic | Transtropic:
+        """Get the unique constituent of a constituent name
+
+        : param `name`: name of constituent
+        : type: str
+        : raise KeyError: If no constituent of `name` is in library
+        : return: unique constituent that `name` is collapsed into
+        : rtype: ```Isotropic``` | ```Transtropic```
+        """
+        return self._unique[self._unique_rows[self._index[name]]]
+
+    @property
+    def names(self) -> tuple:
+        """Get read-only names of all constituents
+
+        : return: names in the order of insertion
+        : rtype: tuple[str, ...]
+        """
+        return tuple(self._names)
+
+    @property
+    def unique(self) -> tuple:
+        """Get read-only unique constituents
+
+        : return: unique constituents in the order of insertion
+        : rtype: tuple[```Isotropic``` | ```Transtropic```, ...]
+        """
+        return tuple(self._unique)
+
+    @property
+    def tolerance(self) -> float:
+        """Get read-only relative tolerance on elastic constants of duplicates
+
+        : return: relative tolerance
+        : rtype: float
+        """
+        return self._tolerance
+
+    def add(self, constituent: Isotropic | Transtropic) -> int:
+        """Add a constituent to library, where a constituent of the same type whose
+        elastic constants agree with a unique constituent within `tolerance` is
+        collapsed into it, and a constituent whose name is already in library is
+        interned, i.e. not added twice, if it is a duplicate.
+
+        : param `constituent`: constituent to be added
+        : type: ```Isotropic``` | ```Transtropic```
+        : raise TypeError: If `constituent` is not ```Isotropic``` or ```Transtropic```
+        : raise ValueError: If name of `constituent` is already in library with
+            different elastic constants
+        : return: row index of constituent
+        : rtype: int
+
+        Example:
+            >>> library.add(Isotropic("Epoxy_B", 2.8, 0.3))  # duplicate of Epoxy
+            12
+            >>> library["Epoxy_B"].name
+            'Epoxy'
+            >>>
+        """
+        # Check for TypeError
+        if not isinstance(constituent, Isotropic | Transtropic):
+            raise TypeError("Expect constituent of 'Isotropic' or 'Transtropic' object")
+
+        # Find unique constituent of the same type within tolerance
+        constants: np.ndarray = np.array(
+            constituent._get_elastic_constants(), dtype=float
+        )
+        unique_row: int | None = None
+        if self._unique:
+            matches: np.ndarray = np.all(
+                np.abs(self._constants[: len(self._unique)] - constants)
+                <= self._tolerance * np.abs(constants),
+                axis=1,
+            )
+            for row in np.flatnonzero(matches):
+                if type(self._unique[row]) is type(constituent):
+                    unique_row = int(row)
+                    break
+
+        # Intern constituent of existing name
+        name: str = constituent.name
+        if name in self._index:
+            if unique_row != self._unique_rows[self._index[name]]:
+                raise ValueError(
+                    f"Constituent {name} already in library with different elastic "
+                    + "constants"
+                )
+            return self._index[name]
+
+        # Add new unique constituent to a buffer of doubling capacity
+        if unique_row is None:
+            unique_row = len(self._unique)
+            if unique_row == len(self._constants):
+                buffer: np.ndarray = np.empty((max(2 * unique_row, 16), 5))
+                buffer[:unique_row] = self._constants
+                self._constants = buffer
+            self._constants[unique_row] = constants
+            self._unique.append(constituent)
+
+        # Add constituent and return its row
+        self._index[name] = len(self._names)
+        self._names.append(name)
+        self._unique_rows.append(unique_row)
+        return self._index[name]
+
+    def extend(self, constituents: list | tuple) -> None:
+        """Add every constituent of a sequence, e.g. the list returned by
+        ``Isotropic.read`` or ``Transtropic.read``.
+
+        : param `constituents`: constituents to be added
+        : type: list | tuple
+        : raise TypeError: If `constituents` is not a list or tuple, or any of them is
+            not ```Isotropic``` or ```Transtropic```
+        : raise ValueError: If any name is already in library with different elastic
+            constants
+        : rtype: None
+        """
+        # Check for TypeError
+        if not isinstance(constituents, list | tuple):
+            raise TypeError("Expect constituents of a list or tuple object")
+
+        for constituent in constituents:
+            self.add(constituent)
+
+    def aliases(self, name: str) -> tuple:
+        """Get names of all constituents collapsed into the same unique constituent as
+        constituent of `name`, including `name` itself.
+
+        : param `name`: name of constituent
+        : type: str
+        : raise KeyError: If no constituent of `name` is in library
+        : return: names of duplicates in the order of insertion
+        : rtype: tuple[str, ...]
+        """
+        unique_row: int = self._unique_rows[self._index[name]]
+        return tuple(
+            alias
+            for alias, row in zip(self._names, self._unique_rows)
+            if row == unique_row
+        )
+
+    def batch_sweep(
+        self, partner: Isotropic | Transtropic, role: str = "fiber"
+    ) -> dict:
+        """Compute all effective elastic properties of UD composites of every
+        constituent in library combined with a partner constituent versus the full
+        range of fiber volume fraction, where the Halpin-Tsai formulae are evaluated
+        once per unique constituent in one vectorized pass and the results are mapped
+        back to all aliases.
+
+        Note: the values are computed in float precision and are not quantized.
+
+        : param `partner`: matrix when library constituents are fibers, or fiber when
+            library constituents are matrices
+        : type: ```Isotropic``` | ```Transtropic```
+        : param `role`: role of library constituents, i.e. "fiber" or "matrix".
+            Default is "fiber"
+        : type: str
+        : raise TypeError: If `partner` is not ```Isotropic``` or ```Transtropic```
+        : raise ValueError: If `role` is neither "fiber" nor "matrix", or library is
+            empty
+        : return: Names of constituents as 'names', fiber volume fractions as 'Vf' and
+            every effective elastic property, e.g. 'E1eff', as an array of shape
+            (number of constituents, number of fiber volume fractions)
+        : rtype: dict
+
+        Example:
+            >>> sweep = library.batch_sweep(epoxy)
+            >>> sweep["E2eff"].shape
+            (13, 101)
+            >>>
+        """
+        # Check for TypeError and ValueError
+        if not isinstance(partner, Isotropic | Transtropic):
+            raise TypeError("Expect partner of 'Isotropic' or 'Transtropic' object")
+        if role not in ("fiber", "matrix"):
+            raise ValueError("Expect role to be either 'fiber' or 'matrix'")
+        if not self._names:
+            raise ValueError("Expect at least one constituent in library")
+
+        # Compute effective properties of unique constituents as rows
+        library_constants: list = [
+            column[:, np.newaxis] for column in self._constants[: len(self._unique)].T
+        ]
+        partner_constants: tuple = partner._get_elastic_constants()
+        if role == "fiber":
+            eff_properties: dict = _halpin_tsai(
+                library_constants, partner_constants, HT._fiber_volfract_array
+            )
+        else:
+            eff_properties = _halpin_tsai(
+                partner_constants, library_constants, HT._fiber_volfract_array
+            )
+
+        # Map rows of unique constituents back to all aliases
+        rows: np.ndarray = np.array(self._unique_rows, dtype=int)
+        return {
+            "names": self.names,
+            "Vf": HT._fiber_volfract_array,
+            **{key: values[rows] for key, values in eff_properties.items()},
+        }
+
+    def composites(self, partner: Isotropic | Transtropic, role: str = "fiber") -> dict:
+        """Get ```HT``` objects of every constituent in library combined with a
+        partner constituent, where one ```HT``` object is instantiated per unique
+        constituent and shared by all of its aliases, i.e. its name is the name of the
+        unique constituent.
+
+        : param `partner`: matrix when library constituents are fibers, or fiber when
+            library constituents are matrices
+        : type: ```Isotropic``` | ```Transtropic```
+        : param `role`: role of library constituents, i.e. "fiber" or "matrix".
+            Default is "fiber"
+        : type: str
+        : raise TypeError: If `partner` is not ```Isotropic``` or ```Transtropic```
+        : raise ValueError: If `role` is neither "fiber" nor "matrix"
+        : return: ```HT``` object of every constituent name
+        : rtype: dict[str, ```HT```]
+        """
+        # Check for TypeError and ValueError
+        if not isinstance(partner, Isotropic | Transtropic):
+            raise TypeError("Expect partner of 'Isotropic' or 'Transtropic' object")
+        if role not in ("fiber", "matrix"):
+            raise ValueError("Expect role to be either 'fiber' or 'matrix'")
+
+        # Instantiate UD composite once per unique constituent
+        unique_composites: list = [
+            HT(constituent, partner) if role == "fiber" else HT(partner, constituent)
+            for constituent in self._unique
+        ]
+        return {
+            name: unique_composites[row]
+            for name, row in zip(self._names, self._unique_rows)
+        }
+
+
+class OutputBuffer:
+    """A buffered sink of the text and confirmation notices that the query, display
+    and save functions would otherwise print line by line, e.g. ``HT.E1eff``,
+    ``display``, ``compare``, ``save`` and ``plot``. It is activated by ``quiet``.
+
+    Example:
+        >>> with quiet(summary=False) as output:
+        ...     composite.E1eff(0.5)
+        ...
+        >>> print(output.text)
+        Vf : E1*
+        0.5 : 126.400
+        >>>
+    """
+
+    def __init__(self) -> None:
+        """Constructor method of an empty buffer"""
+        self._stream = io.StringIO()
+        self._notices: list = []
+
+    def __len__(self) -> int:
+        """Get number of confirmation notices in buffer"""
+        return len(self._notices)
+
+    @property
+    def text(self) -> str:
+        """Get rendered text written to buffer
+
+        : return: Rendered text of buffer
+        : rtype: str
+        """
+        return self._stream.getvalue()
+
+    @property
+    def notices(self) -> tuple:
+        """Get confirmation notices in buffer as (file name, status) pairs
+
+        : return: Name of every file and whether it is saved (True) or missing (False)
+        : rtype: tuple[tuple[str, bool], ...]
+        """
+        return tuple(self._notices)
+
+    def write(self, *values, sep: str = " ", end: str = "\n") -> None:
+        """Write values to buffer in the same manner as built-in ``print``
+
+        : param `values`: values to be written
+        : type: Any
+        : param `sep`: string inserted between values. Default is a space
+        : type: str
+        : param `end`: string appended after the last value. Default is a newline
+        : type: str
+        : rtype: None
+        """
+        self._stream.write(sep.join(str(value) for value in values) + end)
+
+    def notice(self, status: bool | None = None, file_name: str | None = None) -> None:
+        """Record confirmation notice of a saved or missing file
+
+        : param `status`: True or False wether file exists or not respectively
+        : type: bool | None
+        : param `file_name`: Name of the file
+        : type: str | None
+        : raise TypeError: If `status` is None and not boolean type or if `file_name`
+            is None and not str type
+        : rtype: None
+        """
+        # Check for TypeError
+        if status is None or not isinstance(status, bool):
+            raise TypeError("Expect status to be of a boolean type")
+        if file_name is None or not isinstance(file_name, str):
+            raise TypeError("Expect file_name to be of a str type")
+
+        self._notices.append((file_name, status))
+
+    def summary(self) -> str:
+        """Get a single summary of all confirmation notices in buffer, i.e. the number
+        of saved files followed by the notice of every missing file
+
+        : return: Summary of confirmation notices
+        : rtype: str
+        """
+        saved: int = sum(status for _, status in self._notices)
+        sentence = f" {saved} file{'' if saved == 1 else 's'} saved! "
+        lines: list = [sentence.center(74, "=")]
+        lines += [
+            _get_confirmation_notices(status, file_name)
+            for file_name, status in self._notices
+            if not status
+        ]
+        return "\n".join(lines)
+
+
+class AggregateIndex:
+    """An aggregate index of the effective elastic properties of a UD composite, i.e.
+    prefix sums, prefix trapezoidal integrals and sparse tables of minima and maxima,
+    built once from `table` of ```HT``` object so that the mean, sum, integral, min and
+    max of a property over any window of fiber volume fraction are answered in
+    constant time. It is obtained from `aggregate_index` of ```HT``` object.
+
+    Example:
+        >>> index = composite.aggregate_index
+        >>> round(index.aggregate(0.55, 0.65, "G12eff"), 3)
+        3.61
+        >>> index.aggregate([0.5, 0.55], [0.6, 0.65], "G12eff", "max")
+        array([3.592, 4.096])
+        >>>
+    """
+
+    _statistics: tuple = ("mean", "sum", "integral", "min", "max")
+
+    def __init__(self, table: np.ndarray) -> None:
+        """Constructor method
+
+        : param `table`: float table of fiber volume fraction and all effective elastic
+            properties of shape (7, number of Vf), i.e. `table` of ```HT``` object
+        : type: np.ndarray
+        : raise TypeError: If `table` is not a two-dimensional float array of 7 rows
+        """
+        # Check for TypeError
+        if not isinstance(table, np.ndarray) or table.ndim != 2 or len(table) != 7:
+            raise TypeError("Expect table to be an array of shape (7, number of Vf)")
+
+        size: int = table.shape[1]
+        self._table: np.ndarray = table
+        self._prefix_sums: np.ndarray = np.zeros((7, size + 1))
+        np.cumsum(table, axis=1, out=self._prefix_sums[:, 1:])
+        self._prefix_integrals: np.ndarray = np.zeros((7, size))
+        np.cumsum(
+            (table[:, 1:] + table[:, :-1]) / 2 * np.diff(table[0]),
+            axis=1,
+            out=self._prefix_integrals[:, 1:],
+        )
+
+        # Sparse tables where level k holds min/max over windows of 2**k values
+        self._log2: np.ndarray = np.zeros(size + 1, dtype=np.intp)
+        self._log2[2:] = np.floor(np.log2(np.arange(2, size + 1)))
+        levels: int = int(self._log2[size]) + 1
+        self._sparse_min: np.ndarray = np.repeat(table[np.newaxis], levels, axis=0)
+        self._sparse_max: np.ndarray = self._sparse_min.copy()
+        for k in range(1, levels):
+            half, span = 1 << (k - 1), size - (1 << k) + 1
+            np.minimum(
+                self._sparse_min[k - 1, :, :span],
+                self._sparse_min[k - 1, :, half : half + span],
+                out=self._sparse_min[k, :, :span],
+            )
+            np.maximum(
+                self._sparse_max[k - 1, :, :span],
+                self._sparse_max[k - 1, :, half : half + span],
+                out=self._sparse_max[k, :, :span],
+            )
+
+    def aggregate(
+        self,
+        vf_min: float | list | tuple | np.ndarray,
+        vf_max: float | list | tuple | np.ndarray,
+        property: str = "E1eff",
+        statistic: str = "mean",
+    ) -> float | np.ndarray:
+        """Get an aggregate of an effective elastic property over one or many windows
+        of fiber volume fraction in constant time per window, where both ends of every
+        window are rounded off to two decimal places and are inclusive.
+
+        : param `vf_min`: start or starts of windows of fiber volume fraction
+        : type: float | list | tuple | np.ndarray
+        : param `vf_max`: end or ends of windows of fiber volume fraction
+        : type: float | list | tuple | np.ndarray
+        : param `property`: 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' or
+            'K23eff'. Default is 'E1eff'
+        : type: str
+        : param `statistic`: 'mean', 'sum', 'integral' (trapezoidal rule over fiber
+            volume fraction), 'min' or 'max'. Default is 'mean'
+        : type: str
+        : raise TypeError: If `vf_min` or `vf_max` is not a number or a sequence of
+            numbers, or `property` or `statistic` is not a str
+        : raise ValueError: If any end is not from 0 to 1, any start is greater than its
+            end, the numbers of starts and ends differ, or `property` or `statistic`
+            is unknown
+        : return: aggregate of each window, a float for a single window
+        : rtype: float | np.ndarray
+        """
+        start, end = AggregateIndex._get_window_indices(vf_min, vf_max)
+        row: int = AggregateIndex._get_row(property, statistic)
+        result: np.ndarray = self._aggregate_indices(start, end, row, statistic)
+        if np.ndim(vf_min) == 0 and np.ndim(vf_max) == 0:
+            return float(result[0])
+        return result
+
+    def _aggregate_indices(
+        self, start: np.ndarray, end: np.ndarray, row: int, statistic: str
+    ) -> np.ndarray:
+        """Get an aggregate of a row of table over windows of validated index numbers.
+
+        Note: A helper function to ``aggregate`` method and ``aggregate`` function.
+
+        : param `start`: inclusive start index numbers of windows
+        : type: np.ndarray
+        : param `end`: inclusive end index numbers of windows
+        : type: np.ndarray
+        : param `row`: row number of property in table
+        : type: int
+        : param `statistic`: 'mean', 'sum', 'integral', 'min' or 'max'
+        : type: str
+        : return: aggregate of each window
+        : rtype: np.ndarray
+        """
+        if statistic in ("mean", "sum"):
+            total: np.ndarray = (
+                self._prefix_sums[row, end + 1] - self._prefix_sums[row, start]
+            )
+            return total if statistic == "sum" else total / (end - start + 1)
+        if statistic == "integral":
+            return self._prefix_integrals[row, end] - self._prefix_integrals[row, start]
+        # Two overlapping windows of 2**level values cover the window
+        level: np.ndarray = self._log2[end - start + 1]
+        if statistic == "min":
+            return np.minimum(
+                self._sparse_min[level, row, start],
+                self._sparse_min[level, row, end - (1 << level) + 1],
+            )
+        return np.maximum(
+            self._sparse_max[level, row, start],
+            self._sparse_max[level, row, end - (1 << level) + 1],
+        )
+
+    @staticmethod
+    def _get_window_indices(
+        vf_min: float | list | tuple | np.ndarray,
+        vf_max: float | list | tuple | np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Validate windows of fiber volume fraction and get their index numbers.
+
+        Note: A helper function to ``aggregate`` method and ``aggregate`` function.
+
+        : param `vf_min`: start or starts of windows of fiber volume fraction
+        : type: float | list | tuple | np.ndarray
+        : param `vf_max`: end or ends of windows of fiber volume fraction
+        : type: float | list | tuple | np.ndarray
+        : raise TypeError: If `vf_min` or `vf_max` is not a number or a sequence of
+            numbers
+        : raise ValueError: If any end is not from 0 to 1, any start is greater than its
+            end or the numbers of starts and ends differ
+        : return: start and end index numbers of windows
+        : rtype: tuple[np.ndarray, np.ndarray]
+        """
+        start: np.ndarray = HT._get_vf_indices(
+            [vf_min] if np.ndim(vf_min) == 0 else vf_min
+        )
+        end: np.ndarray = HT._get_vf_indices(
+            [vf_max] if np.ndim(vf_max) == 0 else vf_max
+        )
+        if len(start) != len(end):
+            raise ValueError("Expect the same number of window starts and ends")
+        if np.any(start > end):
+            raise ValueError(
+                "Expected start of fiber volume fraction range to be smaller than end"
+            )
+        return start, end
+
+    @staticmethod
+    def _get_row(property: str, statistic: str) -> int:
+        """Validate property and statistic of an aggregate and get row number of
+        property in table.
+
+        Note: A helper function to ``aggregate`` method and ``aggregate`` function.
+
+        : param `property`: 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' or 'K23eff'
+        : type: str
+        : param `statistic`: 'mean', 'sum', 'integral', 'min' or 'max'
+        : type: str
+        : raise TypeError: If `property` or `statistic` is not a str
+        : raise ValueError: If `property` or `statistic` is unknown
+        : return: row number of property in table
+        : rtype: int
+        """
+        # Check for TypeError and ValueError
+        if not isinstance(property, str):
+            raise TypeError("Expect property to be a str object")
+        if not isinstance(statistic, str):
+            raise TypeError("Expect statistic to be a str object")
+        if statistic not in AggregateIndex._statistics:
+            raise ValueError(
+                "Expect statistic to be 'mean', 'sum', 'integral', 'min' or 'max'"
+            )
+        return HT._table_rows[HT._get_property_keys(property)[0]]
+
+
+class ResultIndex:
+    """
+    A class that represents a library-wide index of effective elastic properties, i.e.
+    a float array of composite x fiber volume fraction x property built from the
+    tables of many ```HT``` objects, with a sorted index per property so that filter
+    expressions such as "E1eff > 150 and G12eff > 5" are compiled into vectorized
+    boolean masks by binary search instead of loops over composites and tuples.
+
+    Attributes:
+
+    `names`: tuple[str, ...]
+        Names of all indexed UD composites
+
+    Methods:
+
+    ``mask``:
+        Return boolean mask of composite x fiber volume fraction that satisfies a filter
+        expression
+
+    ``filter``:
+        Return every composite and interval of fiber volume fraction that satisfies a
+        filter expression
+
+    Example:
+        >>> index = ResultIndex([composite_1, composite_2])
+        >>> index.filter("E1eff > 150 and v12eff < 0.3", 0.5, 0.65)
+        [('Carbon-Epoxy', 0.6, 0.65)]
+        >>>
+    """
+
+    _operators: tuple = ("<=", ">=", "==", "<", ">")
+    _tokens: re.Pattern = re.compile(
+        r"\s*(?:(?P<paren>[()])|(?P<logic>and|or)\b|(?P<op><=|>=|==|<|>)"
+        + r"|(?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)|(?P<name>\w+))"
+    )
+
+    def __init__(self, composites: dict | list | tuple) -> None:
+        """Constructor method
+
+        : param `composites`: UD composites keyed by name, e.g. the dict returned by
+            ``MaterialLibrary.composites``, or a sequence of them indexed by their
+            `name`
+        : type: dict[str, ```HT```] | list[```HT```] | tuple[```HT```, ...]
+        : raise TypeError: If `composites` is neither a dict, list nor tuple of
+            ```HT``` objects
+        : raise ValueError: If `composites` is empty or names of UD composites in a
+            sequence are not unique
+        """
+        # Check for TypeError and ValueError
+        composites = _get_composites_by_name(composites)
+        if not composites:
+            raise ValueError("Expect at least one composite")
+
+        self._names: tuple = tuple(composites)
+        self._values: np.ndarray = np.array(
+            [composite._get_table()[1:] for composite in composites.values()]
+        )
+        flat: np.ndarray = self._values.transpose(1, 0, 2).reshape(6, -1)
+        self._order: np.ndarray = np.argsort(flat, axis=1, kind="stable")
+        self._sorted: np.ndarray = np.take_along_axis(flat, self._order, axis=1)
+
+    def __len__(self) -> int:
+        """Get number of indexed UD composites"""
+        return len(self._names)
+
+    @property
+    def names(self) -> tuple:
+        """Get names of all indexed UD composites
+
+        : return: Names of UD composites
+        : rtype: tuple[str, ...]
+        """
+        return self._names
+
+    def mask(
+        self,
+        expression: str,
+        vf_min: float | None = None,
+        vf_max: float | None = None,
+    ) -> np.ndarray:
+        """Compile a filter expression into a boolean mask of composite x fiber volume
+        fraction. An expression compares 'E1eff', 'E2eff', 'G12eff', 'v12eff',
+        'G23eff' or 'K23eff' with a number by '<', '<=', '>', '>=' or '==', and joins
+        comparisons by 'and', 'or' and parentheses, e.g.
+        "(E1eff > 150 or E2eff >= 10) and v12eff < 0.3".
+
+        : param `expression`: filter expression
+        : type: str
+        : param `vf_min`: start of fiber volume fraction window from 0 to 1 or None for
+            0. It is rounded off to two decimal places
+        : type: float | None
+        : param `vf_max`: inclusive end of fiber volume fraction window from 0 to 1 or
+            None for 1. It is rounded off to two decimal places
+        : type: float | None
+        : raise TypeError: If `expression` is not a str, or `vf_min` or `vf_max` is not
+            a number
+        : raise ValueError: If `expression` is malformed or has an unknown property, or
+            the window is not from 0 to 1 or its start is greater than its end
+        : return: mask of shape (number of composites, 101)
+        : rtype: np.ndarray
+        """
+        # Check for TypeError and ValueError
+        if not isinstance(expression, str):
+            raise TypeError("Expect expression to be a str object")
+        start: int = 0 if vf_min is None else HT._get_vf_index(vf_min)
+        end: int = 100 if vf_max is None else HT._get_vf_index(vf_max)
+        if start > end:
+            raise ValueError(
+                "Expected start of fiber volume fraction range to be smaller than end"
+            )
+        tokens: list = self._tokenize(expression)
+
+        # Evaluate expression and restrict it to the window
+        position, mask = self._parse_or(tokens, 0)
+        if position != len(tokens):
+            raise ValueError(f"Unexpected '{tokens[position][1]}' in expression")
+        mask = mask.reshape(len(self), -1)
+        mask[:, :start] = False
+        mask[:, end + 1 :] = False
+        return mask
+
+    def filter(
+        self,
+        expression: str,
+        vf_min: float | None = None,
+        vf_max: float | None = None,
+    ) -> list:
+        """Get every UD composite and interval of fiber volume fraction where a filter
+        expression holds, in the order of `names`. See ``mask`` for the expression.
+
+        : param `expression`: filter expression
+        : type: str
+        : param `vf_min`: start of fiber volume fraction window from 0 to 1 or None for
+            0. It is rounded off to two decimal places
+        : type: float | None
+        : param `vf_max`: inclusive end of fiber volume fraction window from 0 to 1 or
+            None for 1. It is rounded off to two decimal places
+        : type: float | None
+        : raise TypeError: If `expression` is not a str, or `vf_min` or `vf_max` is not
+            a number
+        : raise ValueError: If `expression` is malformed or has an unknown property, or
+            the window is not from 0 to 1 or its start is greater than its end
+        : return: (name, start Vf, inclusive end Vf) of every contiguous interval
+        : rtype: list[tuple[str, float, float]]
+        """
+        mask: np.ndarray = self.mask(expression, vf_min, vf_max)
+
+        # Find edges of every run of True along fiber volume fraction
+        edges: np.ndarray = np.diff(np.pad(mask.astype(np.int8), ((0, 0), (1, 1))))
+        rows, starts = np.nonzero(edges == 1)
+        ends: np.ndarray = np.nonzero(edges == -1)[1] - 1
+        vf: np.ndarray = HT._fiber_volfract_array
+        return [
+            (self._names[row], float(vf[first]), float(vf[last]))
+            for row, first, last in zip(rows.tolist(), starts.tolist(), ends.tolist())
+        ]
+
+    def _tokenize(self, expression: str) -> list:
+        """Split a filter expression into (kind, text) tokens.
+
+        Note: A helper function to ``mask`` method.
+
+        : param `expression`: filter expression
+        : type: str
+        : raise ValueError: If `expression` is empty or has an unknown character
+        : return: tokens of expression
+        : rtype: list[tuple[str, str]]
+        """
+        tokens: list = []
+        position: int = 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = ResultIndex._tokens.match(expression, position)
+            if match is None:
+                raise ValueError(
+                    f"Unexpected '{expression[position:].strip()}' in expression"
+                )
+            tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        if not tokens:
+            raise ValueError("Expect a non-empty expression")
+        return tokens
+
+    def _parse_or(self, tokens: list, position: int) -> tuple[int, np.ndarray]:
+        """Parse and evaluate comparisons joined by 'or'.
+
+        Note: A helper function to ``mask`` method.
+
+        : return: position after parsed tokens and flat mask
+        : rtype: tuple[int, np.ndarray]
+        """
+        position, mask = self._parse_and(tokens, position)
+        while position < len(tokens) and tokens[position] == ("logic", "or"):
+            position, other = self._parse_and(tokens, position + 1)
+            mask |= other
+        return position, mask
+
+    def _parse_and(self, tokens: list, position: int) -> tuple[int, np.ndarray]:
+        """Parse and evaluate comparisons joined by 'and'.
+
+        Note: A helper function to ``mask`` method.
+
+        : return: position after parsed tokens and flat mask
+        : rtype: tuple[int, np.ndarray]
+        """
+        position, mask = self._parse_comparison(tokens, position)
+        while position < len(tokens) and tokens[position] == ("logic", "and"):
+            position, other = self._parse_comparison(tokens, position + 1)
+            mask &= other
+        return position, mask
+
+    def _parse_comparison(self, tokens: list, position: int) -> tuple[int, np.ndarray]:
+        """Parse a parenthesized expression or a comparison of a property with a number,
+        and evaluate the comparison by binary search of the sorted index of property.
+
+        Note: A helper function to ``mask`` method.
+
+        : raise ValueError: If the comparison is malformed or its property is unknown
+        : return: position after parsed tokens and flat mask
+        : rtype: tuple[int, np.ndarray]
+        """
+        if position < len(tokens) and tokens[position] == ("paren", "("):
+            position, mask = self._parse_or(tokens, position + 1)
+            if position >= len(tokens) or tokens[position] != ("paren", ")"):
+                raise ValueError("Expect ')' to close '(' in expression")
+            return position + 1, mask
+        kinds: tuple = tuple(kind for kind, _ in tokens[position : position + 3])
+        if kinds != ("name", "op", "number"):
+            raise ValueError(
+                "Expect comparisons such as 'E1eff > 150' joined by 'and' or 'or'"
+            )
+        key, operator, number = (text for _, text in tokens[position : position + 3])
+        if key not in HT._row_headers:
+            raise ValueError(
+                "Expect properties to be 'E1eff', 'E2eff', 'G12eff', 'v12eff', "
+                + "'G23eff' or 'K23eff'"
+            )
+
+        # Select the run of sorted values that satisfies the comparison
+        row: int = HT._table_rows[key] - 1
+        values: np.ndarray = self._sorted[row]
+        value = float(number)
+        left: int = int(np.searchsorted(values, value, side="left"))
+        right: int = int(np.searchsorted(values, value, side="right"))
+        lower, upper = {
+            "<": (0, left),
+            "<=": (0, right),
+            ">": (right, len(values)),
+            ">=": (left, len(values)),
+            "==": (left, right),
+        }[operator]
+        mask: np.ndarray = np.zeros(len(values), dtype=bool)
+        mask[self._order[row, lower:upper]] = True
+        return position + 3, mask
+
+
+class NeighborIndex:
+    """
+    A class that represents a nearest-neighbor index of (UD composite, fiber volume
+    fraction) points by their effective elastic properties, e.g. to find the closest
+    replacements of a legacy material with known (E1*, E2*, G12*, v12*) across a whole
+    library. Every property is normalized by its range over all indexed points and
+    the points are held in a k-d tree with bounding boxes, searched best-first.
+    Composites inserted after the tree is built are scanned directly until they
+    exceed a quarter of the tree, when the tree is rebuilt, so insertion is
+    incremental at amortized O(log n) cost per point.
+
+    Attributes:
+
+    `names`: tuple[str, ...]
+        Names of all indexed UD composites in the order of insertion
+
+    `properties`: tuple[str, ...]
+        Effective elastic properties of every point, e.g. ('E1eff', 'E2eff')
+
+    Methods:
+
+    ``insert``:
+        Add every point of fiber volume fraction of one or more UD composites
+
+    ``nearest``:
+        Return the k points closest to a target property vector
+
+    ``within``:
+        Return every point within a radius of a target property vector
+
+    Example:
+        >>> index = NeighborIndex([composite_1, composite_2])
+        >>> index.nearest({"E1eff": 150, "E2eff": 9, "G12eff": 4, "v12eff": 0.29})
+        [('Carbon-Epoxy', 0.55, 0.07216590236367688)]
+        >>>
+    """
+
+    def __init__(
+        self,
+        composites: dict | list | tuple | None = None,
+        properties: list | tuple = ("E1eff", "E2eff", "G12eff", "v12eff"),
+        leaf_size: int = 32,
+    ) -> None:
+        """Constructor method
+
+        : param `composites`: UD composites keyed by name, e.g. the dict returned by
+            ``MaterialLibrary.composites``, a sequence of them indexed by their `name`,
+            or None for an empty index
+        : type: dict[str, ```HT```] | list[```HT```] | tuple[```HT```, ...] | None
+        : param `properties`: effective elastic properties of the vectors, i.e. several
+            of 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' and 'K23eff'. Default is
+            ('E1eff', 'E2eff', 'G12eff', 'v12eff')
+        : type: list | tuple
+        : param `leaf_size`: maximum number of points in a leaf of the tree. Default is
+            32
+        : type: int
+        : raise TypeError: If `composites` is not None nor a dict, list or tuple of
+            ```HT``` objects, `properties` is not a list or tuple, or `leaf_size` is
+            not an int
+        : raise ValueError: If any property is unknown, `leaf_size` is less than 1 or
+            names of UD composites in a sequence are not unique
+        """
+        # Check for TypeError and ValueError
+        if not isinstance(properties, list | tuple) or not properties:
+            raise TypeError("Expect properties to be a non-empty list or tuple")
+        if not isinstance(leaf_size, int) or isinstance(leaf_size, bool):
+            raise TypeError("Expect leaf_size to be an int object")
+        if leaf_size < 1:
+            raise ValueError("Expect leaf_size to be at least 1")
+
+        self._properties: tuple = HT._get_property_keys(properties)
+        self._rows: list = [HT._table_rows[key] for key in self._properties]
+        self._leaf_size: int = leaf_size
+        self._names: list = []
+        self._points: np.ndarray = np.empty((0, len(self._properties)))
+        self._size: int = 0
+        self._weights: np.ndarray = np.ones(len(self._properties))
+
+        # Tree over the first `_tree_size` points, stored in tree order
+        self._tree_size: int = 0
+        self._tree_order: np.ndarray = np.empty(0, dtype=np.intp)
+        self._tree_points: np.ndarray = self._points
+        self._nodes: np.ndarray = np.empty((0, 4), dtype=np.intp)
+        self._boxes: np.ndarray = np.empty((0, 2, len(self._properties)))
+        if composites is not None:
+            self.insert(composites)
+
+    def __len__(self) -> int:
+        """Get number of indexed points"""
+        return self._size
+
+    @property
+    def names(self) -> tuple:
+        """Get names of all indexed UD composites
+
+        : return: Names of UD composites
+        : rtype: tuple[str, ...]
+        """
+        return tuple(self._names)
+
+    @property
+    def properties(self) -> tuple:
+        """Get effective elastic properties of every point
+
+        : return: Properties of vectors
+        : rtype: tuple[str, ...]
+        """
+        return self._properties
+
+    def insert(self, composites: dict | list | tuple) -> None:
+        """Add every point of fiber volume fraction of one or more UD composites.
+
+        : param `composites`: UD composites keyed by name, or a sequence of them
+            indexed by their `name`
+        : type: dict[str, ```HT```] | list[```HT```] | tuple[```HT```, ...]
+        : raise TypeError: If `composites` is neither a dict, list nor tuple of
+            ```HT``` objects
+        : raise ValueError: If any name is already indexed or names of UD composites in
+            a sequence are not unique
+        : rtype: None
+        """
+        # Check for TypeError and ValueError
+        composites = _get_composites_by_name(composites)
+        indexed: set = set(self._names)
+        for name in composites:
+            if name in indexed:
+                raise ValueError(f"Composite '{name}' is already indexed")
+
+        # Append points to a buffer of doubling capacity
+        points: list = [
+            composite._get_table()[self._rows].T for composite in composites.values()
+        ]
+        if not points:
+            return
+        new_points: np.ndarray = np.concatenate(points)
+        if self._size + len(new_points) > len(self._points):
+            capacity: int = max(2 * len(self._points), self._size + len(new_points))
+            buffer: np.ndarray = np.empty((capacity, len(self._properties)))
+            buffer[: self._size] = self._points[: self._size]
+            self._points = buffer
+        self._points[self._size : self._size + len(new_points)] = new_points
+        self._size += len(new_points)
+        self._names += list(composites)
+
+        # Normalize by range over all points and rebuild tree once it lags behind
+        spread: np.ndarray = np.ptp(self._points[: self._size], axis=0)
+        self._weights = 1 / np.where(spread > 0, spread, 1)
+        if self._size - self._tree_size > max(self._tree_size // 4, self._leaf_size):
+            self._build()
+
+    def nearest(self, target: dict | list | tuple, k: int = 1) -> list:
+        """Get the `k` points closest to a target property vector by normalized
+        Euclidean distance.
+
+        : param `target`: value of every property keyed by property, or in the order
+            of `properties`
+        : type: dict | list | tuple
+        : param `k`: number of points. Default is 1
+        : type: int
+        : raise TypeError: If `target` is not a dict, list or tuple of numbers, or `k`
+            is not an int
+        : raise ValueError: If `target` does not match `properties` or `k` is less
+            than 1
+        : return: (name, Vf, distance) of every point, closest first
+        : rtype: list[tuple[str, float, float]]
+        """
+        # Check for TypeError and ValueError
+        query: np.ndarray = self._get_target(target)
+        if not isinstance(k, int) or isinstance(k, bool):
+            raise TypeError("Expect k to be an int object")
+        if k < 1:
+            raise ValueError("Expect k to be at least 1")
+
+        # Seed with points not yet in tree, then search tree best-first
+        found: tuple = self._scan(np.arange(self._tree_size, self._size), query)
+        found = self._keep_nearest(found, k)
+        heap: list = [(0.0, 0)] if self._tree_size else []
+        while heap:
+            bound, node = heapq.heappop(heap)
+            if len(found[0]) == k and bound > found[1][-1]:
+                break
+            start, end, left, right = self._nodes[node]
+            if left < 0:
+                leaf: tuple = self._scan_leaf(start, end, query)
+                found = self._keep_nearest(
+                    (
+                        np.concatenate((found[0], leaf[0])),
+                        np.concatenate((found[1], leaf[1])),
+                    ),
+                    k,
+                )
+            else:
+                for child in (left, right):
+                    heapq.heappush(heap, (self._box_distance(child, query), child))
+        return self._get_hits(found)
+
+    def within(self, target: dict | list | tuple, radius: float) -> list:
+        """Get every point within a normalized Euclidean distance of a target property
+        vector.
+
+        : param `target`: value of every property keyed by property, or in the order
+            of `properties`
+        : type: dict | list | tuple
+        : param `radius`: normalized distance
+        : type: float
+        : raise TypeError: If `target` is not a dict, list or tuple of numbers, or
+            `radius` is not a number
+        : raise ValueError: If `target` does not match `properties` or `radius` is
+            negative
+        : return: (name, Vf, distance) of every point, closest first
+        : rtype: list[tuple[str, float, float]]
+        """
+        # Check for TypeError and ValueError
+        query: np.ndarray = self._get_target(target)
+        if not isinstance(radius, int | float) or isinstance(radius, bool):
+            raise TypeError("Expect radius to be a number")
+        if radius < 0:
+            raise ValueError("Expect radius to be zero or positive")
+
+        # Collect points of every node whose box is within radius
+        parts: list = [self._scan(np.arange(self._tree_size, self._size), query)]
+        stack: list = [0] if self._tree_size else []
+        while stack:
+            node: int = stack.pop()
+            if self._box_distance(node, query) > radius:
+                continue
+            start, end, left, right = self._nodes[node]
+            if left < 0:
+                parts.append(self._scan_leaf(start, end, query))
+            else:
+                stack += [left, right]
+        indices: np.ndarray = np.concatenate([part[0] for part in parts])
+        distances: np.ndarray = np.concatenate([part[1] for part in parts])
+        inside: np.ndarray = distances <= radius
+        order: np.ndarray = np.argsort(distances[inside], kind="stable")
+        return self._get_hits((indices[inside][order], distances[inside][order]))
+
+    def _build(self) -> None:
+        """Build k-d tree of all points, where every node splits its points at the
+        median of the dimension of largest normalized spread and holds their bounding
+        box.
+
+        Note: A helper function to ``insert`` method.
+
+        : rtype: None
+        """
+        points: np.ndarray = self._points[: self._size]
+        order: np.ndarray = np.arange(self._size)
+        nodes: list = []
+        boxes: list = []
+        stack: list = [(0, self._size, -1, 0)]
+        while stack:
+            start, end, parent, side = stack.pop()
+            node: int = len(nodes)
+            if parent >= 0:
+                nodes[parent][2 + side] = node
+            members: np.ndarray = points[order[start:end]]
+            box: np.ndarray = np.array((members.min(axis=0), members.max(axis=0)))
+            nodes.append([start, end, -1, -1])
+            boxes.append(box)
+            if end - start > self._leaf_size:
+                axis: int = int(np.argmax((box[1] - box[0]) * self._weights))
+                middle: int = (start + end) // 2
+                split: np.ndarray = np.argpartition(members[:, axis], middle - start)
+                order[start:end] = order[start:end][split]
+                stack += [(middle, end, node, 1), (start, middle, node, 0)]
+        self._tree_size = self._size
+        self._tree_order = order
+        self._tree_points = points[order]
+        self._nodes = np.array(nodes, dtype=np.intp)
+        self._boxes = np.array(boxes)
+
+    def _get_target(self, target: dict | list | tuple) -> np.ndarray:
+        """Validate a target property vector.
+
+        Note: A helper function to ``nearest`` and ``within`` methods.
+
+        : raise TypeError: If `target` is not a dict, list or tuple of numbers
+        : raise ValueError: If `target` does not match `properties`
+        : return: target vector in the order of `properties`
+        : rtype: np.ndarray
+        """
+        if isinstance(target, dict):
+            if set(target) != set(self._properties):
+                raise ValueError(f"Expect target of properties {self._properties}")
+            target = [target[key] for key in self._properties]
+        if not isinstance(target, list | tuple):
+            raise TypeError("Expect target to be a dict, list or tuple object")
+        query: np.ndarray = _get_float_array(target, "target")
+        if len(query) != len(self._properties):
+            raise ValueError(f"Expect target of properties {self._properties}")
+        return query
+
+    def _scan(self, indices: np.ndarray, query: np.ndarray) -> tuple:
+        """Compute normalized distances of points in insertion order.
+
+        : return: indices and distances of points
+        : rtype: tuple[np.ndarray, np.ndarray]
+        """
+        differences: np.ndarray = (self._points[indices] - query) * self._weights
+        return indices, np.sqrt(np.einsum("ij,ij->i", differences, differences))
+
+    def _scan_leaf(self, start: int, end: int, query: np.ndarray) -> tuple:
+        """Compute normalized distances of points of a leaf of tree.
+
+        : return: indices and distances of points
+        : rtype: tuple[np.ndarray, np.ndarray]
+        """
+        differences: np.ndarray = (self._tree_points[start:end] - query) * self._weights
+        return (
+            self._tree_order[start:end],
+            np.sqrt(np.einsum("ij,ij->i", differences, differences)),
+        )
+
+    def _box_distance(self, node: int, query: np.ndarray) -> float:
+        """Compute normalized distance of a query to the bounding box of a node.
+
+        : return: lower bound of distance of every point in node
+        : rtype: float
+        """
+        lower, upper = self._boxes[node]
+        gaps: np.ndarray = (
+            np.maximum(lower - query, 0) + np.maximum(query - upper, 0)
+        ) * self._weights
+        return float(np.sqrt(gaps @ gaps))
+
+    @staticmethod
+    def _keep_nearest(found: tuple, k: int) -> tuple:
+        """Keep the `k` closest of found points, sorted by distance.
+
+        : return: indices and distances of points
+        : rtype: tuple[np.ndarray, np.ndarray]
+        """
+        indices, distances = found
+        if len(distances) > k:
+            keep: np.ndarray = np.argpartition(distances, k - 1)[:k]
+            indices, distances = indices[keep], distances[keep]
+        order: np.ndarray = np.argsort(distances, kind="stable")
+        return indices[order], distances[order]
+
+    def _get_hits(self, found: tuple) -> list:
+        """Map indices of points to names of composites and fiber volume fractions.
+
+        : return: (name, Vf, distance) of every point
+        : rtype: list[tuple[str, float, float]]
+        """
+        size: int = len(HT._fiber_volfract_array)
+        return [
+            (
+                self._names[index // size],
+                float(HT._fiber_volfract_array[index % size]),
+                distance,
+            )
+            for index, distance in zip(found[0].tolist(), found[1].tolist())
+        ]
+
+
+class ResultStore:
+    """
+    A class that represents an on-disk store of effective elastic properties of a
+    library of UD composites, made up from a fixed-layout binary file of shape
+    (number of UD composites, 7, 101), i.e. composite x `table` of ```HT```, and an
+    index file of names and elastic constants of fibers and matrices. The binary file
+    is opened with ``numpy.memmap`` so that a new session starts instantly and every
+    query reads only the slices it touches, with zero copy.
+
+    The files of a store at `path` are "'path'.npy" and "'path'.json".
+
+    Attributes:
+
+    `path`: str
+        Path of store without file extension
+
+    `names`: tuple[str, ...]
+        Names of UD composites in the order of the binary file
+
+    `data`: np.ndarray
+        Read-only memory-mapped array of shape (number of UD composites, 7, 101)
+
+    Methods:
+
+    ``create``:
+        ``@classmethod``: Write a store of UD composites and open it
+
+    ``table``:
+        Return zero-copy `table` of a UD composite
+
+    ``composites``:
+        Return ```StoredHT``` objects of UD composites for ``display``, ``compare``,
+        ``plot`` and the other functions that accept ```HT``` objects
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open an existing store.
+
+        : param `path`: path of store without file extension
+        : type: str
+        : raise TypeError: If `path` is not a str
+        : raise FileNotFoundError: If any file of store does not exist
+        : raise ValueError: If binary file does not hold the layout of the index file or
+            the grid of fiber volume fraction of ```HT```
+        : rtype: None
+
+        Example:
+            >>> store = ResultStore("results/library")
+            >>> display(store["Carbon-Epoxy"], 0.5)
+            >>>
+        """
+        # Check for TypeError
+        if not isinstance(path, str):
+            raise TypeError("Expect path to be a str object")
+
+        with open(f"{path}.json", "r") as file:
+            index: dict = json.load(file)
+        self._path: str = path
+        self._names: tuple = tuple(index["names"])
+        self._records: dict = {phase: index[phase] for phase in ("fibers", "matrices")}
+        self._index: dict = {name: i for i, name in enumerate(self._names)}
+        self._data: np.ndarray = np.load(f"{path}.npy", mmap_mode="r")
+        self._composites: dict = {}
+
+        # Check for ValueError
+        shape: tuple = (len(self._names), len(HT._table_rows), len(HT._fiber_volfract))
+        if self._data.shape != shape:
+            raise ValueError(f"Expect store {path} to hold every UD composite of index")
+        if len(self._names) and not np.array_equal(
+            self._data[0, 0], HT._fiber_volfract_array
+        ):
+            raise ValueError(
+                f"Expect store {path} on the grid of fiber volume fraction"
+            )
+
+    def __len__(self) -> int:
+        """
+        : return: number of UD composites
+        : rtype: int
+        """
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        """
+        : return: True if a UD composite of `name` is in store
+        : rtype: bool
+        """
+        return name in self._index
+
+    def __getitem__(self, name: str) -> StoredHT:
+        """Get a stored UD composite by name
+
+        : param `name`: name of UD composite
+        : type: str
+        : raise KeyError: If no UD composite of `name` is in store
+        : return: stored UD composite
+        : rtype: ```StoredHT```
+        """
+        position: int = self._index[name]
+        if position not in self._composites:
+            self._composites[position] = StoredHT(self, position)
+        return self._composites[position]
+
+    @property
+    def path(self) -> str:
+        """Get read-only path of store without file extension
+
+        : return: path of store
+        : rtype: str
+        """
+        return self._path
+
+    @property
+    def names(self) -> tuple:
+        """Get read-only names of UD composites
+
+        : return: names in the order of binary file
+        : rtype: tuple[str, ...]
+        """
+        return self._names
 
-        # Compute effective property
-        effective_pstrain_bulk_moduli: list[Decimal] = []
-        for vf in HT._fiber_volfract:
-            effective_pstrain_bulk_moduli.append(
-                (
-                    (
-                        matrix_pstrain_bulk_modulus
-                        * (fiber_pstrain_bulk_modulus + matrix_transverse_shear_modulus)
-                        * (Decimal("1.000") - vf)
-                        + fiber_pstrain_bulk_modulus
-                        * (
-                            matrix_pstrain_bulk_modulus
-                            + matrix_transverse_shear_modulus
-                        )
-                        * vf
-                    )
-                    / (
-                        (fiber_pstrain_bulk_modulus + matrix_transverse_shear_modulus)
-                        * (Decimal("1.000") - vf)
-                        + (
-                            matrix_pstrain_bulk_modulus
-                            + matrix_transverse_shear_modulus
-                        )
-                        * vf
-                    )
-                ).quantize(Decimal("1.000"))
-            )
+    @property
+    def data(self) -> np.ndarray:
+        """Get read-only memory-mapped array of all UD composites
 
-        # Return effective property
-        return tuple(effective_pstrain_bulk_moduli)
+        : return: array of shape (number of UD composites, 7, 101)
+        : rtype: np.ndarray
+        """
+        return self._data
 
-    def _estimate_G23eff(self) -> tuple[Decimal, ...]:
-        """Compute the effective transverse shear moduli of UD composite using
-        Halpin-Tsai micromechanics formula that depends on the value of `shear_modulus`
-        and/or `transverse_shear_modulus` provided by instance attributes of `fiber` and
-        `matrix`, and also on the values of fiber volume fraction provided by the tuple
-        of `fiber_volfract`. The computed values are then initialized to a class
-        instance attribute - `eff_transverse_shear_moduli`.
+    @classmethod
+    def create(cls, path: str, composites: dict | list | tuple) -> "ResultStore":
+        """Write the effective elastic properties and the elastic constants of fibers and
+        matrices of UD composites to a store and open it.
 
-        : raise TypeError: if `fiber` and `matrix` is None or neither ```Isotropic```
-            nor ```Transtropic```
-        : return: The computed effective transverse shear moduli by Halpin-Tsai
-            micromechanics method
-        : rtype: tuple[Decimal, ...]
+        : param `path`: path of store without file extension, whose folder is created
+            if it does not exist
+        : type: str
+        : param `composites`: ```HT``` objects, e.g. ``MaterialLibrary.composites``, or
+            a sequence of them indexed by their `name`
+        : type: dict | list | tuple
+        : raise TypeError: If `path` is not a str, or `composites` is not a dict, list
+            or tuple of ```HT``` objects
+        : raise ValueError: If names of UD composites are not unique
+        : return: opened store
+        : rtype: ```ResultStore```
+
+        Example:
+            >>> store = ResultStore.create("results/library", library.composites(epoxy))
+            >>> len(store)
+            12
             >>>
         """
-        # Get fiber plane-strain bulk modulus and transverse shear modulus
-        if isinstance(self.fiber, Isotropic):
-            fiber_transverse_shear_modulus: Decimal = self.fiber.shear_modulus
-        else:
-            fiber_transverse_shear_modulus = self.fiber.transverse_shear_modulus
-        # Get matrix plane-strain bulk modulus and transverse shear modulus
-        if isinstance(self.matrix, Isotropic):
-            matrix_pstrain_bulk_modulus: Decimal = self.matrix.pstrain_bulk_modulus
-            matrix_transverse_shear_modulus: Decimal = self.matrix.shear_modulus
-        else:
-            matrix_pstrain_bulk_modulus = self.matrix.pstrain_bulk_modulus
-            matrix_transverse_shear_modulus = self.matrix.transverse_shear_modulus
+        # Check for TypeError and ValueError
+        if not isinstance(path, str):
+            raise TypeError("Expect path to be a str object")
+        if not isinstance(composites, dict | list | tuple):
+            raise TypeError("Expect composites to be a dict, list or tuple object")
+        materials: list = list(
+            composites.values() if isinstance(composites, dict) else composites
+        )
+        for material in materials:
+            if not isinstance(material, HT):
+                raise TypeError("Expect UD composites of 'HT' object")
+        names: list = (
+            [str(name) for name in composites]
+            if isinstance(composites, dict)
+            else [material.name for material in materials]
+        )
+        if len(set(names)) != len(names):
+            raise ValueError("Expect names of UD composites to be unique")
+
+        # Write binary file of all tables, one UD composite at a time
+        folder: str = os.path.dirname(path)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        data: np.ndarray = np.lib.format.open_memmap(
+            f"{path}.npy",
+            mode="w+",
+            dtype=float,
+            shape=(len(materials), len(HT._table_rows), len(HT._fiber_volfract)),
+        )
+        for position, material in enumerate(materials):
+            data[position] = material._get_table()
+        data.flush()
+        del data
+
+        # Write index file of names and records of constituents
+        index: dict = {
+            "names": names,
+            "fibers": [_get_constituent_record(item.fiber) for item in materials],
+            "matrices": [_get_constituent_record(item.matrix) for item in materials],
+        }
+        with open(f"{path}.json", "w") as file:
+            json.dump(index, file)
 
-        # Compute effective property
-        effective_transverse_shear_moduli: list[Decimal] = []
-        for vf in HT._fiber_volfract:
-            effective_transverse_shear_moduli.append(
-                (
-                    (
-                        matrix_transverse_shear_modulus
-                        * (
-                            Decimal("2.000")
-                            * vf
-                            * fiber_transverse_shear_modulus
-                            * (
-                                matrix_pstrain_bulk_modulus
-                                + matrix_transverse_shear_modulus
-                            )
-                            + Decimal("2.000")
-                            * (Decimal("1.000") - vf)
-                            * fiber_transverse_shear_modulus
-                            * matrix_transverse_shear_modulus
-                            + (Decimal("1.000") - vf)
-                            * matrix_pstrain_bulk_modulus
-                            * (
-                                fiber_transverse_shear_modulus
-                                + matrix_transverse_shear_modulus
-                            )
-                        )
-                    )
-                    / (
-                        Decimal("2")
-                        * vf
-                        * matrix_transverse_shear_modulus
-                        * (
-                            matrix_pstrain_bulk_modulus
-                            + matrix_transverse_shear_modulus
-                        )
-                        + Decimal("2")
-                        * (Decimal("1") - vf)
-                        * fiber_transverse_shear_modulus
-                        * matrix_transverse_shear_modulus
-                        + (Decimal("1") - vf)
-                        * matrix_pstrain_bulk_modulus
-                        * (
-                            fiber_transverse_shear_modulus
-                            + matrix_transverse_shear_modulus
-                        )
-                    )
-                ).quantize(Decimal("1.000"))
-            )
+        # Return opened store
+        return cls(path)
 
-        # Return effective property
-        return tuple(effective_transverse_shear_moduli)
+    def table(self, name: str) -> np.ndarray:
+        """Get zero-copy `table` of a UD composite from memory-mapped file.
 
-    def _estimate_E2eff(self) -> tuple[Decimal, ...]:
-        """Compute the effective transverse Young's modulus of UD composite, i.e. ```HT```
-        object using transversely-isotropic formula that depends on the values of
-        other computed effective properties, e.g. `eff_axial_youngs_moduli`,
-        `eff_pstrain_bulk_moduli`, `eff_transverse_shear_moduli` and
-        `eff_major_poissons_ratios` of ```HT``` instantiated object and of course, on
-        the values of fiber volume fraction provided by the tuple of `fiber_volfract`
-        as well. The computed effective elastic property is then initialized to
-        a class attribute `eff_transverse_youngs_moduli`.
+        : param `name`: name of UD composite
+        : type: str
+        : raise KeyError: If no UD composite of `name` is in store
+        : return: read-only table of shape (7, 101)
+        : rtype: np.ndarray
+        """
+        return self._data[self._index[name]]
 
-        : raise TypeError: if `fiber` and `matrix` is None or neither ```Isotropic```
-            nor ```Transtropic```
-        : return: The computed effective transverse shear moduli by Halpin-Tsai
-            micromechanics method
-        : rtype: tuple[Decimal]
+    def composites(self, names: list | tuple | None = None) -> tuple:
+        """Get stored UD composites.
+
+        : param `names`: names of UD composites or None for all of them
+        : type: list | tuple | None
+        : raise KeyError: If any name is not in store
+        : return: stored UD composites
+        : rtype: tuple[```StoredHT```, ...]
         """
-        # Compute effective transverse Young's moduli, E2*
-        return tuple(
-            map(
-                lambda tuple1, tuple2, tuple3, tuple4: (
-                    (Decimal("4.000") * tuple1 * tuple2)
-                    / (
-                        tuple2
-                        + tuple1
-                        + (Decimal("4.000") * tuple3**2 * tuple1 * tuple2) / tuple4
-                    )
-                ).quantize(Decimal("1.000")),
-                self.eff_transverse_shear_moduli,
-                self.eff_pstrain_bulk_moduli,
-                self.eff_major_poissons_ratios,
-                self.eff_axial_youngs_moduli,
-            )
-        )
+        return tuple(self[name] for name in (self._names if names is None else names))
 
-    @staticmethod
-    def __get_index_num(start: float | None = None, end: float | None = None) -> tuple:
-        """Get the index number of a tuple that has 101 element. Basicall, this method
-        is called by other instance methods such as ``E1eff``, ``E2eff``, ``G12eff``,
-        ``v12eff``, ``K23eff``, and ``G23eff`` when user requests to get the value/s of
-        effective property at specific fiber volume fraction or at specific range of
-        fiber volume fraction. This method will then identify the index number/s of the
-        requested fiber volume fraction/s in the `fiber_volfract` tuple so that it or
-        they can be used to cross-reference and fetch the desired value/s of effective
-        property that has the same tuple size as the size of `fiber_volfract` tuple.
+    def _get_constituent(self, position: int, phase: str) -> Isotropic | Transtropic:
+        """Instantiate fiber or matrix of a UD composite from its stored record.
 
-        : param `start`: specific volume fraction of fiber for a single value or the
-            start of fiber volume fraction range
-        : type: float | None
-        : param `end`: the end of fiber volume fraction range (inclusive) or None if
-            specific fiber volume fraction is desired by user
-        : type: float | None
-        : raise TypeError and ValueError: if first argument - `start` is None, not a
-            ```float``` type number or its value does not lie between 0 and 1, and also
-            if second argument if provided by user is None, not a ```float``` type
-            number or its value is lesser than the value of first argument or not in
-            between 0 and 1.
-        : return: index number or index numbers of a tuple of size 100.
-        : rtype: tuple[int]
+        : param `position`: position of UD composite in store
+        : type: int
+        : param `phase`: 'fiber' or 'matrix'
+        : type: str
+        : return: fiber or matrix
+        : rtype: ```Isotropic``` | ```Transtropic```
         """
-        if start is None or not isinstance(start, float):
+        type_name, name, constants = self._records[
+            "fibers" if phase == "fiber" else "matrices"
+        ][position]
+        return _get_constituent_from_record(type_name, name, np.array(constants))
+
+
+def _get_composites_by_name(composites: dict | list | tuple) -> dict:
+    """Validate UD composites keyed by name or given as a sequence of them indexed by
+    their `name`, where no UD composite of a sequence is dropped for sharing its name,
+    e.g. ```HybridHT``` objects that differ only in hybrid ratio.
+
+    Note: A helper function to ```ResultIndex```, ```NeighborIndex``` and
+    ``save_npz`` function.
+
+    : param `composites`: UD composites keyed by name or a sequence of them
+    : type: dict[str, ```HT```] | list[```HT```] | tuple[```HT```, ...]
+    : raise TypeError: If `composites` is neither a dict, list nor tuple of ```HT```
+        objects
+    : raise ValueError: If names of UD composites in a sequence are not unique
+    : return: UD composites keyed by name
+    : rtype: dict[str, ```HT```]
+    """
+    # Check for TypeError
+    message: str = "Expect composites to be a dict, list or tuple of 'HT' objects"
+    if not isinstance(composites, dict | list | tuple):
+        raise TypeError(message)
+    if isinstance(composites, dict):
+        if not all(isinstance(composite, HT) for composite in composites.values()):
+            raise TypeError(message)
+        return composites
+    if not all(isinstance(composite, HT) for composite in composites):
+        raise TypeError(message)
+
+    # Check for ValueError
+    named: dict = {composite.name: composite for composite in composites}
+    if len(named) != len(composites):
+        raise ValueError("Expect names of UD composites to be unique")
+    return named
+
+
+def _get_float_array(values: list | tuple | np.ndarray, name: str) -> np.ndarray:
+    """Convert a user-defined sequence of numbers into a one-dimensional float array
+    for vectorized analysis.
+
+    Note: A helper function to the vectorized analysis methods of ```HT```.
+
+    : param `values`: Sequence of numbers, e.g. temperatures or void contents
+    : type: list | tuple | np.ndarray
+    : param `name`: Name of the values used in error messages
+    : type: str
+    : raise TypeError: If `values` is None, a str, or not a sequence of numbers
+    : raise ValueError: If `values` is empty or contains non-finite numbers
+    : return: One-dimensional float array of values
+    : rtype: np.ndarray
+    """
+    # Check for TypeError
+    if values is None or isinstance(values, str):
+        raise TypeError(f"Expected {name} to be a sequence of numbers")
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iuf":
+        array: np.ndarray = values.astype(float).ravel()
+    else:
+        try:
+            array = np.asarray(
+                [float(value) for value in np.ravel(values)], dtype=float
+            )
+        except (TypeError, ValueError):
+            raise TypeError(f"Expected {name} to be a sequence of numbers")
+
+    # Check for ValueError
+    if array.size == 0:
+        raise ValueError(f"Expected at least one value of {name}")
+    if not np.all(np.isfinite(array)):
+        raise ValueError(f"Expected {name} to be finite numbers")
+
+    # Return float array
+    return array
+
+
+def _get_temperature_rows(
+    temperature_table: dict | None, kinds: tuple[str, ...]
+) -> tuple:
+    """Validate a table of elastic constants versus temperature and return its rows
+    sorted by temperature.
+
+    Note: A helper function to the `temperature_table` setters of ```Isotropic``` and
+    ```Transtropic```.
+
+    : param `temperature_table`: Elastic constants of constituent versus temperature
+        or None when constituent is not temperature-dependent
+    : type: dict | None
+    : param `kinds`: Kind of every elastic constant, i.e. "constant" for moduli
+        validated by ``Isotropic._isvalid_constant`` or "ratio" for Poisson's ratio
+        validated by ``Isotropic._isvalid_ratio``
+    : type: tuple[str, ...]
+    : raise TypeError: If table is not a dict or its values are not tuples with as
+        many elastic constants as `kinds`
+    : raise ValueError: If table is empty, or any temperature or elastic constant is
+        invalid
+    : return: Rows of temperature followed by its elastic constants
+    : rtype: tuple[tuple[Decimal, ...], ...]
+    """
+    # No temperature-dependent elastic constants
+    if temperature_table is None:
+        return ()
+
+    # Check for TypeError and ValueError
+    if not isinstance(temperature_table, dict):
+        raise TypeError(
+            "Expected temperature table to be a dict of temperature and elastic "
+            + "constants"
+        )
+    if len(temperature_table) == 0:
+        raise ValueError("Expected at least one temperature in temperature table")
+
+    # Validate every temperature and its elastic constants
+    rows: list = []
+    for temperature, constants in temperature_table.items():
+        try:
+            temperature = Decimal(str(temperature).strip())
+        except InvalidOperation:
+            raise ValueError("Missing or invalid temperature value")
+        if not temperature.is_finite():
+            raise ValueError("Missing or invalid temperature value")
+        if not isinstance(constants, tuple | list) or len(constants) != len(kinds):
             raise TypeError(
-                "Expected fiber volume fraction value for first argument to be 'float' "
-                + "type number"
+                "Expected every temperature to map to a tuple of "
+                + f"{len(kinds)} elastic constants"
             )
-        if start < 0 or start > 1:
-            raise ValueError("Expected fiber volume fraction to be from 0 to 1")
-        if end is not None:
-            if not isinstance(end, float):
-                raise TypeError("Expected second argument to be a 'float' type number")
-            if end < 0 or end > 1 or end <= start:
+        row: list = [temperature.quantize(Decimal("1.000"))]
+        for kind, constant in zip(kinds, constants):
+            if kind == "ratio" and not Isotropic._isvalid_ratio(str(constant)):
                 raise ValueError(
-                    "Expected value for second argument to be in between 0 and 1 and "
-                    + "should be greater than value in the first argument"
+                    "Missing or invalid Poisson's ratio value (0 < v < 0.5 )"
                 )
-            start = HT._fiber_volfract.index(
-                Decimal(round(start, 2)).quantize(Decimal("1.000"))
-            )
-            end = HT._fiber_volfract.index(
-                Decimal(round(end, 2)).quantize(Decimal("1.000"))
-            )
-            return (start, end)
-        else:
-            start = HT._fiber_volfract.index(
-                Decimal(round(start, 2)).quantize(Decimal("1.000"))
-            )
-            return (start, end)
+            if kind == "constant" and not Isotropic._isvalid_constant(str(constant)):
+                raise ValueError("Missing or invalid elastic modulus value (E > 0)")
+            row.append(Decimal(str(constant)).quantize(Decimal("1.000")))
+        rows.append(tuple(row))
+
+    # Return rows sorted by temperature
+    return tuple(sorted(rows))
+
+
+def _interpolate_temperature_rows(rows: tuple, temperatures: np.ndarray) -> list:
+    """Linearly interpolate every elastic constant of a temperature table at the
+    given temperatures, where the elastic constants beyond the first and last row of
+    the table are kept constant.
+
+    Note: A helper function to ``_get_elastic_constants`` of ```Isotropic``` and
+    ```Transtropic```.
+
+    : param `rows`: Rows of temperature followed by its elastic constants
+    : type: tuple[tuple[Decimal, ...], ...]
+    : param `temperatures`: Temperatures where elastic constants are interpolated
+    : type: np.ndarray
+    : return: One float array per elastic constant with the same shape as
+        `temperatures`
+    : rtype: list[np.ndarray]
+    """
+    table: np.ndarray = np.array(rows, dtype=float)
+    return [
+        np.interp(temperatures, table[:, 0], table[:, column])
+        for column in range(1, table.shape[1])
+    ]
+
+
+def _halpin_tsai(
+    fiber_constants: tuple | list, matrix_constants: tuple | list, vf: np.ndarray
+) -> dict:
+    """Compute the six effective elastic properties of UD composite with the same
+    Halpin-Tsai and transversely-isotropic formulae as ```HT``` but vectorized on
+    float arrays, where every elastic constant and the fiber volume fraction are
+    broadcast together, e.g. elastic constants of shape (n, 1) and fiber volume
+    fraction of shape (101,) give effective properties of shape (n, 101).
+
+    Note: A helper function to the vectorized analysis methods of ```HT```.
+
+    : param `fiber_constants`: Fiber's axial Young's modulus, major Poisson's ratio,
+        axial shear modulus, transverse shear modulus and plane-strain bulk modulus
+    : type: tuple | list
+    : param `matrix_constants`: Matrix's elastic constants in the same order
+    : type: tuple | list
+    : param `vf`: Fiber volume fraction
+    : type: np.ndarray
+    : return: Effective elastic properties 'E1eff', 'E2eff', 'G12eff', 'v12eff',
+        'G23eff' and 'K23eff' as float arrays
+    : rtype: dict
+    """
+    # Unpack elastic constants of fiber and matrix
+    Ef, vf12, Gf12, Gf23, Kf = fiber_constants
+    Em, vm12, Gm12, Gm23, Km = matrix_constants
+    vm = 1.0 - vf
+
+    # Compute effective properties by Halpin-Tsai formulae
+    E1eff = Ef * vf + Em * vm
+    v12eff = vf12 * vf + vm12 * vm
+    G12eff = ((Gf12 + Gm12) * Gm12 * vm + 2.0 * Gf12 * Gm12 * vf) / (
+        (Gf12 + Gm12) * vm + 2.0 * Gm12 * vf
+    )
+    K23eff = (Km * (Kf + Gm23) * vm + Kf * (Km + Gm23) * vf) / (
+        (Kf + Gm23) * vm + (Km + Gm23) * vf
+    )
+    G23eff = (
+        Gm23
+        * (
+            2.0 * vf * Gf23 * (Km + Gm23)
+            + 2.0 * vm * Gf23 * Gm23
+            + vm * Km * (Gf23 + Gm23)
+        )
+        / (
+            2.0 * vf * Gm23 * (Km + Gm23)
+            + 2.0 * vm * Gf23 * Gm23
+            + vm * Km * (Gf23 + Gm23)
+        )
+    )
+
+    # Return effective properties in the order of display
+    return {
+        "E1eff": E1eff,
+        "E2eff": _get_transverse_youngs_moduli(E1eff, v12eff, G23eff, K23eff),
+        "G12eff": G12eff,
+        "v12eff": v12eff,
+        "G23eff": G23eff,
+        "K23eff": K23eff,
+    }
+
+
+def _get_porous_matrix_constants(
+    matrix_constants: tuple | list, void_contents: np.ndarray
+) -> list:
+    """Degrade the elastic constants of matrix by void contents, where the voids are
+    treated as inclusions of zero stiffness mixed with the matrix by ``_halpin_tsai``
+    and the Poisson's ratio of matrix is kept unchanged.
+
+    Note: A helper function to ``HT.void_sweep``.
+
+    : param `matrix_constants`: Matrix's axial Young's modulus, major Poisson's ratio,
+        axial shear modulus, transverse shear modulus and plane-strain bulk modulus
+    : type: tuple | list
+    : param `void_contents`: Void contents, 0 <= Vv < 1
+    : type: np.ndarray
+    : return: Elastic constants of porous matrix in the same order, each with the
+        same shape as `void_contents`
+    : rtype: list[np.ndarray]
+    """
+    # Voids carry no stiffness but keep the Poisson's ratio of matrix
+    void_constants: tuple = (0.0, matrix_constants[1], 0.0, 0.0, 0.0)
+    porous: dict = _halpin_tsai(void_constants, matrix_constants, void_contents)
+    return [
+        porous["E1eff"],
+        np.broadcast_to(porous["v12eff"], void_contents.shape),
+        porous["G12eff"],
+        porous["G23eff"],
+        porous["K23eff"],
+    ]
+
+
+def _get_transverse_youngs_moduli(
+    E1eff: np.ndarray, v12eff: np.ndarray, G23eff: np.ndarray, K23eff: np.ndarray
+) -> np.ndarray:
+    """Compute effective transverse Young's moduli from the other effective elastic
+    properties with the same transversely-isotropic formula as ``HT._estimate_E2eff``.
+
+    Note: A helper function to ``_halpin_tsai``.
+
+    : param `E1eff`: Effective axial Young's moduli
+    : type: np.ndarray
+    : param `v12eff`: Effective major Poisson's ratios
+    : type: np.ndarray
+    : param `G23eff`: Effective transverse shear moduli
+    : type: np.ndarray
+    : param `K23eff`: Effective plane-strain bulk moduli
+    : type: np.ndarray
+    : return: Effective transverse Young's moduli
+    : rtype: np.ndarray
+    """
+    return (4.0 * G23eff * K23eff) / (
+        K23eff + G23eff + (4.0 * v12eff**2 * G23eff * K23eff) / E1eff
+    )
 
 
 def main():
@@ -3470,7 +6656,10 @@ def main():
 
 
 def display(
-    material: HT, min: int | float | None = None, max: int | float | None = None
+    material: HT,
+    min: int | float | None = None,
+    max: int | float | None = None,
+    pager: bool = False,
 ) -> None:
     """Major Function:
     Print to screen A) constituent's elastic properties of UD composite, and B) the
@@ -3486,7 +6675,11 @@ def display(
     : param `max`: The maximum inclusive value of fiber volume fraction range or None
         when only specific value of fiber volume fraction is defined
     : type: int | float | None
-    : raise TypeError: When first argument, material is None or not HT type
+    : param `pager`: True to stream the output through the system pager, e.g. less,
+        for interactive use. Default is False. It is ignored in ``quiet`` mode
+    : type: bool
+    : raise TypeError: When first argument, material is None or not HT type, or when
+        pager is not a bool
     : raise ValueError: When min is None while max is not None, or when both min and max
         are not None but their values are not in between 0 and 1 and also, when value of
         min is greater than max value.
@@ -3826,104 +7019,59 @@ def display(
     # Check for TypeError
     if material is None or not isinstance(material, HT):
         raise TypeError("The first argument must be HT object of UD composite")
+    if not isinstance(pager, bool):
+        raise TypeError("Expect pager to be a bool object")
+    start, end = HT._vf_index.window(min, max)
+
+    # Stream the output through the system pager
+    if pager and _output_buffer is None:
+        with _paged():
+            display(material, min, max)
+        return
 
     # Get and print main title
-    print(_get_main_title_for_UD_composite(material))
+    _emit(_get_main_title_for_UD_composite(material))
 
     # Get fiber and matrix properties
     constituent_properties = _get_fiber_and_matrix_properties(material)
 
     # Get and print fiber's sub-title
-    print(_get_sub_title_for_fiber(material))
+    _emit(_get_sub_title_for_fiber(material))
 
     # Get and print fiber properties
-    print(_print_tabulate(constituent_properties[0], "firstrow"))
+    _emit(_print_tabulate(constituent_properties[0], "firstrow"))
 
     # Get and print matrix's sub-title
-    print(_get_sub_title_for_matrix(material))
+    _emit(_get_sub_title_for_matrix(material))
 
     # Get and print matrix properties
-    print(_print_tabulate(constituent_properties[1], "firstrow"))
+    _emit(_print_tabulate(constituent_properties[1], "firstrow"))
 
     # Get and print sub-title for composite' effective elastic properties
-    print(_get_sub_title_for_composite(material))
-
-    # Get and print all effective properties vs full range of fiber volume fraction
-    if min is None and max is None:
-
-        # Get compared properties versus a full range of fiber volume fraction
-        eff_properties_dict = _get_effective_properties_versus_full_range_Vf(material)
-
-        # Print properties
-        print(_print_tabulate(eff_properties_dict, "keys"))
-        print()
-
-    # Get and print all effective properties vs specific value of fiber volume fraction
-    elif (min is not None and max is None) or (
-        min is not None and max is not None and min == max
-    ):
-        if not isinstance(min, int | float):
-            raise TypeError(
-                "Expected specific value of fiber volume fraction to be float number"
-            )
-        if min < 0 and min > 1:
-            raise ValueError(
-                "Expected specific value of fiber volume fraction in between 0 and 1"
-            )
-
-        # Get index number for specific value of fiber volume fraction
-        idx: int = HT._fiber_volfract.index(
-            Decimal(round(min, 2)).quantize(Decimal("1.000"))
-        )
-
-        # Get compared properties versus a specific value of fiber volume fraction
-        eff_properties_list = _get_effective_properties_versus_specific_value_Vf(
-            material, idx
-        )
-
-        # Print properties
-        print(_print_tabulate(eff_properties_list, "firstrow"))
-        print()
-
-    # Print all effective properties versus specific range of fiber volume fraction
-    elif min is not None and max is not None:
-        if not isinstance(min, int | float) or not isinstance(max, int | float):
-            raise TypeError(
-                "Expected min and max value of fiber volume fraction range to be float "
-                + "number"
-            )
-        if min < 0 or min > 1 or max < 0 or max > 1 or min > max:
-            raise ValueError(
-                "Expected min and max value of fiber volume fraction range in between "
-                + "0 and 1 and also, min value to be smaller than max value"
-            )
-
-        # Get index number for start and end of fiber volume fraction range
-        start: int = HT._fiber_volfract.index(
-            Decimal(round(min, 2)).quantize(Decimal("1.000"))
-        )
-        end: int = HT._fiber_volfract.index(
-            Decimal(round(max, 2)).quantize(Decimal("1.000"))
-        )
+    _emit(_get_sub_title_for_composite(material))
 
-        # Get compared properties versus a specific range of fiber volume fraction
-        eff_properties_dict = _get_effective_properties_versus_specific_range_Vf(
-            material, start, end
+    # Get and print all effective properties vs specific value of fiber volume fraction
+    if min is not None and (max is None or min == max):
+
+        # Get compared properties versus a specific value of fiber volume fraction
+        eff_properties_list = _get_effective_properties_versus_specific_value_Vf(
+            material, start
         )
 
         # Print properties
-        print(_print_tabulate(eff_properties_dict, "keys"))
-        print()
+        _render_table(eff_properties_list, "firstrow")
+        _emit()
 
-    # Other option
+    # Print all effective properties versus full or specific range of fiber volume
+    # fraction, streamed row by row
     else:
-        raise ValueError(
-            "Opss!"
-            + "Either both min and max of fiber volume fraction range have value\n"
-            + "or just min value for a specific fiber volume fraction and not range\n"
-            + "or no min and max indicating full range of fiber volume fraction.\n"
-            + "Pick one perhaps?"
+        _render_table(
+            functools.partial(
+                material._iter_index_rows, start, end, tuple(HT._row_headers)
+            ),
+            "rows",
         )
+        _emit()
 
 
 def _get_main_title_for_UD_composite(material: HT | None = None) -> str:
@@ -4038,9 +7186,12 @@ def _get_fiber_and_matrix_properties(material: HT | None = None) -> list:
 
 def _get_effective_properties_versus_full_range_Vf(material: HT | None = None) -> dict:
     """Get the full range of effective elastic moduli of UD composite based on the full
-    range of fiber volume fraction to be displayed on console screen.
+    range of fiber volume fraction as columns, i.e. the table that ``display`` streams
+    row by row.
 
-    Note: A helper function to ``display`` function.
+    Note: A legacy helper function that is no longer called by ``display``, which
+    streams ``HT.iter_rows`` into ``_render_table``. It is kept as a thin wrapper over
+    ``HT.iter_rows`` for callers that need the whole table in memory.
 
     : param `material`: UD composite
     : type: ```HT``` | None
@@ -4054,15 +7205,11 @@ def _get_effective_properties_versus_full_range_Vf(material: HT | None = None) -
         raise TypeError("Expect argument to be UD composite and is of 'HT' object")
 
     # Return a dict of effective properties based on the full range of Vf
-    return {
-        "Vf": material.fiber_volfract,
-        "E1*\n(GPa)": material.eff_axial_youngs_moduli,
-        "E2*\n(GPa)": material.eff_transverse_youngs_moduli,
-        "G12*\n(GPa)": material.eff_axial_shear_moduli,
-        "v12*": material.eff_major_poissons_ratios,
-        "G23*\n(GPa)": material.eff_transverse_shear_moduli,
-        "K23*\n(GPa)": material.eff_pstrain_bulk_moduli,
-    }
+    columns: dict = {}
+    for row in material.iter_rows():
+        for key, value in row.items():
+            columns.setdefault(key, []).append(value)
+    return {key: tuple(values) for key, values in columns.items()}
 
 
 def _get_effective_properties_versus_specific_value_Vf(
@@ -4098,36 +7245,22 @@ def _get_effective_properties_versus_specific_value_Vf(
         raise ValueError("Expect index number is in between 0 and 100 inclusive.")
 
     # Organize data of fiber volume fraction versus effective elastic moduli
-    eff_properties_1st_row: list = [
-        "Vf",
-        "E1*\n(GPa)",
-        "E2*\n(GPa)",
-        "G12*\n(GPa)",
-        "v12*",
-        "G23*\n(GPa)",
-        "K23*\n(GPa)",
-    ]
-    eff_properties_2nd_row: list = [
-        material.fiber_volfract[idx],
-        material.eff_axial_youngs_moduli[idx],
-        material.eff_transverse_youngs_moduli[idx],
-        material.eff_axial_shear_moduli[idx],
-        material.eff_major_poissons_ratios[idx],
-        material.eff_transverse_shear_moduli[idx],
-        material.eff_pstrain_bulk_moduli[idx],
-    ]
+    row: dict = next(material._iter_index_rows(idx, idx, tuple(HT._row_headers)))
 
     # Return a list of effective properties based on the specific value of Vf
-    return [eff_properties_1st_row, eff_properties_2nd_row]
+    return [list(row.keys()), list(row.values())]
 
 
 def _get_effective_properties_versus_specific_range_Vf(
     material: HT | None = None, start: int | None = None, end: int | None = None
 ) -> dict:
     """Get the specific range of effective elastic moduli of UD composite based on
-    specific range of fiber volume fraction to be displayed on console screen.
+    specific range of fiber volume fraction as columns, i.e. the table that
+    ``display`` streams row by row.
 
-    Note: A helper function to ``display`` function.
+    Note: A legacy helper function that is no longer called by ``display``, which
+    streams the rows of ``HT.iter_rows`` into ``_render_table``. It is kept as a thin
+    wrapper over the same rows for callers that need the whole table in memory.
 
     : param `material`: UD composite
     : type: ```HT```
@@ -4175,35 +7308,14 @@ def _get_effective_properties_versus_specific_range_Vf(
             "Expect second and third argument to be different index number"
         )
 
-    # Empty lists
-    vf: list = []
-    e1eff: list = []
-    e2eff: list = []
-    g12eff: list = []
-    v12eff: list = []
-    g23eff: list = []
-    k23eff: list = []
-
     # Get effective values according to the range
-    for i in range(start, end + 1):
-        vf.append(material.fiber_volfract[i])
-        e1eff.append(material.eff_axial_youngs_moduli[i])
-        e2eff.append(material.eff_transverse_youngs_moduli[i])
-        g12eff.append(material.eff_axial_shear_moduli[i])
-        v12eff.append(material.eff_major_poissons_ratios[i])
-        g23eff.append(material.eff_transverse_shear_moduli[i])
-        k23eff.append(material.eff_pstrain_bulk_moduli[i])
+    columns: dict = {}
+    for row in material._iter_index_rows(start, end, tuple(HT._row_headers)):
+        for key, value in row.items():
+            columns.setdefault(key, []).append(value)
 
     # Return a dict of effective properties based on the specific range of Vf
-    return {
-        "Vf": vf,
-        "E1*\n(GPa)": e1eff,
-        "E2*\n(GPa)": e2eff,
-        "G12*\n(GPa)": g12eff,
-        "v12*": v12eff,
-        "G23*\n(GPa)": g23eff,
-        "K23*\n(GPa)": k23eff,
-    }
+    return columns
 
 
 def _print_tabulate(
@@ -4229,11 +7341,49 @@ def _print_tabulate(
     : return: tabulate table format
     : rtype: str
     """
+    # Return table of data
+    return "\n".join(_iter_table_lines(properties, fields))
+
+
+def _iter_table_lines(
+    properties: dict | list | Callable[[], Iterator[dict]] | None = None,
+    fields: str | None = None,
+) -> Iterator[str]:
+    """Yield the lines of the grid table of ``_print_tabulate`` one at a time. Widths of
+    numeric columns are found from their widest values by a first pass over the rows,
+    hence every row is then formatted with fixed two decimal places and streamed right
+    away. Rows may also be given by a function that yields them as dicts, e.g.
+    ``HT.iter_rows``, which is called once for the widths and once for the lines so
+    that no row is kept. Tables that hold any non-numeric value are rendered by
+    tabulate instead.
+
+    Note: A helper function to ``_print_tabulate`` and ``_render_table`` function.
+
+    : param `properties`: Elastic properties which can be constituent's elastic
+        constants or composite's effective elastic constants, or a function that
+        yields them as rows of dicts
+    : type: dict | list | Callable[[], Iterator[dict]] | None
+    : param `fields`: Headers format for tabulate printing, 'keys' for dict,
+        'firstrow' for list or 'rows' for function of rows
+    : type: str | None
+    : raise TypeError: If `properties` is None or not either list, dict or function
+        object, or `fields` is None or not str object
+    : raise ValueError: If `properties` is dict but `fields` is not 'keys', or
+        if `properties` is list but its length not equal 2, or if `properties` is list
+        of length 2 but its elements are zero length, or if `properties` is list of
+        length 2 but its elements are not equal in size, or if `properties` is a valid
+        list but `fields` is not 'firstrow', or if `properties` is a function but
+        `fields` is not 'rows' or it yields no row
+    : return: Lines of tabulate table format
+    : rtype: Iterator[str]
+    """
     # Check for TypeError
-    if properties is None or not isinstance(properties, dict | list):
+    if properties is None or not (
+        isinstance(properties, dict | list) or callable(properties)
+    ):
         raise TypeError(
-            "Expect first argument to be some elastic moduli and of either dict or "
-            + "list object"
+            "Expect first argument to be some elastic moduli and of either dict, "
+            + "list or function object"
         )
     if fields is None or not isinstance(fields, str):
         raise TypeError(
@@ -4265,16 +7415,117 @@ def _print_tabulate(
                 "If first argument is a valid list object, expect the second argument "
                 + "to be 'firstrow' only"
             )
+    if callable(properties) and fields != "rows":
+        raise ValueError(
+            "If first argument is a function, expect second argument to be 'rows' only"
+        )
 
-    # Return table of data
-    return tabulate(properties, headers=fields, tablefmt="grid", floatfmt=".2f")
+    # Get headers and a function that yields rows of values of table, where the
+    # first row of function of rows is taken to get headers
+    if isinstance(properties, dict):
+        headers: list = [str(header) for header in properties]
+
+        def get_rows() -> Iterator:
+            return zip(*properties.values())
+
+        rows: Iterator = get_rows()
+    elif isinstance(properties, list):
+        headers = [str(header) for header in properties[0]]
+
+        def get_rows() -> Iterator:
+            return iter([properties[1]])
+
+        rows = get_rows()
+    else:
+        dict_rows: Iterator[dict] = properties()
+        first_row: dict | None = next(dict_rows, None)
+        if first_row is None:
+            raise ValueError("Expect function of first argument to yield a row")
+        headers = [str(header) for header in first_row]
+
+        def get_rows() -> Iterator:
+            return (tuple(row.values()) for row in properties())
+
+        rows = (
+            tuple(row.values()) for part in ([first_row], dict_rows) for row in part
+        )
+
+    # Get width of every column from its header and the widest of its values, where
+    # a value such as Decimal('-0.0') may be wider than both bounds of its column
+    header_lines: list = [header.split("\n") for header in headers]
+    widths: list = [max(len(line) for line in lines) + 2 for lines in header_lines]
+    for row in rows:
+        for number, value in enumerate(row):
+
+            # Render table of any non-numeric value by tabulate
+            if not isinstance(value, Decimal | float):
+                yield from tabulate(
+                    list(properties()) if callable(properties) else properties,
+                    headers="keys" if callable(properties) else fields,
+                    tablefmt="grid",
+                    floatfmt=".2f",
+                ).split("\n")
+                return
+            widths[number] = max(widths[number], len(format(float(value), ".2f")))
+
+    # Yield headers
+    rule: str = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    yield rule
+    for number in range(max(len(lines) for lines in header_lines)):
+        yield "| " + " | ".join(
+            (lines[number] if number < len(lines) else "").rjust(width)
+            for lines, width in zip(header_lines, widths)
+        ) + " |"
+    yield rule.replace("-", "=")
+
+    # Yield rows
+    for row in get_rows():
+        yield "| " + " | ".join(
+            format(float(value), ".2f").rjust(width)
+            for value, width in zip(row, widths)
+        ) + " |"
+        yield rule
+
+
+def _render_table(
+    properties: dict | list | Callable[[], Iterator[dict]] | None = None,
+    fields: str | None = None,
+    chunk: int = 1024,
+) -> None:
+    """Emit the grid table of ``_print_tabulate`` in chunks of rendered lines as they
+    are streamed, instead of building the whole table in memory first.
+
+    Note: A helper function to both ``display`` and ``compare`` function.
+
+    : param `properties`: Elastic properties which can be constituent's elastic
+        constants or composite's effective elastic constants, or a function that
+        yields them as rows of dicts
+    : type: dict | list | Callable[[], Iterator[dict]] | None
+    : param `fields`: Headers format for tabulate printing, 'keys' for dict,
+        'firstrow' for list or 'rows' for function of rows
+    : type: str | None
+    : param `chunk`: Number of lines emitted at once. Default is 1024
+    : type: int
+    : raise TypeError: See ``_iter_table_lines`` function
+    : raise ValueError: See ``_iter_table_lines`` function
+    : rtype: None
+    """
+    lines: list = []
+    for line in _iter_table_lines(properties, fields):
+        lines.append(line)
+        if len(lines) == chunk:
+            _emit("\n".join(lines))
+            lines = []
+    if lines:
+        _emit("\n".join(lines))
 
 
 def compare(
     *materials: HT,
-    property: str = "E1eff",
+    property: str | list | tuple = "E1eff",
     min: int | float | None = None,
     max: int | float | None = None,
+    pager: bool = False,
 ) -> None:
     """Print to screen A) only the relevant elastic moduli of fiber and matrix that
     influence the effective elastic property for qualitative comparison assessment, and
@@ -4289,19 +7540,26 @@ def compare(
     : param `material`: UD composites that will be compared
     : type: ```HT```
     : param `property`: User-defined effective elastic property that becomes the subject
-        of comparison
-    : type: str
+        of comparison, several of them as a list or tuple, or 'all' for all of them,
+        which are compared in a single pass where every relevant elastic modulus of
+        fiber and matrix is printed once
+    : type: str | list | tuple
     : param `min`: The starting inclusive value of fiber volume fraction range or
         specific value of fiber volume fraction
     : type: int | float | None
     : param `max`: The ending inclusive value of fiber volume fraction range or None
         when specific value of fiber volume fraction is defined as min
     : type: int | float | None
-    : raise TypeError: When first argument - material is None or not HT type
+    : param `pager`: True to stream the output through the system pager, e.g. less,
+        for interactive use. Default is False. It is ignored in ``quiet`` mode
+    : type: bool
+    : raise TypeError: When first argument - material is None or not HT type, or when
+        pager is not a bool
     : raise ValueError: When property is not one of the followings: 'E1eff', 'E2eff',
-        'G21eff', 'v12eff', 'G23eff', 'K23eff', when min is None while max is not
-        None, or when both min and max are not None but their values are not in between
-        0 and 1 and also, when min value is greater than max value.
+        'G21eff', 'v12eff', 'G23eff', 'K23eff', a list of them or 'all', when min is
+        None while max is not None, or when both min and max are not None but their
+        values are not in between 0 and 1 and also, when min value is greater than max
+        value.
     : rtype: None
 
     Example 1: Comparison of 4 UD composites of default property - "E1eff" with default
@@ -4712,6 +7970,86 @@ def compare(
         | 0.50 |    3.64 |    2.29 |       -37.00 |    4.56 |        25.20 |    2.64 |       -27.60 |
         +------+---------+---------+--------------+---------+--------------+---------+--------------+
 
+        >>>
+
+    Example 4: Comparison between 2 UD composites on several properties - 'G23eff' and
+        'K23eff' in a single pass with user-defined specific value on fiber volume
+        fraction - 0.5, where the shared elastic moduli of fiber and matrix are printed
+        once
+
+        >>> compare(compositeA, compositeB, property=["G23eff", "K23eff"], min=0.5)
+
+        A) 2 UD Composites for Comparison Analysis
+
+        [1] - CARBON-PHENOLIC
+        [2] - CARBON-EPOXY
+
+        B) 2 Fibers of UD Composites
+
+        [1] : Carbon - Transtropic
+        [2] : Carbon - Transtropic
+
+        i) 2 Fibers on Shear / Transverse Shear Modulus Comparison
+
+        +-------------------------------------+----------+----------+
+        | Fiber Material                      |      [1] |      [2] |
+        |                                     |   Carbon |   Carbon |
+        +=====================================+==========+==========+
+        | Shear Modulus, G or                 |    10.00 |    10.00 |
+        | Transverse Shear Modulus, G23 (GPa) |          |          |
+        +-------------------------------------+----------+----------+
+
+        ii) 2 Fibers on Plane-Strain Bulk Modulus Comparison
+
+        +--------------------------------------+----------+----------+
+        | Fiber Material                       |      [1] |      [2] |
+        |                                      |   Carbon |   Carbon |
+        +======================================+==========+==========+
+        | Plane-Strain Bulk Modulus, K23 (GPa) |    17.02 |    17.02 |
+        +--------------------------------------+----------+----------+
+
+        C) 2 Matrices of UD Composites
+
+        [1] : Phenolic - Isotropic
+        [2] : Epoxy - Isotropic
+
+        i) 2 Matrices on Shear / Transverse Shear Modulus Comparison
+
+        +-------------------------------------+------------+---------+
+        | Matrix Material                     |        [1] |     [2] |
+        |                                     |   Phenolic |   Epoxy |
+        +=====================================+============+=========+
+        | Shear Modulus, G or                 |       1.92 |    1.08 |
+        | Transverse Shear Modulus, G23 (GPa) |            |         |
+        +-------------------------------------+------------+---------+
+
+        ii) 2 Matrices on Plane-Strain Bulk Modulus Comparison
+
+        +--------------------------------------+------------+---------+
+        | Matrix Material                      |        [1] |     [2] |
+        |                                      |   Phenolic |   Epoxy |
+        +======================================+============+=========+
+        | Plane-Strain Bulk Modulus, K23 (GPa) |       4.81 |    2.69 |
+        +--------------------------------------+------------+---------+
+
+        D) Comparison of Effective Elastic Property of 2 UD Composites
+
+        +------+---------+---------+--------------+
+        |   Vf |     [1] |     [2] |     diff. of |
+        |      |    G23* |    G23* |   [2] to [1] |
+        |      |   (GPa) |   (GPa) |          (%) |
+        +======+=========+=========+==============+
+        | 0.50 |    3.64 |    2.29 |       -37.00 |
+        +------+---------+---------+--------------+
+
+        +------+---------+---------+--------------+
+        |   Vf |     [1] |     [2] |     diff. of |
+        |      |    K23* |    K23* |   [2] to [1] |
+        |      |   (GPa) |   (GPa) |          (%) |
+        +======+=========+=========+==============+
+        | 0.50 |    8.01 |    5.16 |       -35.60 |
+        +------+---------+---------+--------------+
+
         >>>
     """
     # Check for TypeError and ValueError
@@ -4720,276 +8058,164 @@ def compare(
     for material in materials:
         if not isinstance(material, HT):
             raise TypeError("The first argument must be HT object of UD composite")
-    if property not in ["E1eff", "E2eff", "G12eff", "v12eff", "G23eff", "K23eff"]:
+    if property == "all":
+        properties: tuple = tuple(HT._row_headers)
+    elif isinstance(property, str | list | tuple) and property:
+        properties = tuple(dict.fromkeys(HT._get_property_keys(property)))
+    else:
         raise ValueError(
             "Expected one of these options - 'E1eff', 'E2eff', 'G12eff', 'v12eff', "
-            + "'G23eff', 'K23eff'"
-        )
-    if min is None and max is not None:
-        raise TypeError(
-            "Opss!"
-            + "Either both min and max of fiber volume fraction range have value\n"
-            + "or just min value for a specific fiber volume fraction and not range\n"
-            + "or no min and max indicating full range of fiber volume fraction.\n"
-            + "Pick one option perhaps?"
-        )
+            + "'G23eff', 'K23eff', a list of them or 'all'"
+        )
+    start, end = HT._vf_index.window(min, max)
+    if not isinstance(pager, bool):
+        raise TypeError("Expect pager to be a bool object")
+
+    # Stream the output through the system pager
+    if pager and _output_buffer is None:
+        with _paged():
+            compare(*materials, property=property, min=min, max=max)
+        return
+
+    # Relevant constituent elastic moduli that influence the effective elastic
+    # properties according to Halpin-Tsai formula, where every sub-table shared by
+    # several properties, e.g. G23eff and K23eff, is collected and printed once
+    moduli: list = []
+    for key in properties:
+        for modulus in HT._constituent_moduli[key]:
+            if modulus not in moduli:
+                moduli.append(modulus)
+    fiber_tables: dict = {
+        "axial_youngs_modulus": (
+            _get_sub_sub_title_fiber_axial_youngs_modulus,
+            _get_fibers_axial_youngs_modulus,
+        ),
+        "transverse_youngs_modulus": (
+            _get_sub_sub_title_fiber_transverse_youngs_modulus,
+            _get_fibers_transverse_youngs_modulus,
+        ),
+        "axial_shear_modulus": (
+            _get_sub_sub_title_fiber_axial_shear_modulus,
+            _get_fibers_axial_shear_modulus,
+        ),
+        "major_poissons_ratio": (
+            _get_sub_sub_title_fiber_major_poissons_ratio,
+            _get_fibers_major_poissons_ratio,
+        ),
+        "transverse_shear_modulus": (
+            _get_sub_sub_title_fiber_transverse_shear_modulus,
+            _get_fibers_transverse_shear_modulus,
+        ),
+        "pstrain_bulk_modulus": (
+            _get_sub_sub_title_fiber_pstrain_bulk_modulus,
+            _get_fibers_pstrain_bulk_modulus,
+        ),
+    }
+    matrix_tables: dict = {
+        "axial_youngs_modulus": (
+            _get_sub_sub_title_matrix_axial_youngs_modulus,
+            _get_matrices_axial_youngs_modulus,
+        ),
+        "transverse_youngs_modulus": (
+            _get_sub_sub_title_matrix_transverse_youngs_modulus,
+            _get_matrices_transverse_youngs_modulus,
+        ),
+        "axial_shear_modulus": (
+            _get_sub_sub_title_matrix_axial_shear_modulus,
+            _get_matrices_axial_shear_modulus,
+        ),
+        "major_poissons_ratio": (
+            _get_sub_sub_title_matrix_major_poissons_ratio,
+            _get_matrices_major_poissons_ratio,
+        ),
+        "transverse_shear_modulus": (
+            _get_sub_sub_title_matrix_transverse_shear_modulus,
+            _get_matrices_transverse_shear_modulus,
+        ),
+        "pstrain_bulk_modulus": (
+            _get_sub_sub_title_matrix_pstrain_bulk_modulus,
+            _get_matrices_pstrain_bulk_modulus,
+        ),
+    }
 
     # Get and print title to introduces number of UD composites being compared
-    print(_get_main_title(materials))
+    _emit(_get_main_title(materials))
 
     # Get and print all UD composites' number and name for identification purposes
     numbers_and_names_of_composites: list = _get_numbers_and_names_of_composites(
         materials
     )
     for number_and_name in numbers_and_names_of_composites:
-        print(number_and_name)
+        _emit(number_and_name)
 
     # Get and print sub-title to introduces fibers of UD composites
-    print(_get_sub_title_fibers(materials))
+    _emit(_get_sub_title_fibers(materials))
 
     # Get and print all fibers' number and name for identification purposes
     numbers_and_names_of_fibers: list = _get_numbers_and_names_fibers(materials)
     for number_and_name in numbers_and_names_of_fibers:
-        print(number_and_name)
-
-    # Print relevant user-defined elastic modulus of fiber that influence the effective
-    # elastic modulus according to Halpin-Tsai formula
-    match property:
-
-        # For relevant constituent elastic moduli that influence E1eff
-        case "E1eff":
-            # Get and print sub-sub-title for fibers' axial Young modulus
-            print(_get_sub_sub_title_fiber_axial_youngs_modulus(materials))
-
-            # Get all fibers' axial Young's modulus for comparison
-            fibers_axial_youngs_modulus_list: list = _get_fibers_axial_youngs_modulus(
-                materials
-            )
-
-            # Print comparison table for fibers' axial Young's modulus
-            print(_print_tabulate(fibers_axial_youngs_modulus_list, "firstrow"))
-
-        # For relevant constituent elastic moduli that influence E2eff
-        case "E2eff":
-            # Get and print sub-sub-title for fibers' transverse Young modulus
-            print(_get_sub_sub_title_fiber_transverse_youngs_modulus(materials))
-
-            # Get all fibers' transverse Young's modulus for comparison
-            fibers_transverse_youngs_modulus_list: list = (
-                _get_fibers_transverse_youngs_modulus(materials)
-            )
-
-            # Print comparison table for fibers' transverse Young's modulus
-            print(_print_tabulate(fibers_transverse_youngs_modulus_list, "firstrow"))
-
-        # For relevant constituent elastic moduli that influence G12eff
-        case "G12eff":
-            # Get and print sub-sub-title for fibers' axial shear modulus
-            print(_get_sub_sub_title_fiber_axial_shear_modulus(materials))
-
-            # Get all fibers' axial shear modulus for comparison
-            fibers_axial_shear_modulus_list: list = _get_fibers_axial_shear_modulus(
-                materials
-            )
-
-            # Print comparison table for fibers' axial shear modulus
-            print(_print_tabulate(fibers_axial_shear_modulus_list, "firstrow"))
-
-        # For relevant constituent elastic moduli that influence v12eff
-        case "v12eff":
-            # Get and print sub-sub-title for fibers' major Poisson's ratio
-            print(_get_sub_sub_title_fiber_major_poissons_ratio(materials))
-
-            # Get all fibers' major Poisson's ratio for comparison
-            fibers_major_poissons_ratio_list: list = _get_fibers_major_poissons_ratio(
-                materials
-            )
-
-            # Print comparison table for fibers' major Poisson's ratio
-            print(_print_tabulate(fibers_major_poissons_ratio_list, "firstrow"))
-
-        # For relevant constituent elastic moduli that influence G23eff and K23eff
-        case "G23eff" | "K23eff":
-            # Get and print sub-sub-title for fibers' transverse shear modulus
-            print(_get_sub_sub_title_fiber_transverse_shear_modulus(materials))
+        _emit(number_and_name)
 
-            # Get all fibers' transverse shear modulus for comparison
-            fibers_transverse_shear_modulus_list: list = (
-                _get_fibers_transverse_shear_modulus(materials)
-            )
-
-            # Print comparison table for fibers' transverse shear modulus
-            print(_print_tabulate(fibers_transverse_shear_modulus_list, "firstrow"))
-
-            # Get and print sub-sub-title for fibers' plane-strain bulk modulus
-            print(_get_sub_sub_title_fiber_pstrain_bulk_modulus(materials))
-
-            # Get all fibers' plane-strain bulk modulus for comparison
-            fibers_pstrain_bulk_modulus_list: list = _get_fibers_pstrain_bulk_modulus(
-                materials
-            )
-
-            # Print comparison table for fibers' plane-strain bulk modulus
-            print(_print_tabulate(fibers_pstrain_bulk_modulus_list, "firstrow"))
+    # Print comparison table of every relevant elastic modulus of fibers
+    for number, modulus in enumerate(moduli):
+        get_sub_sub_title, get_fibers_modulus = fiber_tables[modulus]
+        _emit(_renumber_sub_sub_title(get_sub_sub_title(materials), number))
+        _emit(_print_tabulate(get_fibers_modulus(materials), "firstrow"))
 
     # Get and print sub-title to introduces matrices of UD composites
-    print(_get_sub_title_matrices(materials))
+    _emit(_get_sub_title_matrices(materials))
 
     # Get and print all matrices' number and name for identification purposes
     numbers_and_names_of_matrices: list = _get_numbers_and_names_matrices(materials)
     for number_and_name in numbers_and_names_of_matrices:
-        print(number_and_name)
-
-    # Print relevant elastic modulus of matrix that affects the effective elastic
-    # modulus specified by user
-    match property:
+        _emit(number_and_name)
 
-        # For relevant constituent elastic moduli that influence E1eff
-        case "E1eff":
-            # Get and print sub-sub-title for matrices' axial Young modulus
-            print(_get_sub_sub_title_matrix_axial_youngs_modulus(materials))
-
-            # Get all matrices' axial Young's modulus for comparison
-            matrices_axial_youngs_modulus_list: list = (
-                _get_matrices_axial_youngs_modulus(materials)
-            )
-
-            # Print comparison table for matrices' axial Young's modulus
-            print(_print_tabulate(matrices_axial_youngs_modulus_list, "firstrow"))
-
-        # For relevant constituent elastic moduli that influence E2eff
-        case "E2eff":
-            # Get and print sub-sub-title for matrices' transverse Young modulus
-            print(_get_sub_sub_title_matrix_transverse_youngs_modulus(materials))
-
-            # Get all matrices' transverse Young's modulus for comparison
-            matrices_transverse_youngs_modulus_list: list = (
-                _get_matrices_transverse_youngs_modulus(materials)
-            )
-
-            # Print comparison table for matrices' transverse Young's modulus
-            print(_print_tabulate(fibers_transverse_youngs_modulus_list, "firstrow"))
-
-        # For relevant constituent elastic moduli that influence G12eff
-        case "G12eff":
-            # Get and print sub-sub-title for matrices' axial shear modulus
-            print(_get_sub_sub_title_matrix_axial_shear_modulus(materials))
-
-            # Get all matrices' axial shear modulus for comparison
-            matrices_axial_shear_modulus_list: list = _get_matrices_axial_shear_modulus(
-                materials
-            )
-
-            # Print comparison table for matrices' axial shear modulus
-            print(_print_tabulate(matrices_axial_shear_modulus_list, "firstrow"))
-
-        # For relevant constituent elastic moduli that influence v12eff
-        case "v12eff":
-            # Get and print sub-sub-title for matrices' major Poisson's ratio
-            print(_get_sub_sub_title_matrix_major_poissons_ratio(materials))
+    # Print comparison table of every relevant elastic modulus of matrices
+    for number, modulus in enumerate(moduli):
+        get_sub_sub_title, get_matrices_modulus = matrix_tables[modulus]
+        _emit(_renumber_sub_sub_title(get_sub_sub_title(materials), number))
+        _emit(_print_tabulate(get_matrices_modulus(materials), "firstrow"))
 
-            # Get all matrices' major Poisson's ratio for comparison
-            matrices_major_poissons_ratio_list: list = (
-                _get_matrices_major_poissons_ratio(materials)
+    # Get and print introduction title of effective elastic properties of UD composite
+    _emit(_get_sub_title_effective_elastic_properties(materials))
+
+    # Get and print data on every comparison property versus a full range, a specific
+    # value or a specific range of fiber volume fraction
+    for key in properties:
+        if min is None and max is None:
+            compared_properties: dict | list = (
+                _get_comparison_specific_property_full_range_Vf(materials, key)
             )
-
-            # Print comparison table for matrices' major Poisson's ratio
-            print(_print_tabulate(matrices_major_poissons_ratio_list, "firstrow"))
-
-        # For relevant constituent elastic moduli that influence G23eff and K23eff
-        case "G23eff" | "K23eff":
-            # Get and print sub-sub-title for matrices' transverse shear modulus
-            print(_get_sub_sub_title_matrix_transverse_shear_modulus(materials))
-
-            # Get all matrices' transverse shear modulus for comparison
-            matrices_transverse_shear_modulus_list: list = (
-                _get_matrices_transverse_shear_modulus(materials)
+            _render_table(compared_properties, "keys")
+        elif max is None or min == max:
+            compared_properties = _get_comparison_specific_property_specific_value_Vf(
+                materials, key, start
             )
-
-            # Print comparison table for matrices's transverse shear modulus
-            print(_print_tabulate(matrices_transverse_shear_modulus_list, "firstrow"))
-
-            # Get and print sub-sub-title for matrices' plane-strain bulk modulus
-            print(_get_sub_sub_title_matrix_pstrain_bulk_modulus(materials))
-
-            # Get all matrices' plane-strain bulk modulus for comparison
-            matrices_pstrain_bulk_modulus_list: list = (
-                _get_matrices_pstrain_bulk_modulus(materials)
+            _render_table(compared_properties, "firstrow")
+        else:
+            compared_properties = _get_comparison_specific_property_specific_range_Vf(
+                materials, key, start, end
             )
+            _render_table(compared_properties, "keys")
+        _emit()
 
-            # Print comparison table for matrices' plane-strain bulk modulus
-            print(_print_tabulate(matrices_pstrain_bulk_modulus_list, "firstrow"))
 
-    # Get and print introduction title of effective elastic properties of UD composite
-    print(_get_sub_title_effective_elastic_properties(materials))
-
-    # Get and print data on comparison property versus a full range of fiber volume
-    # fraction based on user-defined `property`
-    if min is None and max is None:
-        # Organized comparison property on full range of fiber volume fraction
-        compared_properties_dict: dict = (
-            _get_comparison_specific_property_full_range_Vf(materials, property)
-        )
-
-        # Print data in table format
-        print(_print_tabulate(compared_properties_dict, "keys"))
-        print()
-
-    # Get and print data on comparison property versus a specific value of fiber volume
-    # fraction based on user-defined `property`
-    elif (min is not None and max is None) or (
-        min is not None and max is not None and min == max
-    ):
-        # Check for TypeError & ValueError
-        if not isinstance(min, int | float):
-            raise TypeError(
-                "Expected specific value of fiber volume fraction to be float number"
-            )
-        if min < 0 and min > 1:
-            raise ValueError(
-                "Expected specific value of fiber volume fraction in between 0 and 1"
-            )
-        # Get index number of specific value of fiber volume fraction
-        idx: int = HT._fiber_volfract.index(
-            Decimal(round(min, 2)).quantize(Decimal("1.000"))
-        )
-        # Get comparison property on specific value of fiber volume fraction
-        compared_properties_list = _get_comparison_specific_property_specific_value_Vf(
-            materials, property, idx
-        )
-        # Print data in table format
-        print(_print_tabulate(compared_properties_list, "firstrow"))
-        print()
+def _renumber_sub_sub_title(sub_sub_title: str, number: int) -> str:
+    """Replace the roman numeral of a sub-sub-title of constituents' elastic modulus
+    with the numeral of its position among the printed sub-sub-titles.
 
-    # Get and print data on comparison property versus a specific range of fiber volume
-    # fraction based on user-defined `property`
-    else:
-        # Check for TypeError & ValueError
-        if not isinstance(min, int | float) or not isinstance(max, int | float):
-            raise TypeError(
-                "Expected min and max value of fiber volume fraction range to be float "
-                + "number"
-            )
-        if min < 0 or min > 1 or max < 0 or max > 1 or min > max:
-            raise ValueError(
-                "Expected min and max value of fiber volume fraction range in between "
-                + "0 and 1 and also, min value to be smaller than max value"
-            )
+    Note: A helper function to ``compare`` function.
 
-        # Get index number for start and end of fiber volume fraction range
-        start: int = HT._fiber_volfract.index(
-            Decimal(round(min, 2)).quantize(Decimal("1.000"))
-        )
-        end: int = HT._fiber_volfract.index(
-            Decimal(round(max, 2)).quantize(Decimal("1.000"))
-        )
-        # Get comparison property on specific range of fiber volume fraction
-        compared_properties_dict = _get_comparison_specific_property_specific_range_Vf(
-            materials, property, start, end
-        )
-        # Print data in table format
-        print(_print_tabulate(compared_properties_dict, "keys"))
-        print()
+    : param `sub_sub_title`: sub-sub-title that starts with a roman numeral, e.g.
+        "\\ni) 4 Fibers on Young's / Axial Young's Modulus Comparison\\n"
+    : type: str
+    : param `number`: zero-based position of sub-sub-title
+    : type: int
+    : return: renumbered sub-sub-title
+    : rtype: str
+    """
+    numeral: str = ("i", "ii", "iii", "iv", "v", "vi")[number]
+    return re.sub(r"^\n[iv]+\)", f"\n{numeral})", sub_sub_title)
 
 
 def _get_main_title(materials: tuple[HT, ...]) -> str:
@@ -6102,6 +9328,47 @@ def _get_sub_title_effective_elastic_properties(materials: tuple[HT, ...]) -> st
     )
 
 
+def _comparison_cached(function):
+    """Decorate a helper function that builds comparison data of UD composites so that
+    its result is shared by ``compare``, ``save_compare``, ``plot_compare`` and
+    ``doc_compare`` through a least-recently-used cache, keyed by the function, the
+    content signature of every UD composite and the other arguments, e.g. property,
+    index numbers of fiber volume fraction or test name. Cached results are shared
+    and must not be modified by callers.
+
+    : param `function`: helper function of (materials, *args)
+    : type: Callable
+    : return: cached helper function
+    : rtype: Callable
+    """
+
+    @functools.wraps(function)
+    def cached(materials: tuple[HT, ...], *args):
+        # Leave invalid arguments to function to raise its own errors
+        if not isinstance(materials, tuple) or not all(
+            isinstance(material, HT) for material in materials
+        ):
+            return function(materials, *args)
+        key: tuple = (
+            function.__name__,
+            tuple(material._get_signature() for material in materials),
+            args,
+        )
+        if key in _comparison_cache:
+            _comparison_cache_stats["hits"] += 1
+            _comparison_cache.move_to_end(key)
+            return _comparison_cache[key]
+        _comparison_cache_stats["misses"] += 1
+        result = function(materials, *args)
+        _comparison_cache[key] = result
+        while len(_comparison_cache) > _comparison_cache_maxsize:
+            _comparison_cache.popitem(last=False)
+        return result
+
+    return cached
+
+
+@_comparison_cached
 def _get_comparison_specific_property_full_range_Vf(
     materials: tuple[HT, ...],
     property: str,
@@ -6258,6 +9525,7 @@ def _get_comparison_specific_property_full_range_Vf(
     return compare_properties_dict
 
 
+@_comparison_cached
 def _get_comparison_specific_property_specific_value_Vf(
     materials: tuple[HT, ...], property: str, idx: int
 ) -> list:
@@ -6404,6 +9672,7 @@ def _get_comparison_specific_property_specific_value_Vf(
     return [eff_properties_1st_row, eff_properties_2nd_row]
 
 
+@_comparison_cached
 def _get_comparison_specific_property_specific_range_Vf(
     materials: tuple[HT, ...], property: str, start: int, end: int
 ):
@@ -6605,7 +9874,754 @@ def _get_comparison_specific_property_specific_range_Vf(
     return compare_properties_dict
 
 
-def save(*materials: HT, folder: str = "csv") -> None:
+def rank(
+    *materials: HT,
+    property: str = "E1eff",
+    min: int | float | None = None,
+    max: int | float | None = None,
+    top: int = 10,
+    statistic: str = "mean",
+    descending: bool = True,
+) -> dict:
+    """Rank any number of UD composites, e.g. hundreds of candidates of a supplier
+    down-selection, by the percentage difference of an effective elastic property to
+    the baseline UD composite, which is the one that is first specified in the argument
+    as in ``compare``. The percentage difference of all composites at every fiber
+    volume fraction is computed in one vectorized operation, the `top` composites are
+    selected by partial sorting of their `statistic` of percentage difference over the
+    window of fiber volume fraction, and only their rows are printed.
+
+    : param `materials`: baseline UD composite followed by UD composites to be ranked
+    : type: ```HT```
+    : param `property`: 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' or 'K23eff'.
+        Default is 'E1eff'
+    : type: str
+    : param `min`: The starting inclusive value of fiber volume fraction range or
+        specific value of fiber volume fraction, or None for full range
+    : type: int | float | None
+    : param `max`: The ending inclusive value of fiber volume fraction range or None
+        when specific value of fiber volume fraction is defined as min
+    : type: int | float | None
+    : param `top`: number of top ranked UD composites. Default is 10
+    : type: int
+    : param `statistic`: 'mean', 'min' or 'max' of percentage difference over the
+        window of fiber volume fraction to rank by. Default is 'mean'
+    : type: str
+    : param `descending`: True to rank largest percentage difference first or False
+        to rank smallest first. Default is True
+    : type: bool
+    : raise TypeError: If any material is not HT type, or `top` is not an int or
+        `descending` is not a bool
+    : raise ValueError: If there are less than 2 UD composites, `property` or
+        `statistic` is unknown, min is None while max is not None, the window is not
+        from 0 to 1 or its start is greater than its end, or `top` is less than 1
+    : return: Name of baseline UD composite as 'baseline', fiber volume fractions of
+        window as 'Vf', and names, scores and percentage differences versus window of
+        the top ranked UD composites as 'names', 'score' and 'diff' respectively
+    : rtype: dict
+
+    Example:
+        >>> result = rank(compositeA, *candidates, property="G12eff", min=0.55,
+        ...     max=0.65, top=3)
+
+        Ranking of 3 of 200 UD Composites on G12* to CARBON-PHENOLIC
+
+        +--------+----------------+------------+-------------+------------+
+        |   Rank | UD Composite   |   min diff |   mean diff |   max diff |
+        |        |                |        (%) |         (%) |        (%) |
+        +========+================+============+=============+============+
+        |      1 | Glass199-M199  |      44.07 |       48.64 |      53.83 |
+        +--------+----------------+------------+-------------+------------+
+        |      2 | Glass198-M198  |      43.56 |       48.14 |      53.31 |
+        +--------+----------------+------------+-------------+------------+
+        |      3 | Glass197-M197  |      43.13 |       47.67 |      52.82 |
+        +--------+----------------+------------+-------------+------------+
+        >>> result["names"]
+        ('Glass199-M199', 'Glass198-M198', 'Glass197-M197')
+        >>>
+    """
+    # Check for TypeError and ValueError
+    for material in materials:
+        if not isinstance(material, HT):
+            raise TypeError("The first argument must be HT object of UD composite")
+    if len(materials) < 2:
+        raise ValueError("Expect a baseline and at least one UD composite to rank")
+    row: int = _get_property_row(property)
+    start, end = HT._vf_index.window(min, max)
+    if not isinstance(top, int) or isinstance(top, bool):
+        raise TypeError("Expect top to be an int object")
+    if top < 1:
+        raise ValueError("Expect top to be at least 1")
+    if statistic not in ("mean", "min", "max"):
+        raise ValueError("Expect statistic to be 'mean', 'min' or 'max'")
+    if not isinstance(descending, bool):
+        raise TypeError("Expect descending to be a bool object")
+
+    # Percentage difference of every UD composite to baseline in one operation
+    values: np.ndarray = np.array(
+        [material._get_table()[row, start : end + 1] for material in materials]
+    )
+    diff: np.ndarray = (values[1:] - values[0]) / values[0] * 100
+    scores: np.ndarray = getattr(diff, statistic)(axis=1)
+
+    # Partial sort of top scores, then full sort of the top ones only
+    count: int = top if top < len(scores) else len(scores)
+    keys: np.ndarray = -scores if descending else scores
+    selected: np.ndarray = np.argpartition(keys, count - 1)[:count]
+    selected = selected[np.argsort(keys[selected], kind="stable")]
+
+    # Print ranking table of top UD composites
+    header: str = HT._row_headers[HT._get_property_keys(property)[0]][0]
+    _emit(
+        f"\nRanking of {count} of {len(scores)} UD Composites on "
+        + f"{header.splitlines()[0]} to {materials[0].name.upper()}\n"
+    )
+    _emit(
+        tabulate(
+            [
+                {
+                    "Rank": number,
+                    "UD Composite": materials[index + 1].name,
+                    "min diff\n(%)": diff[index].min(),
+                    "mean diff\n(%)": diff[index].mean(),
+                    "max diff\n(%)": diff[index].max(),
+                }
+                for number, index in enumerate(selected.tolist(), start=1)
+            ],
+            headers="keys",
+            tablefmt="grid",
+            floatfmt=".2f",
+        )
+    )
+
+    # Return ranking of top UD composites
+    return {
+        "baseline": materials[0].name,
+        "Vf": HT._fiber_volfract_array[start : end + 1],
+        "names": tuple(materials[index + 1].name for index in selected.tolist()),
+        "score": scores[selected],
+        "diff": diff[selected],
+    }
+
+
+def pairwise(
+    *materials: HT,
+    property: str = "E1eff",
+    min: int | float | None = None,
+    max: int | float | None = None,
+    full: bool = False,
+) -> dict:
+    """Compare every UD composite to every other UD composite on an effective elastic
+    property, i.e. the largest absolute percentage difference of every pair over the
+    window of fiber volume fraction as a compact summary, e.g. for clustering similar
+    systems across large libraries. The summary is computed in vectorized blocks of
+    64 baselines so memory stays at one block of the all-pairs tensor, which is only
+    built whole when `full` is True.
+
+    : param `materials`: UD composites to be compared
+    : type: ```HT```
+    : param `property`: 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' or 'K23eff'.
+        Default is 'E1eff'
+    : type: str
+    : param `min`: The starting inclusive value of fiber volume fraction range or
+        specific value of fiber volume fraction, or None for full range
+    : type: int | float | None
+    : param `max`: The ending inclusive value of fiber volume fraction range or None
+        when specific value of fiber volume fraction is defined as min
+    : type: int | float | None
+    : param `full`: Also return the all-pairs tensor of percentage difference as
+        'diff'. Default is False
+    : type: bool
+    : raise TypeError: If any material is not HT type, or `full` is not bool
+    : raise ValueError: If there are less than 2 UD composites, `property` is unknown,
+        min is None while max is not None, or the window is not from 0 to 1 or its
+        start is greater than its end
+    : return: Names of UD composites as 'names', fiber volume fractions of window as
+        'Vf', largest absolute percentage difference of composite [j] to composite
+        [i] over window as 'max_abs' of shape (N, N) and, if `full` is True, the
+        percentage difference itself as 'diff' of shape (N, N, number of Vf)
+    : rtype: dict
+
+    Example:
+        >>> result = pairwise(compositeA, compositeB, compositeC, property="E2eff",
+        ...     min=0.5, max=0.6)
+        >>> result["max_abs"].round(2)
+        array([[  0.  ,  36.38,  37.97],
+               [ 57.19,   0.  , 108.23],
+               [ 27.52,  51.98,   0.  ]])
+        >>>
+    """
+    # Check for TypeError and ValueError
+    for material in materials:
+        if not isinstance(material, HT):
+            raise TypeError("The first argument must be HT object of UD composite")
+    if not isinstance(full, bool):
+        raise TypeError("Expect full to be a bool object")
+    if len(materials) < 2:
+        raise ValueError("Expect at least two UD composites to compare")
+    row: int = _get_property_row(property)
+    start, end = HT._vf_index.window(min, max)
+
+    # Percentage difference of a block of baselines to every composite at a time
+    values: np.ndarray = np.array(
+        [material._get_table()[row, start : end + 1] for material in materials]
+    )
+    count: int = len(materials)
+    max_abs: np.ndarray = np.empty((count, count))
+    diff: np.ndarray | None = np.empty((count,) + values.shape) if full else None
+    for first in range(0, count, 64):
+        baselines: np.ndarray = values[first : first + 64, np.newaxis]
+        block: np.ndarray = values[np.newaxis] - baselines
+        block /= baselines
+        block *= 100
+        if diff is not None:
+            diff[first : first + 64] = block
+        np.abs(block, out=block)
+        block.max(axis=2, out=max_abs[first : first + 64])
+
+    # Return all-pairs comparison
+    result: dict = {
+        "names": tuple(material.name for material in materials),
+        "Vf": HT._fiber_volfract_array[start : end + 1],
+        "max_abs": max_abs,
+    }
+    if diff is not None:
+        result["diff"] = diff
+    return result
+
+
+def _get_property_row(property: str) -> int:
+    """Validate an effective elastic property and get its row number in `table` of
+    ```HT``` object.
+
+    Note: A helper function to ``rank`` and ``pairwise`` function.
+
+    : param `property`: 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' or 'K23eff'
+    : type: str
+    : raise TypeError: If `property` is not a str
+    : raise ValueError: If `property` is unknown
+    : return: row number of property
+    : rtype: int
+    """
+    if not isinstance(property, str):
+        raise TypeError("Expect property to be a str object")
+    return HT._table_rows[HT._get_property_keys(property)[0]]
+
+
+def crossovers(
+    *materials: HT,
+    property: str = "G12eff",
+    min: int | float | None = None,
+    max: int | float | None = None,
+) -> list:
+    """Print to screen and return every fiber volume fraction where the effective
+    elastic property of one UD composite overtakes that of another, for every pair of
+    any number of UD composites. The crossovers are detected by vectorized sign change
+    of the difference of every pair on the grid of fiber volume fraction and are then
+    refined to the exact root of the Halpin-Tsai formulae by vectorized bisection of
+    all brackets together.
+
+    : param `materials`: UD composites to be compared
+    : type: ```HT```
+    : param `property`: 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' or 'K23eff'.
+        Default is 'G12eff'
+    : type: str
+    : param `min`: The starting inclusive value of fiber volume fraction range or
+        specific value of fiber volume fraction, or None for full range
+    : type: int | float | None
+    : param `max`: The ending inclusive value of fiber volume fraction range or None
+        when specific value of fiber volume fraction is defined as min
+    : type: int | float | None
+    : raise TypeError: If any material is not HT type
+    : raise ValueError: If there are less than 2 UD composites, `property` is unknown,
+        min is None while max is not None, or the window is not from 0 to 1 or its
+        start is greater than its end
+    : return: (name of first UD composite, name of second UD composite, fiber volume
+        fraction, value of property, name of UD composite that is higher above the
+        crossover) of every crossover in the order of the arguments
+    : rtype: list[tuple[str, str, float, float, str]]
+
+    Example:
+        >>> carbon = Transtropic("Carbon", 250, 25, 20, 10, .28)
+        >>> kevlar = Transtropic("Kevlar", 130, 5, 3, 2, .35)
+        >>> epoxy = Isotropic("Epoxy", 2.8, .3)
+        >>> phenolic = Isotropic("Phenolic", 5, .3)
+        >>> result = crossovers(HT(carbon, epoxy), HT(kevlar, phenolic))
+
+        Crossovers of G12* between 2 UD Composites
+
+        +----------------+-----------------+--------+--------+-------------------+
+        | UD Composite   | UD Composite    |     Vf |   G12* | Higher above Vf   |
+        +================+=================+========+========+===================+
+        | Carbon-Epoxy   | Kevlar-Phenolic | 0.4022 |  2.294 | Carbon-Epoxy      |
+        +----------------+-----------------+--------+--------+-------------------+
+
+        >>> round(result[0][2], 4)
+        0.4022
+        >>>
+    """
+    # Check for TypeError and ValueError
+    for material in materials:
+        if not isinstance(material, HT):
+            raise TypeError("The first argument must be HT object of UD composite")
+    if len(materials) < 2:
+        raise ValueError("Expect at least two UD composites to compare")
+    if not isinstance(property, str):
+        raise TypeError("Expect property to be a str object")
+    key: str = HT._get_property_keys(property)[0]
+    start, end = HT._vf_index.window(min, max)
+
+    # Elastic constants of every fiber and matrix, each of shape (number of UD
+    # composites,) for broadcasting with fiber volume fraction
+    fiber_constants: np.ndarray = np.array(
+        [material.fiber._get_elastic_constants() for material in materials],
+        dtype=float,
+    ).T
+    matrix_constants: np.ndarray = np.array(
+        [material.matrix._get_elastic_constants() for material in materials],
+        dtype=float,
+    ).T
+
+    # Difference of every pair of UD composites on grid of fiber volume fraction
+    vf: np.ndarray = HT._fiber_volfract_array[start : end + 1]
+    values: np.ndarray = _halpin_tsai(
+        fiber_constants[:, :, np.newaxis], matrix_constants[:, :, np.newaxis], vf
+    )[key]
+    first, second = np.triu_indices(len(materials), 1)
+    diff: np.ndarray = values[first] - values[second]
+    signs: np.ndarray = np.sign(
+        np.where(np.abs(diff) > 1e-12 * np.abs(values).max(), diff, 0)
+    )
+
+    # Sign change between neighbouring grid points brackets a root, and a zero at a
+    # grid point between opposite signs is an exact root
+    pairs, lower = np.nonzero(signs[:, :-1] * signs[:, 1:] < 0)
+    exact_pairs, exact = np.nonzero(signs[:, 1:-1] == 0)
+    keep: np.ndarray = signs[exact_pairs, exact] * signs[exact_pairs, exact + 2] < 0
+    exact_pairs, exact = exact_pairs[keep], exact[keep] + 1
+
+    # Refine every bracket together by bisection of the Halpin-Tsai formulae
+    low: np.ndarray = vf[lower]
+    high: np.ndarray = vf[lower + 1]
+    low_signs: np.ndarray = signs[pairs, lower]
+    first_constants: np.ndarray = fiber_constants[:, first[pairs]]
+    second_constants: np.ndarray = fiber_constants[:, second[pairs]]
+    first_matrix: np.ndarray = matrix_constants[:, first[pairs]]
+    second_matrix: np.ndarray = matrix_constants[:, second[pairs]]
+    for _ in range(52):
+        middle: np.ndarray = (low + high) / 2
+        middle_signs: np.ndarray = np.sign(
+            _halpin_tsai(first_constants, first_matrix, middle)[key]
+            - _halpin_tsai(second_constants, second_matrix, middle)[key]
+        )
+        same: np.ndarray = middle_signs == low_signs
+        low = np.where(same, middle, low)
+        high = np.where(same, high, middle)
+    roots: np.ndarray = np.concatenate(((low + high) / 2, vf[exact]))
+    root_pairs: np.ndarray = np.concatenate((pairs, exact_pairs))
+    above: np.ndarray = np.concatenate((-low_signs, signs[exact_pairs, exact + 1]))
+    root_values: np.ndarray = _halpin_tsai(
+        fiber_constants[:, first[root_pairs]],
+        matrix_constants[:, first[root_pairs]],
+        roots,
+    )[key]
+
+    # Collect crossovers in the order of the arguments and fiber volume fraction
+    order: np.ndarray = np.lexsort((roots, root_pairs))
+    hits: list = [
+        (
+            materials[first[pair]].name,
+            materials[second[pair]].name,
+            float(roots[index]),
+            float(root_values[index]),
+            materials[first[pair] if above[index] > 0 else second[pair]].name,
+        )
+        for index, pair in zip(order.tolist(), root_pairs[order].tolist())
+    ]
+
+    # Print crossovers in table format
+    header: str = HT._row_headers[key][0].splitlines()[0]
+    _emit(f"\nCrossovers of {header} between {len(materials)} UD Composites\n")
+    _emit(
+        tabulate(
+            hits,
+            headers=["UD Composite", "UD Composite", "Vf", header, "Higher above Vf"],
+            tablefmt="grid",
+            floatfmt=("", "", ".4f", ".3f", ""),
+        )
+    )
+    _emit()
+
+    # Return crossovers
+    return hits
+
+
+def quickplot(
+    *materials: HT,
+    property: str = "E1eff",
+    min: int | float | None = None,
+    max: int | float | None = None,
+    style: str = "braille",
+    width: int = 60,
+    height: int = 12,
+) -> str:
+    """Print to screen and return a text-mode quick-look plot of an effective elastic
+    property of one UD composite or a comparison set of UD composites versus fiber
+    volume fraction, drawn in Unicode braille dots or block sparklines straight from
+    the columns of ``HT.table`` without matplotlib, e.g. over SSH.
+
+    : param `materials`: UD composites to be plotted
+    : type: ```HT```
+    : param `property`: 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' or 'K23eff'.
+        Default is 'E1eff'
+    : type: str
+    : param `min`: The starting inclusive value of fiber volume fraction range or
+        specific value of fiber volume fraction, or None for full range
+    : type: int | float | None
+    : param `max`: The ending inclusive value of fiber volume fraction range or None
+        when specific value of fiber volume fraction is defined as min
+    : type: int | float | None
+    : param `style`: 'braille' for all curves on one canvas of braille dots, where
+        every curve of several UD composites is marked by its number in the legend,
+        or 'spark' for a sparkline per UD composite, both on a common scale. Default
+        is 'braille'
+    : type: str
+    : param `width`: Number of characters of plot along fiber volume fraction. Default
+        is 60
+    : type: int
+    : param `height`: Number of lines of braille canvas. Default is 12
+    : type: int
+    : raise TypeError: If any material is not HT type, or `width` or `height` is not
+        an int
+    : raise ValueError: If there is no UD composite or more than 35 UD composites on a
+        braille canvas, `property` or `style` is unknown, `width` or `height` is less
+        than 1, min is None while max is not None, or the window is not from 0 to 1 or
+        its start is greater than its end
+    : return: Rendered plot
+    : rtype: str
+
+    Example:
+        >>> carbon = Transtropic("Carbon", 250, 25, 20, 10, .28)
+        >>> epoxy = Isotropic("Epoxy", 2.8, .3)
+        >>> text = quickplot(HT(carbon, epoxy), property="G12eff", style="spark",
+        ...     width=20)
+
+        G12* (GPa) versus Vf from 0.00 to 1.00
+
+        [1] ▁▁▁▁▁▁▁▁▁▂▂▂▂▂▃▃▃▄▆█    1.08 to   20.00   Carbon-Epoxy
+
+        >>>
+    """
+    # Check for TypeError and ValueError
+    if len(materials) == 0:
+        raise ValueError("Expect 'HT' object - UD composite material")
+    for material in materials:
+        if not isinstance(material, HT):
+            raise TypeError("The first argument must be HT object of UD composite")
+    row: int = _get_property_row(property)
+    start, end = HT._vf_index.window(min, max)
+    if style not in ("braille", "spark"):
+        raise ValueError("Expected style to be either 'braille' or 'spark'")
+    markers: str = "123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    if style == "braille" and len(materials) > len(markers):
+        raise ValueError(
+            f"Expect at most {len(markers)} UD composites on braille canvas, or "
+            + "style 'spark'"
+        )
+    for size in (width, height):
+        if not isinstance(size, int) or isinstance(size, bool):
+            raise TypeError("Expect width and height to be int objects")
+        if size < 1:
+            raise ValueError("Expect width and height to be at least 1")
+
+    # Resample every curve of shape (number of UD composites, number of dots) on
+    # evenly spaced fiber volume fraction of the window
+    vf: np.ndarray = HT._fiber_volfract_array[start : end + 1]
+    values: np.ndarray = np.array(
+        [material._get_table()[row, start : end + 1] for material in materials]
+    )
+    dots: int = width * 2 if style == "braille" else width
+    points: np.ndarray = np.linspace(vf[0], vf[-1], dots)
+    curves: np.ndarray = np.array([np.interp(points, vf, value) for value in values])
+
+    # Scale curves on common bounds of all UD composites
+    low: float = float(values.min())
+    high: float = float(values.max())
+    scaled: np.ndarray = (curves - low) / (high - low) if high > low else curves * 0
+    key: str = HT._get_property_keys(property)[0]
+    header: str = " ".join(HT._row_headers[key][0].split())
+    lines: list = [f"\n{header} versus Vf from {vf[0]:.2f} to {vf[-1]:.2f}\n"]
+
+    # Sparkline per UD composite
+    if style == "spark":
+        levels: np.ndarray = np.rint(scaled * 7).astype(int)
+        for number, (material, value, level) in enumerate(
+            zip(materials, values, levels), 1
+        ):
+            lines.append(
+                f"[{number}] {''.join('▁▂▃▄▅▆▇█'[i] for i in level)} "
+                + f"{value.min():7.2f} to {value.max():7.2f}   {material.name}"
+            )
+
+    # Braille canvas of 2 x 4 dots per character, where every curve is joined
+    # vertically between neighbouring dots and dot rows count from the top
+    else:
+        rows: np.ndarray = np.rint((1 - scaled) * (height * 4 - 1)).astype(int)
+        previous: np.ndarray = np.concatenate((rows[:, :1], rows[:, :-1]), axis=1)
+        pixel_rows: np.ndarray = np.arange(height * 4)[:, np.newaxis, np.newaxis]
+        curve_pixels: np.ndarray = (pixel_rows >= np.minimum(rows, previous)) & (
+            pixel_rows <= np.maximum(rows, previous)
+        )
+        pixels: np.ndarray = curve_pixels.any(axis=1)
+        bits: np.ndarray = np.array([[1, 8], [2, 16], [4, 32], [64, 128]])
+        codes: np.ndarray = (
+            pixels.reshape(height, 4, width, 2) * bits[np.newaxis, :, np.newaxis, :]
+        ).sum(axis=(1, 3))
+        canvas: list = [[chr(0x2800 + i) for i in code] for code in codes]
+
+        # Mark every curve of several UD composites by its number in the legend at
+        # the rightmost character that no other curve passes through, if any
+        if len(materials) > 1:
+            cells: np.ndarray = curve_pixels.reshape(
+                height, 4, len(materials), width, 2
+            ).any(axis=(1, 4))
+            marked: set = set()
+            for number in range(len(materials)):
+                others: np.ndarray = np.delete(cells, number, axis=1).any(axis=1)
+                path: list = [(rows[number, j] // 4, j // 2) for j in range(dots)][::-1]
+                free: list = [cell for cell in path if cell not in marked]
+                if free:
+                    cell: tuple = next((c for c in free if not others[c]), free[0])
+                    canvas[cell[0]][cell[1]] = markers[number]
+                    marked.add(cell)
+
+        for number, characters in enumerate(canvas):
+            label: str = (
+                f"{high:9.2f} ┤"
+                if number == 0
+                else f"{low:9.2f} ┤" if number == height - 1 else " " * 9 + " │"
+            )
+            lines.append(label + "".join(characters))
+        lines.append(" " * 10 + "└" + "─" * width)
+        lines.append(
+            " " * 11 + f"{vf[0]:.2f}" + f"{vf[-1]:.2f}".rjust(width - 4)
+            if width >= 10
+            else " " * 11 + f"{vf[0]:.2f}"
+        )
+        lines.append("")
+        for marker, material in zip(markers, materials):
+            lines.append(f"[{marker}] {material.name}")
+
+    # Print and return plot
+    plot_text: str = "\n".join(lines)
+    _emit(plot_text)
+    _emit()
+    return plot_text
+
+
+def save_npz(*materials: HT, folder: str = "npz", library: str | None = None) -> None:
+    """Save the grid of fiber volume fraction, all six effective elastic properties and
+    the elastic constants of fiber and matrix of UD composites to binary NumPy files
+    with filename:
+                                                    "'obj.name'_eff_moduli.npz"
+    for every UD composite, or to a single file of the whole library with filename:
+                                                    "'library'.npz"
+    when keyword parameter 'library' is defined, and confirmations of the respective
+    npz file saved are notified to user. Every file holds the columns 'Vf', 'E1eff',
+    'E2eff', 'G12eff', 'v12eff', 'G23eff' and 'K23eff' of shape (number of UD
+    composites, 101) next to 'names' and the types, names and elastic constants of
+    fibers and matrices, and is read back by ``load_npz``.
+
+    : param `materials`: one or more UD composites
+    : type: ```HT```
+    : param `folder`: the name of the folder where npz files will be saved into.
+        Default folder name is "npz"
+    : type: str
+    : param `library`: name of the single npz file of all UD composites or None for a
+        file per UD composite. Default is None
+    : type: str | None
+    : raise TypeError: when materials is None or when each material in materials is
+        not ```HT``` type, or when folder or library is not a str
+    : raise ValueError: when names of UD composites are not unique, e.g.
+        ```HybridHT``` objects that differ only in hybrid ratio
+    : rtype: None
+
+    Example:
+        >>> save_npz(compositeA, compositeB, library="suppliers")
+        Folder ./npz created
+        ======================= suppliers.npz file saved! ========================
+        >>> load_npz("npz/suppliers.npz")["Carbon-Epoxy"]["E1eff"][50]
+        126.4
+        >>>
+    """
+    # Check for TypeError
+    if len(materials) == 0:
+        raise TypeError("Expect at least 1 UD composite of 'HT' object")
+    for material in materials:
+        if material is None or not isinstance(material, HT):
+            raise TypeError("Expect UD composite of 'HT' object")
+    if folder is None or not isinstance(folder, str):
+        raise TypeError(
+            "Expect keyword parameter folder to have a name and is of a str type"
+        )
+    if library is not None and not isinstance(library, str):
+        raise TypeError("Expect keyword parameter library to be a str object")
+
+    # Check for ValueError, as UD composites are keyed by name in npz files
+    _get_composites_by_name(materials)
+
+    # check whether directory already exists
+    folder_path = f"./{folder}"
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+        _emit(f"Folder {folder_path} created")
+
+    # Save a single file of all UD composites or a file per UD composite
+    groups: list = (
+        [(f"{library}.npz", materials)]
+        if library is not None
+        else [
+            (f"{material.name}_eff_moduli.npz", (material,)) for material in materials
+        ]
+    )
+    for filename, group in groups:
+        np.savez_compressed(
+            os.path.join(folder_path, filename), **_get_npz_columns(group)
+        )
+        _emit_notice(_is_confirmed(folder, filename), filename)
+
+
+def load_npz(file_path: str) -> dict:
+    """Load UD composites saved by ``save_npz`` without re-computing them.
+
+    : param `file_path`: path of npz file
+    : type: str
+    : raise TypeError: If `file_path` is not a str
+    : raise FileNotFoundError: If there is no file at `file_path`
+    : raise ValueError: If names of UD composites in file are not unique
+    : return: columns 'Vf', 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' and 'K23eff'
+        of every UD composite as float arrays of shape (101,) next to its 'fiber' and
+        'matrix' constituents, keyed by the name of UD composite
+    : rtype: dict[str, dict]
+    """
+    # Check for TypeError
+    if not isinstance(file_path, str):
+        raise TypeError("Expect file_path to be a str object")
+
+    # Read all columns at once
+    with np.load(file_path, allow_pickle=False) as data:
+        columns: dict = {key: data[key] for key in data.files}
+
+    # Check for ValueError
+    if len(set(columns["names"].tolist())) != len(columns["names"]):
+        raise ValueError("Expect names of UD composites to be unique")
+
+    # Collect columns and constituents of every UD composite
+    return {
+        str(name): {
+            **{key: columns[key][number] for key in HT._table_rows},
+            "fiber": _get_constituent_from_record(
+                columns["fiber_types"][number],
+                columns["fiber_names"][number],
+                columns["fiber_constants"][number],
+            ),
+            "matrix": _get_constituent_from_record(
+                columns["matrix_types"][number],
+                columns["matrix_names"][number],
+                columns["matrix_constants"][number],
+            ),
+        }
+        for number, name in enumerate(columns["names"])
+    }
+
+
+def _get_npz_columns(materials: tuple[HT, ...]) -> dict:
+    """Get the columns of npz file of UD composites.
+
+    Note: A helper function to ``save_npz`` function.
+
+    : param `materials`: UD composites
+    : type: tuple[HT, ...]
+    : return: names, property columns of shape (number of UD composites, 101) and
+        types, names and elastic constants of fibers and matrices
+    : rtype: dict[str, np.ndarray]
+    """
+    tables: np.ndarray = np.array([material._get_table() for material in materials])
+    columns: dict = {"names": np.array([material.name for material in materials])}
+    for key, row in HT._table_rows.items():
+        columns[key] = tables[:, row]
+    for phase in ("fiber", "matrix"):
+        records: list = [
+            _get_constituent_record(getattr(material, phase)) for material in materials
+        ]
+        columns[f"{phase}_types"] = np.array([record[0] for record in records])
+        columns[f"{phase}_names"] = np.array([record[1] for record in records])
+        columns[f"{phase}_constants"] = np.array(
+            [record[2] for record in records], dtype=float
+        )
+    return columns
+
+
+def _get_constituent_record(constituent: Isotropic | Transtropic) -> tuple:
+    """Get the type, name and independent elastic constants of constituent, i.e.
+    (E, v, nan, nan, nan) of isotropic material and (E1, E2, G12, G23, v12) of
+    transversely isotropic material.
+
+    Note: A helper function to ``save_npz`` function.
+
+    : param `constituent`: fiber or matrix
+    : type: ```Isotropic``` | ```Transtropic```
+    : return: type name, name and five elastic constants
+    : rtype: tuple[str, str, tuple[float, ...]]
+    """
+    if isinstance(constituent, Isotropic):
+        constants: tuple = (
+            constituent.youngs_modulus,
+            constituent.poissons_ratio,
+        ) + (np.nan,) * 3
+    else:
+        constants = (
+            constituent.axial_youngs_modulus,
+            constituent.transverse_youngs_modulus,
+            constituent.axial_shear_modulus,
+            constituent.transverse_shear_modulus,
+            constituent.major_poissons_ratio,
+        )
+    return type(constituent).__name__, constituent.name, tuple(map(float, constants))
+
+
+def _get_constituent_from_record(
+    type_name: str, name: str, constants: np.ndarray
+) -> Isotropic | Transtropic:
+    """Instantiate constituent from its record of ``_get_constituent_record``.
+
+    Note: A helper function to ``load_npz`` function.
+
+    : param `type_name`: 'Isotropic' or 'Transtropic'
+    : type: str
+    : param `name`: name of constituent
+    : type: str
+    : param `constants`: five elastic constants
+    : type: np.ndarray
+    : raise ValueError: If `type_name` is unknown
+    : return: fiber or matrix
+    : rtype: ```Isotropic``` | ```Transtropic```
+    """
+    values: list = [float(value) for value in constants]
+    if type_name == "Isotropic":
+        return Isotropic(str(name), *values[:2])
+    if type_name == "Transtropic":
+        return Transtropic(str(name), *values)
+    raise ValueError("Expect constituent type to be 'Isotropic' or 'Transtropic'")
+
+
+def save(
+    *materials: HT,
+    folder: str = "csv",
+    void_contents: list | tuple | None = None,
+    workers: int | None = None,
+    incremental: bool = False,
+) -> None:
     """Save A) UD composite phases' elastic properties to a csv file/s with filename/s:
             i)   both phases - Isotropic:           "'obj.name'_phases_iso_moduli.csv"
             ii)  both phases - Transtropic:         "'obj.name'_phases_tra_moduli.csv"
@@ -6618,6 +10634,10 @@ def save(*materials: HT, folder: str = "csv") -> None:
 
     and B) effective elastic properties to a different csv format file with a filename:
                                                     "'obj.name' + "_eff_moduli.csv",
+    and C) if keyword parameter 'void_contents' is defined, effective elastic
+    properties on the grid of void contents versus fiber volume fraction to a csv file
+    with a filename:
+                                                    "'obj.name' + "_void_eff_moduli.csv",
     and confirmations of the respective csv file saved are notified to user.
 
     All csv file will be saved in a folder that has the name specified by keyword
@@ -6637,8 +10657,25 @@ def save(*materials: HT, folder: str = "csv") -> None:
     : param `folder`: the name of the folder where csv files will be saved into. Default
         folder name is "csv"
     : type: str
+    : param `void_contents`: void contents, 0 <= Vv < 1, of the additional csv file
+        of effective elastic properties versus void content and fiber volume fraction.
+        Default is None, i.e. no void analysis is saved
+    : type: list | tuple | None
+    : param `workers`: number of threads that write csv files concurrently, e.g. on a
+        network filesystem, where the folder is created once and the confirmations of
+        all files are notified as a single summary. Default is None, i.e. one file
+        after another with a notice per file
+    : type: int | None
+    : param `incremental`: True to skip every UD composite whose csv files are up to
+        date with the content hashes in "'folder'/.manifest.json", i.e. its fiber and
+        matrix, the grid of fiber volume fraction, void_contents and the code are
+        unchanged. Default is False
+    : type: bool
     : raise TypeError: when materials is None or when each material in materials is
-        not ```HT``` type
+        not ```HT``` type, or when void_contents is not a sequence of numbers, or when
+        workers is not an int or incremental is not a bool
+    : raise ValueError: when any of void_contents is not within 0 <= Vv < 1, or when
+        workers is less than 1
     : rtype: None
 
     Example 1: Save to csv file only 1 UD composite (notice that there are 3 csv files
@@ -6686,6 +10723,12 @@ def save(*materials: HT, folder: str = "csv") -> None:
         =========== Fiberglass-Epoxy_phases_iso_moduli.csv file saved! ===========
         ============== Fiberglass-Epoxy_eff_moduli.csv file saved! ===============
         >>>
+
+    Example 3: Save data on 1,000 UD composites by 8 threads
+
+        >>> save(*composites, workers=8)
+        =========================== 3000 files saved! ============================
+        >>>
     """
     # Check for TypeError:
     if len(materials) == 0:
@@ -6698,50 +10741,95 @@ def save(*materials: HT, folder: str = "csv") -> None:
             "Expect keyword parameter folder to have a name and is of a str type"
         )
 
+    # Check for TypeError and ValueError of void contents before any file is saved
+    void_sweeps: list = []
+    if void_contents is not None:
+        void_sweeps = [material.void_sweep(void_contents) for material in materials]
+
+    if not isinstance(incremental, bool):
+        raise TypeError("Expect incremental to be a bool object")
+
+    # Save csv files of UD composites and print confirmation of csv file saved
+    def build(positions: list) -> None:
+        _save_csv_files(
+            _iter_csv_files(
+                tuple(materials[i] for i in positions),
+                [void_sweeps[i] for i in positions] if void_sweeps else [],
+            ),
+            folder,
+            workers,
+        )
+
+    # Save csv files of every UD composite or only of those that are not up to date
+    if incremental:
+        _build_incrementally(
+            materials,
+            folder,
+            "csv",
+            void_contents,
+            lambda material: _get_csv_filenames(material, bool(void_sweeps)),
+            build,
+        )
+    else:
+        build(list(range(len(materials))))
+
+
+def _get_csv_filenames(material: HT, voids: bool = False) -> list:
+    """Get the filenames of csv files that ``save`` function saves of a UD composite.
+
+    Note: A helper function that is called by ``save`` function
+
+    : param `material`: UD composite
+    : type: ```HT```
+    : param `voids`: True if effective elastic properties versus void content are saved
+    : type: bool
+    : return: filenames of csv files
+    : rtype: list[str]
+    """
+    phases_moduli: tuple | list = _get_phase_elastic_moduli_and_filename(material)
+    if isinstance(phases_moduli, tuple):
+        filenames: list = [phases_moduli[1]]
+    else:
+        filenames = [phase_moduli[1] for phase_moduli in phases_moduli]
+    filenames.append(material.name + "_eff_moduli.csv")
+    if voids:
+        filenames.append(material.name + "_void_eff_moduli.csv")
+    return filenames
+
+
+def _iter_csv_files(materials: tuple[HT, ...], void_sweeps: list) -> Iterator[tuple]:
+    """Yield the data of every csv file of ``save`` function together with its
+    filename, i.e. the constituent elastic properties and the effective elastic
+    properties of every UD composite followed by the effective elastic properties
+    versus void content of every UD composite, if any.
+
+    Note: A helper function that is called by ``save`` function
+
+    : param `materials`: UD composites
+    : type: tuple[HT, ...]
+    : param `void_sweeps`: results of ``HT.void_sweep`` of every UD composite or an
+        empty list
+    : type: list
+    : return: pairs of list or generator of dicts of elastic properties and csv
+        filename
+    : rtype: Iterator[tuple[list | Iterator[dict], str]]
+    """
     # Process every UD composite for csv files of record keeping
     for material in materials:
 
-        # Save constituent elastic properties and print confirmation of csv file saved
+        # Constituent elastic properties of the same type or NOT of the same type
         phases_moduli: tuple | list = _get_phase_elastic_moduli_and_filename(material)
-
-        # For constituents that are of the same type
         if isinstance(phases_moduli, tuple):
-            phase_moduli_csv_filename: str = _save_csv_file(
-                phases_moduli[0],  # list of dicts of phase properties
-                folder,
-                phases_moduli[1],  # filename
-            )
-            status_saved_file: bool = _is_confirmed(folder, phase_moduli_csv_filename)
-            print(
-                _get_confirmation_notices(status_saved_file, phase_moduli_csv_filename)
-            )
-
-        # For constituents that are NOT of the same type
+            yield phases_moduli
         else:
-            for phase_moduli in phases_moduli:
-                phase_moduli_csv_filename = _save_csv_file(
-                    phase_moduli[0],  # list of dicts of phase properties
-                    folder,
-                    phase_moduli[1],  # filename
-                )
-                status_saved_file = _is_confirmed(folder, phase_moduli_csv_filename)
-                print(
-                    _get_confirmation_notices(
-                        status_saved_file, phase_moduli_csv_filename
-                    )
-                )
+            yield from phases_moduli
 
-        # Save composite effective properties and print confirmation of csv file saved
-        effective_moduli: tuple = _get_effective_elastic_moduli_and_filename(material)
-        effective_moduli_csv_filename: str = _save_csv_file(
-            effective_moduli[0],  # list of dicts of phase properties
-            folder,
-            effective_moduli[1],  # filename
-        )
-        status_saved_file = _is_confirmed(folder, effective_moduli_csv_filename)
-        print(
-            _get_confirmation_notices(status_saved_file, effective_moduli_csv_filename)
-        )
+        # Composite effective properties streamed row by row
+        yield _get_effective_elastic_rows_and_filename(material)
+
+    # Effective properties versus void content
+    for material, void_sweep in zip(materials, void_sweeps):
+        yield _get_void_effective_elastic_moduli_and_filename(material, void_sweep)
 
 
 def _get_phase_elastic_moduli_and_filename(material: HT | None = None) -> tuple | list:
@@ -6819,7 +10907,9 @@ def _get_effective_elastic_moduli_and_filename(material: HT | None = None) -> tu
     """Get UD composite elastic moduli of UD composite and its associated filename as
     a tuple.
 
-    Note: A helper function that is called by ``save`` function
+    Note: A legacy helper function that is no longer called by ``save``, which writes
+    the generator of ``_get_effective_elastic_rows_and_filename`` row by row. It is
+    kept as a thin wrapper that collects the same rows into a list.
 
     : param `material`: UD composite
     : type: ```HT``` | None
@@ -6832,26 +10922,81 @@ def _get_effective_elastic_moduli_and_filename(material: HT | None = None) -> tu
         raise TypeError("Expect UD composite of 'HT' object")
 
     # Get effective elastic moduli
+    eff_rows, filename = _get_effective_elastic_rows_and_filename(material)
+
+    # Return effective elastic moduli and its assigned csv filename
+    return (list(eff_rows), filename)
+
+
+def _get_effective_elastic_rows_and_filename(material: HT | None = None) -> tuple:
+    """Get a generator of the rows of effective elastic moduli of UD composite, i.e.
+    ``HT.iter_rows``, and its associated filename as a tuple, so that the csv file is
+    written row by row without a list of rows.
+
+    Note: A helper function that is called by ``save`` function
+
+    : param `material`: UD composite
+    : type: ```HT``` | None
+    : raise TypeError: if material is None or not of HT type
+    : return: Generator of effective elastic moduli of UD composite and its assigned
+        filename
+    : rtype: tuple[Iterator[dict], str]
+    """
+    # Check for TypeError
+    if material is None or not isinstance(material, HT):
+        raise TypeError("Expect UD composite of 'HT' object")
+
+    # Return generator of effective elastic moduli and its assigned csv filename
+    return (material.iter_rows(), material.name + "_eff_moduli.csv")
+
+
+def _get_void_effective_elastic_moduli_and_filename(
+    material: HT | None = None, void_sweep: dict | None = None
+) -> tuple:
+    """Get effective elastic moduli of UD composite on the grid of void contents
+    versus fiber volume fraction as rows of csv file and its associated filename.
+
+    Note: A helper function that is called by ``save`` function
+
+    : param `material`: UD composite
+    : type: ```HT``` | None
+    : param `void_sweep`: Result of ``HT.void_sweep`` of `material`
+    : type: dict | None
+    : raise TypeError: if material is None or not of HT type, or if void_sweep is
+        None or not a dict
+    : return: Effective elastic moduli versus void content and fiber volume fraction
+        and its assigned filename
+    : rtype: tuple
+    """
+    # Check for TypeError
+    if material is None or not isinstance(material, HT):
+        raise TypeError("Expect UD composite of 'HT' object")
+    if void_sweep is None or not isinstance(void_sweep, dict):
+        raise TypeError("Expect result of void sweep of a dict object")
+
+    # Get effective elastic moduli row by row of void content and fiber volume fraction
     eff_properties = []
-    for i in range(101):
-        eff_properties.append(
-            {
-                "Vf": material.fiber_volfract[i],
-                "E1*\n(GPa)": material.eff_axial_youngs_moduli[i],
-                "E2*\n(GPa)": material.eff_transverse_youngs_moduli[i],
-                "G12*\n(GPa)": material.eff_axial_shear_moduli[i],
-                "v12*": material.eff_major_poissons_ratios[i],
-                "G23*\n(GPa)": material.eff_transverse_shear_moduli[i],
-                "K23*\n(GPa)": material.eff_pstrain_bulk_moduli[i],
-            }
-        )
+    for i, void_content in enumerate(void_sweep["Vv"]):
+        for j, fiber_volfract in enumerate(void_sweep["Vf"]):
+            eff_properties.append(
+                {
+                    "Vv": f"{void_content:.3f}",
+                    "Vf": f"{fiber_volfract:.2f}",
+                    "E1*\n(GPa)": f"{void_sweep['E1eff'][i, j]:.3f}",
+                    "E2*\n(GPa)": f"{void_sweep['E2eff'][i, j]:.3f}",
+                    "G12*\n(GPa)": f"{void_sweep['G12eff'][i, j]:.3f}",
+                    "v12*": f"{void_sweep['v12eff'][i, j]:.4f}",
+                    "G23*\n(GPa)": f"{void_sweep['G23eff'][i, j]:.3f}",
+                    "K23*\n(GPa)": f"{void_sweep['K23eff'][i, j]:.3f}",
+                }
+            )
 
     # Return effective elastic moduli and its assigned csv filename
-    return (eff_properties, material.name + "_eff_moduli.csv")
+    return (eff_properties, material.name + "_void_eff_moduli.csv")
 
 
 def _save_csv_file(
-    properties: list | None = None,
+    properties: list | Iterator[dict] | None = None,
     folder: str | None = None,
     filename: str | None = None,
 ) -> str:
@@ -6860,20 +11005,21 @@ def _save_csv_file(
     Note: A helper function that is called by ``save`` and ``save_compare`` function
 
     : param `properties`: properties of either composite's phase elastic properties
-        or composite effective elastic properties
-    : type: list | None
+        or composite effective elastic properties as a list or generator of dicts
+    : type: list | Iterator[dict] | None
     : param `folder`: folder where csv file is saved
     : type: str | None
     : param `filename`: the filename of csv file
     : type: str | None
-    : raise TypeError: If `properties` is either None or not a list or tuple, and if
-        `folder` is either None and not str type, and if `filename` is either None and
-        not str type
+    : raise TypeError: If `properties` is either None or not a list or generator, and
+        if `folder` is either None and not str type, and if `filename` is either None
+        and not str type
+    : raise ValueError: If `properties` has no row
     : return: filename of csv file for verification
     : rtype: str
     """
     # Check for TypeError
-    if properties is None or not isinstance(properties, list):
+    if properties is None or not isinstance(properties, list | Iterator):
         raise TypeError(
             "Expect first argument to be phase properties of list object that contains "
             + " dict/s of elastic moduli or effective elastic modulli"
@@ -6882,32 +11028,141 @@ def _save_csv_file(
         raise TypeError("Expect second argument to a folder's name and of a str object")
     if filename is None or not isinstance(filename, str):
         raise TypeError("Expect third argument to a csv filename and of a str object")
-
-    # Get keys from dict and stored as list
-    keys_list: list = list(properties[0].keys())
+    if isinstance(properties, list) and not properties:
+        raise ValueError("Expect at least one row of elastic properties")
 
     # check whether directory already exists
     folder_path = f"./{folder}"
     if not os.path.exists(folder_path):
         os.makedirs(folder_path)
-        print(f"Folder {folder_path} created")
+        _emit(f"Folder {folder_path} created")
 
     # write to csv file with header from keys_list to be save in folder_path
-    file_path = os.path.join(folder_path, filename)
-    with open(file_path, "w") as csv_file:
-        writer = csv.DictWriter(csv_file, fieldnames=keys_list)
-        writer.writeheader()
-        for data in properties:
-            writer.writerow(data)
+    _write_csv_file(properties, os.path.join(folder_path, filename))
 
     # Return 'filename' for verification
     return filename
 
 
+def _write_csv_file(properties: list | Iterator[dict], file_path: str) -> None:
+    """Write csv file of properties row by row with header from the keys of its first
+    dict, so that a generator of rows is never collected in memory.
+
+    Note: A helper function that is called by ``_save_csv_file`` and
+    ``_save_csv_files`` function
+
+    : param `properties`: list or generator of dicts of elastic properties
+    : type: list | Iterator[dict]
+    : param `file_path`: path of csv file
+    : type: str
+    : raise ValueError: If `properties` has no row
+    : rtype: None
+    """
+    # Check for ValueError
+    rows: Iterator[dict] = iter(properties)
+    first_row: dict | None = next(rows, None)
+    if first_row is None:
+        raise ValueError("Expect at least one row of elastic properties")
+    with open(file_path, "w") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=list(first_row.keys()))
+        writer.writeheader()
+        for data in (row for part in ([first_row], rows) for row in part):
+            writer.writerow(
+                {
+                    key: _present(value, "1.0000" if key.endswith("v12*") else "1.000")
+                    for key, value in data.items()
+                }
+            )
+
+
+def _save_csv_files(
+    files: Iterator[tuple], folder: str, workers: int | None = None
+) -> None:
+    """Save csv files in a folder and notify their confirmations, either one by one or
+    concurrently by a pool of threads.
+
+    With `workers`, the folder is created once, at most two files per worker are
+    queued at any time so that the data of the remaining files is only got when a
+    worker is free, and the existence of all files is confirmed by a single listing of
+    the folder. A file that shares its filename with an earlier one, e.g. of
+    ```HybridHT``` objects that differ only in hybrid ratio, is only written after the
+    earlier one is written, so the last of them is kept as it is one after another.
+    The confirmations of the distinct files are then notified as a single summary, or
+    recorded in the active ```OutputBuffer``` of ``quiet`` mode.
+
+    Note: A helper function that is called by ``save`` and ``save_compare`` function
+
+    : param `files`: pairs of list or generator of dicts of elastic properties and
+        csv filename
+    : type: Iterator[tuple[list | Iterator[dict], str]]
+    : param `folder`: folder where csv files are saved
+    : type: str
+    : param `workers`: number of threads or None to save one file after another
+    : type: int | None
+    : raise TypeError: If `workers` is not an int
+    : raise ValueError: If `workers` is less than 1
+    : rtype: None
+    """
+    # Save one file after another
+    if workers is None:
+        for properties, filename in files:
+            csv_filename: str = _save_csv_file(properties, folder, filename)
+            _emit_notice(_is_confirmed(folder, csv_filename), csv_filename)
+        return
+
+    # Check for TypeError and ValueError
+    if not isinstance(workers, int) or isinstance(workers, bool):
+        raise TypeError("Expect workers to be an int object")
+    if workers < 1:
+        raise ValueError("Expect workers to be at least 1")
+
+    # check whether directory already exists
+    folder_path = f"./{folder}"
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+        _emit(f"Folder {folder_path} created")
+
+    # Write files by a pool of threads with a bounded queue, where every thread uses
+    # the decimal context of the caller
+    context: Context = getcontext().copy()
+
+    def write(properties: list | Iterator[dict], filename: str) -> None:
+        with localcontext(context):
+            _write_csv_file(properties, os.path.join(folder_path, filename))
+
+    writes: dict = {}
+    pending: set = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        for properties, filename in files:
+            if len(pending) >= 2 * workers:
+                done, pending = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    future.result()
+
+            # Write files of the same filename in argument order
+            if filename in writes:
+                writes[filename].result()
+            writes[filename] = executor.submit(write, properties, filename)
+            pending.add(writes[filename])
+        for future in concurrent.futures.as_completed(pending):
+            future.result()
+
+    # Confirm all distinct files by a single listing of folder and notify them at once
+    saved: set = set(os.listdir(folder_path))
+    buffer: OutputBuffer = OutputBuffer() if _output_buffer is None else _output_buffer
+    for filename in writes:
+        buffer.notice(filename in saved, filename)
+    if buffer is not _output_buffer:
+        _emit(buffer.summary())
+
+
 def save_compare(
     *materials: HT,
     test_name: str = "compare",
     folder: str = "csv",
+    workers: int | None = None,
 ) -> None:
     """Save the comparison analysis data between at minimum, two (2) or at most, five
     (5) UD composites for every effective elastic property to its own csv format
@@ -6934,10 +11189,14 @@ def save_compare(
     : param `folder`: Keword parameter - the name of the folder where all csv files will
         be saved into. The default folder's name is "csv".
     : type: str
+    : param `workers`: number of threads that write csv files concurrently, where the
+        confirmations of all files are notified as a single summary. Default is None,
+        i.e. one file after another with a notice per file
+    : type: int | None
     : raise TypeError: when each of the individual material in *materials is None and not
-        ```HT``` object
+        ```HT``` object, or when workers is not an int
     : raise ValueError: when the number of material in *materials is less than two (2)
-        or greater than five (5) ```HT``` objects
+        or greater than five (5) ```HT``` objects, or when workers is less than 1
     : rtype: None
 
     Example 1: The comparison data between 4 UD composites are saved as csv files where
@@ -6970,115 +11229,28 @@ def save_compare(
             + "comparison"
         )
     for material in materials:
-        if not isinstance(material, HT):
-            raise TypeError("Expect arguments to be 'HT' type - UD composite material")
-
-    # Save csv for each individual compared elastic property
-    # E1eff comparison
-    comparison_data_E1eff_and_filename: tuple = (
-        _get_csv_comparison_data_and_filename_E1eff(materials, test_name)
-    )
-    csv_filename_comparison_E1eff: str = _save_csv_file(
-        comparison_data_E1eff_and_filename[0],  # comparison data
-        folder,
-        comparison_data_E1eff_and_filename[1],  # csv filename
-    )
-    status_E1eff_saved_file: bool = _is_confirmed(folder, csv_filename_comparison_E1eff)
-    print(
-        _get_confirmation_notices(
-            status_E1eff_saved_file, csv_filename_comparison_E1eff
-        )
-    )
-
-    # E2eff comparison
-    comparison_data_E2eff_and_filename: tuple = (
-        _get_csv_comparison_data_and_filename_E2eff(materials, test_name)
-    )
-    csv_filename_comparison_E2eff: str = _save_csv_file(
-        comparison_data_E2eff_and_filename[0],  # comparison data
-        folder,
-        comparison_data_E2eff_and_filename[1],  # csv filename
-    )
-    status_E2eff_saved_file: bool = _is_confirmed(folder, csv_filename_comparison_E2eff)
-    print(
-        _get_confirmation_notices(
-            status_E2eff_saved_file, csv_filename_comparison_E2eff
-        )
-    )
-
-    # G12eff comparison
-    comparison_data_G12eff_and_filename: tuple = (
-        _get_csv_comparison_data_and_filename_G12eff(materials, test_name)
-    )
-    csv_filename_comparison_G12eff: str = _save_csv_file(
-        comparison_data_G12eff_and_filename[0],  # comparison data
-        folder,
-        comparison_data_G12eff_and_filename[1],  # csv filename
-    )
-    status_G12eff_saved_file: bool = _is_confirmed(
-        folder, csv_filename_comparison_G12eff
-    )
-    print(
-        _get_confirmation_notices(
-            status_G12eff_saved_file, csv_filename_comparison_G12eff
-        )
-    )
-
-    # v12eff comparison
-    comparison_data_v12eff_and_filename: tuple = (
-        _get_csv_comparison_data_and_filename_v12eff(materials, test_name)
-    )
-    csv_filename_comparison_v12eff: str = _save_csv_file(
-        comparison_data_v12eff_and_filename[0],  # comparison data
-        folder,
-        comparison_data_v12eff_and_filename[1],  # csv filename
-    )
-    status_v12eff_saved_file: bool = _is_confirmed(
-        folder, csv_filename_comparison_v12eff
-    )
-    print(
-        _get_confirmation_notices(
-            status_v12eff_saved_file, csv_filename_comparison_v12eff
-        )
-    )
-
-    # G23eff comparison
-    comparison_data_G23eff_and_filename: tuple = (
-        _get_csv_comparison_data_and_filename_G23eff(materials, test_name)
-    )
-    csv_filename_comparison_G23eff: str = _save_csv_file(
-        comparison_data_G23eff_and_filename[0],  # comparison data
-        folder,
-        comparison_data_G23eff_and_filename[1],  # csv filename
-    )
-    status_G23eff_saved_file: bool = _is_confirmed(
-        folder, csv_filename_comparison_G23eff
-    )
-    print(
-        _get_confirmation_notices(
-            status_G23eff_saved_file, csv_filename_comparison_G23eff
-        )
-    )
+        if not isinstance(material, HT):
+            raise TypeError("Expect arguments to be 'HT' type - UD composite material")
 
-    # K23eff comparison
-    comparison_data_K23eff_and_filename: tuple = (
-        _get_csv_comparison_data_and_filename_K23eff(materials, test_name)
-    )
-    csv_filename_comparison_K23eff: str = _save_csv_file(
-        comparison_data_K23eff_and_filename[0],  # comparison data
+    # Save csv for each individual compared elastic property
+    _save_csv_files(
+        (
+            get_comparison_data_and_filename(materials, test_name)
+            for get_comparison_data_and_filename in (
+                _get_csv_comparison_data_and_filename_E1eff,
+                _get_csv_comparison_data_and_filename_E2eff,
+                _get_csv_comparison_data_and_filename_G12eff,
+                _get_csv_comparison_data_and_filename_v12eff,
+                _get_csv_comparison_data_and_filename_G23eff,
+                _get_csv_comparison_data_and_filename_K23eff,
+            )
+        ),
         folder,
-        comparison_data_K23eff_and_filename[1],  # csv filename
-    )
-    status_K23eff_saved_file: bool = _is_confirmed(
-        folder, csv_filename_comparison_K23eff
-    )
-    print(
-        _get_confirmation_notices(
-            status_K23eff_saved_file, csv_filename_comparison_K23eff
-        )
+        workers,
     )
 
 
+@_comparison_cached
 def _get_csv_comparison_data_and_filename_E1eff(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -7120,6 +11292,7 @@ def _get_csv_comparison_data_and_filename_E1eff(
     return (e1eff_comparison_list, test_name + "_E1eff.csv")
 
 
+@_comparison_cached
 def _get_csv_comparison_data_and_filename_E2eff(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -7161,6 +11334,7 @@ def _get_csv_comparison_data_and_filename_E2eff(
     return (e2eff_comparison_list, test_name + "_E2eff.csv")
 
 
+@_comparison_cached
 def _get_csv_comparison_data_and_filename_G12eff(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -7202,6 +11376,7 @@ def _get_csv_comparison_data_and_filename_G12eff(
     return (g12eff_comparison_list, test_name + "_G12eff.csv")
 
 
+@_comparison_cached
 def _get_csv_comparison_data_and_filename_v12eff(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -7243,6 +11418,7 @@ def _get_csv_comparison_data_and_filename_v12eff(
     return (v12eff_comparison_list, test_name + "_v12eff.csv")
 
 
+@_comparison_cached
 def _get_csv_comparison_data_and_filename_G23eff(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -7284,6 +11460,7 @@ def _get_csv_comparison_data_and_filename_G23eff(
     return (g23eff_comparison_list, test_name + "_G23eff.csv")
 
 
+@_comparison_cached
 def _get_csv_comparison_data_and_filename_K23eff(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -7325,7 +11502,12 @@ def _get_csv_comparison_data_and_filename_K23eff(
     return (k23eff_comparison_list, test_name + "_K23eff.csv")
 
 
-def plot(*materials: HT, folder: str = "png") -> None:
+def plot(
+    *materials: HT,
+    folder: str = "png",
+    void_contents: list | tuple | None = None,
+    incremental: bool = False,
+) -> None:
     """Plot six (6) effective elastic properties of UD composite versus fiber volume
     fraction and save them as png format file with a filename according to the effecitve
     elastic property being investigated postfixed with the name of UD composite being
@@ -7344,7 +11526,19 @@ def plot(*materials: HT, folder: str = "png") -> None:
     : type: ```HT```
     : param `folder`: keyword parameter that defines the name of a folder where all plots
          are saved into. The default folder name is "png"
-    : raise TypeError: if material is None or not ```HT``` object.
+    : param `void_contents`: keyword parameter of void contents, 0 <= Vv < 1, where
+        every effective elastic property is additionally plotted with one curve per
+        void content and saved as "'obj.name'_'property'_voids.png". Default is None,
+        i.e. no void analysis is plotted
+    : type: list | tuple | None
+    : param `incremental`: True to skip every UD composite whose png files are up to
+        date with the content hashes in "'folder'/.manifest.json", i.e. its fiber and
+        matrix, the grid of fiber volume fraction, void_contents and the code are
+        unchanged. Default is False
+    : type: bool
+    : raise TypeError: if material is None or not ```HT``` object, or if void_contents
+        is not a sequence of numbers, or if incremental is not a bool
+    : raise ValueError: if any of void_contents is not within 0 <= Vv < 1
     : rtype: None
 
     Example 1: Plot effective elastic properties of 1 UD composite where each elastic
@@ -7424,42 +11618,95 @@ def plot(*materials: HT, folder: str = "png") -> None:
         if not isinstance(material, HT):
             raise TypeError("Expect arguments to be 'HT' type - UD composite material")
 
-    for material in materials:
-        # plot & confirm save for E1eff plot
-        data_E1eff: tuple = _get_E1eff_data_for_plot_and_filename(material)
-        filename_E1eff_plot: str = _plot_and_save(data_E1eff, folder)
-        status_E1eff_saved_plot: bool = _is_confirmed(folder, filename_E1eff_plot)
-        print(_get_confirmation_notices(status_E1eff_saved_plot, filename_E1eff_plot))
-
-        # plot & confirm save for E2eff plot
-        data_E2eff: tuple = _get_E2eff_data_for_plot_and_filename(material)
-        filename_E2eff_plot: str = _plot_and_save(data_E2eff, folder)
-        status_E2eff_saved_plot: bool = _is_confirmed(folder, filename_E2eff_plot)
-        print(_get_confirmation_notices(status_E2eff_saved_plot, filename_E2eff_plot))
-
-        # plot & confirm save for G12eff plot
-        data_G12eff: tuple = _get_G12eff_data_for_plot_and_filename(material)
-        filename_G12eff_plot: str = _plot_and_save(data_G12eff, folder)
-        status_G12eff_saved_plot: bool = _is_confirmed(folder, filename_G12eff_plot)
-        print(_get_confirmation_notices(status_G12eff_saved_plot, filename_G12eff_plot))
-
-        # plot & confirm save for G23eff plot
-        data_G23eff: tuple = _get_G23eff_data_for_plot_and_filename(material)
-        filename_G23eff_plot: str = _plot_and_save(data_G23eff, folder)
-        status_G23eff_saved_plot: bool = _is_confirmed(folder, filename_G23eff_plot)
-        print(_get_confirmation_notices(status_G23eff_saved_plot, filename_G23eff_plot))
-
-        # plot & confirm save for K23eff plot
-        data_K23eff: tuple = _get_K23eff_data_for_plot_and_filename(material)
-        filename_K23eff_plot: str = _plot_and_save(data_K23eff, folder)
-        status_K23eff_saved_plot: bool = _is_confirmed(folder, filename_K23eff_plot)
-        print(_get_confirmation_notices(status_K23eff_saved_plot, filename_K23eff_plot))
-
-        # plot & confirm save for v12eff plot
-        data_v12eff: tuple = _get_v12eff_data_for_plot_and_filename(material)
-        filename_v12eff_plot: str = _plot_and_save(data_v12eff, folder)
-        status_v12eff_saved_plot: bool = _is_confirmed(folder, filename_v12eff_plot)
-        print(_get_confirmation_notices(status_v12eff_saved_plot, filename_v12eff_plot))
+    # Check for TypeError and ValueError of void contents before any file is saved
+    void_sweeps: list = []
+    if void_contents is not None:
+        void_sweeps = [material.void_sweep(void_contents) for material in materials]
+
+    if not isinstance(incremental, bool):
+        raise TypeError("Expect incremental to be a bool object")
+
+    # Plot png files of UD composites and print confirmation of png file saved
+    def build(positions: list) -> None:
+        for material in (materials[i] for i in positions):
+            # plot & confirm save for E1eff plot
+            data_E1eff: tuple = _get_E1eff_data_for_plot_and_filename(material)
+            filename_E1eff_plot: str = _plot_and_save(data_E1eff, folder)
+            status_E1eff_saved_plot: bool = _is_confirmed(folder, filename_E1eff_plot)
+            _emit_notice(status_E1eff_saved_plot, filename_E1eff_plot)
+
+            # plot & confirm save for E2eff plot
+            data_E2eff: tuple = _get_E2eff_data_for_plot_and_filename(material)
+            filename_E2eff_plot: str = _plot_and_save(data_E2eff, folder)
+            status_E2eff_saved_plot: bool = _is_confirmed(folder, filename_E2eff_plot)
+            _emit_notice(status_E2eff_saved_plot, filename_E2eff_plot)
+
+            # plot & confirm save for G12eff plot
+            data_G12eff: tuple = _get_G12eff_data_for_plot_and_filename(material)
+            filename_G12eff_plot: str = _plot_and_save(data_G12eff, folder)
+            status_G12eff_saved_plot: bool = _is_confirmed(folder, filename_G12eff_plot)
+            _emit_notice(status_G12eff_saved_plot, filename_G12eff_plot)
+
+            # plot & confirm save for G23eff plot
+            data_G23eff: tuple = _get_G23eff_data_for_plot_and_filename(material)
+            filename_G23eff_plot: str = _plot_and_save(data_G23eff, folder)
+            status_G23eff_saved_plot: bool = _is_confirmed(folder, filename_G23eff_plot)
+            _emit_notice(status_G23eff_saved_plot, filename_G23eff_plot)
+
+            # plot & confirm save for K23eff plot
+            data_K23eff: tuple = _get_K23eff_data_for_plot_and_filename(material)
+            filename_K23eff_plot: str = _plot_and_save(data_K23eff, folder)
+            status_K23eff_saved_plot: bool = _is_confirmed(folder, filename_K23eff_plot)
+            _emit_notice(status_K23eff_saved_plot, filename_K23eff_plot)
+
+            # plot & confirm save for v12eff plot
+            data_v12eff: tuple = _get_v12eff_data_for_plot_and_filename(material)
+            filename_v12eff_plot: str = _plot_and_save(data_v12eff, folder)
+            status_v12eff_saved_plot: bool = _is_confirmed(folder, filename_v12eff_plot)
+            _emit_notice(status_v12eff_saved_plot, filename_v12eff_plot)
+
+        # plot & confirm save for every effective property versus void content
+        for material, void_sweep in (
+            (materials[i], void_sweeps[i]) for i in positions if void_sweeps
+        ):
+            for key in ("E1eff", "E2eff", "G12eff", "G23eff", "K23eff", "v12eff"):
+                filename_void_plot: str = _plot_void_and_save(
+                    material, void_sweep, key, folder
+                )
+                status_void_saved_plot: bool = _is_confirmed(folder, filename_void_plot)
+                _emit_notice(status_void_saved_plot, filename_void_plot)
+
+    # Plot png files of every UD composite or only of those that are not up to date
+    if incremental:
+        _build_incrementally(
+            materials,
+            folder,
+            "png",
+            void_contents,
+            lambda material: _get_png_filenames(material, bool(void_sweeps)),
+            build,
+        )
+    else:
+        build(list(range(len(materials))))
+
+
+def _get_png_filenames(material: HT, voids: bool = False) -> list:
+    """Get the filenames of png files that ``plot`` function saves of a UD composite.
+
+    Note: A helper function that is called by ``plot`` function
+
+    : param `material`: UD composite
+    : type: ```HT```
+    : param `voids`: True if effective properties versus void content are plotted
+    : type: bool
+    : return: filenames of png files
+    : rtype: list[str]
+    """
+    keys: tuple = ("E1eff", "E2eff", "G12eff", "G23eff", "K23eff", "v12eff")
+    filenames: list = [f"{material.name}_{key}.png" for key in keys]
+    if voids:
+        filenames += [f"{material.name}_{key}_voids.png" for key in keys]
+    return filenames
 
 
 def _plot_and_save(data: tuple | None = None, folder: str | None = None) -> str:
@@ -7558,7 +11805,7 @@ def _plot_and_save(data: tuple | None = None, folder: str | None = None) -> str:
     folder_path = f"./{folder}"
     if not os.path.exists(folder_path):
         os.makedirs(folder_path)
-        print(f"Folder {folder_path} created")
+        _emit(f"Folder {folder_path} created")
 
     # Combine folder path and filename
     file_name = data[0]
@@ -7572,6 +11819,93 @@ def _plot_and_save(data: tuple | None = None, folder: str | None = None) -> str:
     return file_name
 
 
+def _plot_void_and_save(
+    material: HT | None = None,
+    void_sweep: dict | None = None,
+    key: str | None = None,
+    folder: str | None = None,
+) -> str:
+    """Plot specific effective elastic property of UD composite versus fiber volume
+    fraction with one curve per void content, save it as png format file into a folder
+    and then, return back the filename of the saved png file.
+
+    Note: A helper function that is called by ``plot`` function
+
+    : param `material`: UD composite
+    : type: ```HT``` | None
+    : param `void_sweep`: Result of ``HT.void_sweep`` of `material`
+    : type: dict | None
+    : param `key`: Effective elastic property, i.e. 'E1eff', 'E2eff', 'G12eff',
+        'v12eff', 'G23eff' or 'K23eff'
+    : type: str | None
+    : param `folder`: The folder where file containing the plot will be saved into
+    : type: str | None
+    : raise TypeError: If material is not ```HT``` object, void_sweep is not a dict,
+        or key or folder is not str object
+    : raise ValueError: If key is not an effective elastic property
+    : return: Return filename of saved png file that contains the plot
+    : rtype: str
+    """
+    # Labels of y-axis for every effective elastic property
+    labels: dict = {
+        "E1eff": "E1* (GPa)",
+        "E2eff": "E2* (GPa)",
+        "G12eff": "G12* (GPa)",
+        "v12eff": "v12*",
+        "G23eff": "G23* (GPa)",
+        "K23eff": "K23* (GPa)",
+    }
+
+    # Check for TypeError and ValueError
+    if material is None or not isinstance(material, HT):
+        raise TypeError("Expect first argument to UD composite and of a HT object")
+    if void_sweep is None or not isinstance(void_sweep, dict):
+        raise TypeError("Expect second argument to be result of void sweep of a dict")
+    if key is None or not isinstance(key, str):
+        raise TypeError("Expect third argument to be an effective property of a str")
+    if key not in labels:
+        raise ValueError(
+            "Expect third argument either 'E1eff', 'E2eff', 'G12eff', 'v12eff', "
+            + "'G23eff' or 'K23eff'"
+        )
+    if folder is None or not isinstance(folder, str):
+        raise TypeError(
+            "Expect fourth argument to a folder where png file containing plot will be "
+            + "saved and of a str type"
+        )
+
+    # Plot format with one curve per void content
+    plt.figure(figsize=(6, 4))
+    for void_content, values in zip(void_sweep["Vv"], void_sweep[key]):
+        plt.plot(void_sweep["Vf"], values, ls="solid", label=f"Vv = {void_content:.3f}")
+    plt.title(material.name, fontsize=10)
+    plt.xlabel("Vf")
+    plt.ylabel(labels[key])
+    plt.xticks(
+        [0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0],
+        fontsize=9,
+    )
+    plt.yticks(fontsize=9)
+    if key == "v12eff":
+        plt.legend(loc="upper right", fontsize=8.25)
+    else:
+        plt.legend(loc="upper left", fontsize=8.25)
+
+    # Check whether directory already exists
+    folder_path = f"./{folder}"
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+        _emit(f"Folder {folder_path} created")
+
+    # Close plot and save plot to png
+    file_name = f"{material.name}_{key}_voids.png"
+    plt.savefig(os.path.join(folder_path, file_name))
+    plt.close()
+
+    # Return filename of the png file that contains the graph for verification
+    return file_name
+
+
 def _get_E1eff_data_for_plot_and_filename(material: HT) -> tuple:
     """Get plot data for effective axial Young's moduli, E1eff
 
@@ -7795,7 +12129,7 @@ def plot_compare(
     )
     filename_E1eff_plot: str = _plot_compare_and_save(comparison_data_E1eff, folder)
     status_E1eff_saved_plot: bool = _is_confirmed(folder, filename_E1eff_plot)
-    print(_get_confirmation_notices(status_E1eff_saved_plot, filename_E1eff_plot))
+    _emit_notice(status_E1eff_saved_plot, filename_E1eff_plot)
 
     # plot & confirm save for E2eff comparison plot
     comparison_data_E2eff: tuple = _get_comparison_E2eff_data_for_plot_and_filename(
@@ -7803,7 +12137,7 @@ def plot_compare(
     )
     filename_E2eff_plot: str = _plot_compare_and_save(comparison_data_E2eff, folder)
     status_E2eff_saved_plot: bool = _is_confirmed(folder, filename_E2eff_plot)
-    print(_get_confirmation_notices(status_E2eff_saved_plot, filename_E2eff_plot))
+    _emit_notice(status_E2eff_saved_plot, filename_E2eff_plot)
 
     # plot & confirm save for G12eff comparison_plot
     comparison_data_G12eff: tuple = _get_comparison_G12eff_data_for_plot_and_filename(
@@ -7811,7 +12145,7 @@ def plot_compare(
     )
     filename_G12eff_plot: str = _plot_compare_and_save(comparison_data_G12eff, folder)
     status_G12eff_saved_plot: bool = _is_confirmed(folder, filename_G12eff_plot)
-    print(_get_confirmation_notices(status_G12eff_saved_plot, filename_G12eff_plot))
+    _emit_notice(status_G12eff_saved_plot, filename_G12eff_plot)
 
     # plot & confirm save for G23eff comparison plot
     comparison_data_G23eff: tuple = _get_comparison_G23eff_data_for_plot_and_filename(
@@ -7819,7 +12153,7 @@ def plot_compare(
     )
     filename_G23eff_plot: str = _plot_compare_and_save(comparison_data_G23eff, folder)
     status_G23eff_saved_plot: bool = _is_confirmed(folder, filename_G23eff_plot)
-    print(_get_confirmation_notices(status_G23eff_saved_plot, filename_G23eff_plot))
+    _emit_notice(status_G23eff_saved_plot, filename_G23eff_plot)
 
     # plot & confirm save for K23eff comparison plot
     comparison_data_K23eff: tuple = _get_comparison_K23eff_data_for_plot_and_filename(
@@ -7827,7 +12161,7 @@ def plot_compare(
     )
     filename_K23eff_plot: str = _plot_compare_and_save(comparison_data_K23eff, folder)
     status_K23eff_saved_plot: bool = _is_confirmed(folder, filename_K23eff_plot)
-    print(_get_confirmation_notices(status_K23eff_saved_plot, filename_K23eff_plot))
+    _emit_notice(status_K23eff_saved_plot, filename_K23eff_plot)
 
     # plot & confirm save for v12eff comparison plot
     comparison_data_v12eff: tuple = _get_comparison_v12eff_data_for_plot_and_filename(
@@ -7835,7 +12169,7 @@ def plot_compare(
     )
     filename_v12eff_plot: str = _plot_compare_and_save(comparison_data_v12eff, folder)
     status_v12eff_saved_plot: bool = _is_confirmed(folder, filename_v12eff_plot)
-    print(_get_confirmation_notices(status_v12eff_saved_plot, filename_v12eff_plot))
+    _emit_notice(status_v12eff_saved_plot, filename_v12eff_plot)
 
 
 def _plot_compare_and_save(comparison_data: tuple, folder: str) -> str:
@@ -7894,7 +12228,7 @@ def _plot_compare_and_save(comparison_data: tuple, folder: str) -> str:
     folder_path = f"./{folder}"
     if not os.path.exists(folder_path):
         os.makedirs(folder_path)
-        print("Folder %s created" % folder_path)
+        _emit("Folder %s created" % folder_path)
 
     # Combine folder path and filename
     file_name = comparison_data[0]
@@ -7908,6 +12242,7 @@ def _plot_compare_and_save(comparison_data: tuple, folder: str) -> str:
     return file_name
 
 
+@_comparison_cached
 def _get_comparison_E1eff_data_for_plot_and_filename(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -7957,6 +12292,7 @@ def _get_comparison_E1eff_data_for_plot_and_filename(
     )
 
 
+@_comparison_cached
 def _get_comparison_E2eff_data_for_plot_and_filename(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -8006,6 +12342,7 @@ def _get_comparison_E2eff_data_for_plot_and_filename(
     )
 
 
+@_comparison_cached
 def _get_comparison_G12eff_data_for_plot_and_filename(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -8055,6 +12392,7 @@ def _get_comparison_G12eff_data_for_plot_and_filename(
     )
 
 
+@_comparison_cached
 def _get_comparison_v12eff_data_for_plot_and_filename(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -8104,6 +12442,7 @@ def _get_comparison_v12eff_data_for_plot_and_filename(
     )
 
 
+@_comparison_cached
 def _get_comparison_G23eff_data_for_plot_and_filename(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -8153,6 +12492,7 @@ def _get_comparison_G23eff_data_for_plot_and_filename(
     )
 
 
+@_comparison_cached
 def _get_comparison_K23eff_data_for_plot_and_filename(
     materials: tuple[HT, ...], test_name: str
 ) -> tuple:
@@ -8229,6 +12569,188 @@ def _is_confirmed(folder: str | None = None, file_name: str | None = None) -> bo
     return os.path.isfile(file_path)
 
 
+def _build_incrementally(
+    materials: tuple[HT, ...],
+    folder: str,
+    kind: str,
+    options,
+    get_filenames,
+    build,
+) -> None:
+    """Build the files of only the UD composites that are not up to date with the
+    content hashes in the manifest of folder, i.e. "'folder'/.manifest.json", and record
+    the content hashes and files of the built UD composites in the manifest. Of UD
+    composites that share a name, e.g. ```HybridHT``` objects that differ only in
+    hybrid ratio, only the last one is checked and built, as its files are the ones
+    that a full build leaves.
+
+    Note: A helper function that is called by ``save`` and ``plot`` function
+
+    : param `materials`: UD composites
+    : type: tuple[HT, ...]
+    : param `folder`: folder of files and manifest
+    : type: str
+    : param `kind`: kind of files, e.g. 'csv' or 'png'
+    : type: str
+    : param `options`: any other input of files, e.g. void contents
+    : type: Any
+    : param `get_filenames`: function that returns the filenames of a UD composite
+    : type: Callable[[HT], list]
+    : param `build`: function that builds the files of UD composites at given positions
+    : type: Callable[[list], None]
+    : rtype: None
+    """
+    # Find the last UD composite of every name that is not up to date
+    manifest: dict = _load_manifest(folder)
+    latest: dict = {
+        f"{kind}:{material.name}": position
+        for position, material in enumerate(materials)
+    }
+    stale: list = []
+    digests: list = []
+    skipped: int = 0
+    for key, position in sorted(latest.items(), key=lambda item: item[1]):
+        material: HT = materials[position]
+        digest: str = _get_build_digest(kind, (material,), options)
+        if _is_up_to_date(manifest, folder, key, digest):
+            skipped += len(manifest[key]["files"])
+        else:
+            stale.append(position)
+            digests.append(digest)
+    _emit_up_to_date(skipped)
+
+    # Build files and record them in manifest
+    if not stale:
+        return
+    build(stale)
+    for position, digest in zip(stale, digests):
+        material = materials[position]
+        manifest[f"{kind}:{material.name}"] = {
+            "hash": digest,
+            "files": get_filenames(material),
+        }
+    _save_manifest(folder, manifest)
+
+
+def _get_build_digest(kind: str, materials: tuple[HT, ...], options=None) -> str:
+    """Get the content hash of files of UD composites, i.e. the hash of the kind of
+    files, the names, fibers and matrices of UD composites, any other input, the grid
+    of fiber volume fraction and the code of this module.
+
+    Note: A helper function that is called by ``save``, ``plot`` and ``doc`` function
+
+    : param `kind`: kind of files, e.g. 'csv', 'png' or 'pdf'
+    : type: str
+    : param `materials`: UD composites
+    : type: tuple[HT, ...]
+    : param `options`: any other input of files, e.g. void contents
+    : type: Any
+    : return: hexadecimal SHA-256 hash
+    : rtype: str
+    """
+    content: tuple = (
+        kind,
+        [(material.name, material._get_signature()) for material in materials],
+        options,
+    )
+    digest = hashlib.sha256(repr(content).encode())
+    digest.update(HT._fiber_volfract_array.tobytes())
+    digest.update(_get_code_digest().encode())
+    return digest.hexdigest()
+
+
+@functools.cache
+def _get_code_digest() -> str:
+    """Get the hash of the code of this module, which is read once per session.
+
+    Note: A helper function that is called by ``_get_build_digest`` function
+
+    : return: hexadecimal SHA-256 hash
+    : rtype: str
+    """
+    with open(__file__, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def _load_manifest(folder: str) -> dict:
+    """Load the manifest of content hashes of files in folder, i.e.
+    "'folder'/.manifest.json", or an empty one if it does not exist or is unreadable.
+
+    Note: A helper function that is called by ``save``, ``plot`` and ``doc`` function
+
+    : param `folder`: folder of files
+    : type: str
+    : return: entries of content hash and filenames
+    : rtype: dict
+    """
+    try:
+        with open(os.path.join(f"./{folder}", ".manifest.json"), "r") as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _save_manifest(folder: str, manifest: dict) -> None:
+    """Save the manifest of content hashes of files in folder, i.e.
+    "'folder'/.manifest.json", by replacing it at once.
+
+    Note: A helper function that is called by ``save``, ``plot`` and ``doc`` function
+
+    : param `folder`: folder of files
+    : type: str
+    : param `manifest`: entries of content hash and filenames
+    : type: dict
+    : rtype: None
+    """
+    folder_path = f"./{folder}"
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+    file_path = os.path.join(folder_path, ".manifest.json")
+    with open(file_path + ".tmp", "w") as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    os.replace(file_path + ".tmp", file_path)
+
+
+def _is_up_to_date(manifest: dict, folder: str, key: str, digest: str) -> bool:
+    """Check whether the files of an entry of manifest have the content hash and all
+    of them exist.
+
+    Note: A helper function that is called by ``save``, ``plot`` and ``doc`` function
+
+    : param `manifest`: entries of content hash and filenames
+    : type: dict
+    : param `folder`: folder of files
+    : type: str
+    : param `key`: entry of manifest, e.g. 'csv:Carbon-Epoxy'
+    : type: str
+    : param `digest`: current content hash of files
+    : type: str
+    : return: True if files are up to date
+    : rtype: bool
+    """
+    entry = manifest.get(key)
+    return (
+        isinstance(entry, dict)
+        and entry.get("hash") == digest
+        and all(_is_confirmed(folder, file_name) for file_name in entry["files"])
+    )
+
+
+def _emit_up_to_date(count: int) -> None:
+    """Print the number of files skipped because they are up to date, if any.
+
+    Note: A helper function that is called by ``save``, ``plot`` and ``doc`` function
+
+    : param `count`: number of files
+    : type: int
+    : rtype: None
+    """
+    if count:
+        sentence: str = f" {count} file{'' if count == 1 else 's'} up to date "
+        _emit(sentence.center(74, "-"))
+
+
 def _get_confirmation_notices(
     status: bool | None = None, file_name: str | None = None
 ) -> str:
@@ -8268,7 +12790,12 @@ def _get_confirmation_notices(
         return sentence.center(74, "=")
 
 
-def doc(*composites: HT, doc_name: str = "analysis", doc_num: str = "Appx. A") -> None:
+def doc(
+    *composites: HT,
+    doc_name: str = "analysis",
+    doc_num: str = "Appx. A",
+    incremental: bool = False,
+) -> None:
     """Create a pdf document documenting the result of Halpin-Tsai micromechanics
     analysis for a single UD or multiple UD composite material and save it with a
     filename that has prefix name as per defined by user or default value based on the
@@ -8309,7 +12836,13 @@ def doc(*composites: HT, doc_name: str = "analysis", doc_num: str = "Appx. A") -
     : param `doc_name`: Keyword parameter - the name of the pdf report and folder where
         pdf document will be saved into
     : param `doc_num`: Keyword parameter - the serial number of the report.
-    : raise TypeError: When composites is None and is not ```HT``` object
+    : param `incremental`: Keyword parameter - True to save csv files and plot png files
+        of only the UD composites that are not up to date as per ``save`` and ``plot``,
+        and to skip the pdf document when none of its UD composites, `doc_num`, the date
+        and the code has changed. Default is False
+    : type: bool
+    : raise TypeError: When composites is None and is not ```HT``` object, or when
+        incremental is not a bool
     : rtype: None
 
     Example: 2 UD composites are being documented in a single pdf file.
@@ -8368,10 +12901,24 @@ def doc(*composites: HT, doc_name: str = "analysis", doc_num: str = "Appx. A") -
     for composite in composites:
         if not isinstance(composite, HT):
             raise TypeError("Expected argument to be 'HT' object - UD composite")
+    if not isinstance(incremental, bool):
+        raise TypeError("Expected incremental to be a bool object")
 
     # Set today's date for generating report's date in doc and doc_compare function
     today = datetime.date.today()
 
+    # Skip pdf document that is up to date but keep its csv and png files up to date
+    manifest: dict = _load_manifest(f"{doc_name}/pdf") if incremental else {}
+    digest: str = _get_build_digest("pdf", composites, (doc_num, str(today)))
+    if incremental and _is_up_to_date(
+        manifest, f"{doc_name}/pdf", f"pdf:{doc_name}", digest
+    ):
+        for composite in composites:
+            save(composite, folder=f"{doc_name}/csv", incremental=True)
+            plot(composite, folder=f"{doc_name}/png", incremental=True)
+        _emit_up_to_date(1)
+        return
+
     # Define header and footer for adding new page using class
     class PDF(FPDF):  # Inherits from imported FPDF
         """Class for header and footer of FPDF"""
@@ -8505,7 +13052,7 @@ def doc(*composites: HT, doc_name: str = "analysis", doc_num: str = "Appx. A") -
         )
 
         # Save UD composite info to csv file
-        save(composite, folder=f"{doc_name}/csv")
+        save(composite, folder=f"{doc_name}/csv", incremental=incremental)
 
         # Print UD composite constituents' elastic moduli
         # If both constituents' types are Isotropic
@@ -8814,7 +13361,7 @@ def doc(*composites: HT, doc_name: str = "analysis", doc_num: str = "Appx. A") -
         )
 
         # Save plots first
-        plot(composite, folder=f"{doc_name}/png")
+        plot(composite, folder=f"{doc_name}/png", incremental=incremental)
 
         # Print subtitles for the figures
         pdf.ln(61)
@@ -8988,13 +13535,18 @@ def doc(*composites: HT, doc_name: str = "analysis", doc_num: str = "Appx. A") -
     folder_path = f"./{doc_name}/pdf"
     if not os.path.exists(folder_path):
         os.makedirs(folder_path)
-        print("Folder %s created" % folder_path)
+        _emit("Folder %s created" % folder_path)
     file_name = doc_name + "_report.pdf"
     file_path = os.path.join(folder_path, file_name)
     pdf.output(file_path)
-    print("--------------------------------------------------------------------------")
-    print(sentence.center(74))
-    print("''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''")
+    _emit("--------------------------------------------------------------------------")
+    _emit(sentence.center(74))
+    _emit("''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''")
+
+    # Record content hash of pdf document
+    if incremental:
+        manifest[f"pdf:{doc_name}"] = {"hash": digest, "files": [file_name]}
+        _save_manifest(f"{doc_name}/pdf", manifest)
 
 
 def doc_compare(
@@ -10107,13 +14659,419 @@ def doc_compare(
     folder_path = f"./{doc_name}/pdf"
     if not os.path.exists(folder_path):
         os.makedirs(folder_path)
-        print("Folder %s created" % folder_path)
+        _emit("Folder %s created" % folder_path)
     file_name = doc_name + "_report.pdf"
     file_path = os.path.join(folder_path, file_name)
     pdf.output(file_path)
-    print("--------------------------------------------------------------------------")
-    print(sentence.center(74))
-    print("''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''")
+    _emit("--------------------------------------------------------------------------")
+    _emit(sentence.center(74))
+    _emit("''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''")
+
+
+def aggregate(
+    composites: list | tuple,
+    windows: list | tuple,
+    property: str = "E1eff",
+    statistic: str = "mean",
+) -> np.ndarray:
+    """Get an aggregate of an effective elastic property of many UD composites over
+    many windows of fiber volume fraction, e.g. the mean G12eff over a process window
+    for hundreds of composites, where the windows are validated once and every
+    aggregate is answered in constant time by `aggregate_index` of each composite.
+
+    : param `composites`: UD composites
+    : type: list[```HT```] | tuple[```HT```, ...]
+    : param `windows`: (start, end) pairs of fiber volume fraction, where both ends
+        are rounded off to two decimal places and are inclusive
+    : type: list | tuple
+    : param `property`: 'E1eff', 'E2eff', 'G12eff', 'v12eff', 'G23eff' or 'K23eff'.
+        Default is 'E1eff'
+    : type: str
+    : param `statistic`: 'mean', 'sum', 'integral', 'min' or 'max'. Default is 'mean'
+    : type: str
+    : raise TypeError: If `composites` is not a list or tuple of ```HT``` objects,
+        `windows` is not a list or tuple of pairs of numbers, or `property` or
+        `statistic` is not a str
+    : raise ValueError: If `composites` or `windows` is empty, any end is not from 0
+        to 1, any start is greater than its end, or `property` or `statistic` is
+        unknown
+    : return: aggregates of shape (number of composites, number of windows)
+    : rtype: np.ndarray
+
+    Example:
+        >>> aggregate([composite_1, composite_2], [(0.55, 0.65)], "G12eff", "max")
+        array([[4.096],
+               [4.6  ]])
+        >>>
+    """
+    # Check for TypeError and ValueError
+    if not isinstance(composites, list | tuple) or not all(
+        isinstance(composite, HT) for composite in composites
+    ):
+        raise TypeError("Expect composites to be a list or tuple of 'HT' objects")
+    if not isinstance(windows, list | tuple) or not all(
+        isinstance(window, list | tuple) and len(window) == 2 for window in windows
+    ):
+        raise TypeError("Expect windows to be a list or tuple of (start, end) pairs")
+    if not composites or not windows:
+        raise ValueError("Expect at least one composite and one window")
+    start, end = AggregateIndex._get_window_indices(
+        [window[0] for window in windows], [window[1] for window in windows]
+    )
+    row: int = AggregateIndex._get_row(property, statistic)
+
+    # Aggregate all windows of every composite
+    return np.array(
+        [
+            composite.aggregate_index._aggregate_indices(start, end, row, statistic)
+            for composite in composites
+        ]
+    )
+
+
+def comparison_cache_info() -> dict:
+    """Get statistics of the least-recently-used cache of comparison data shared by
+    ``compare``, ``save_compare``, ``plot_compare`` and ``doc_compare``.
+
+    : return: Number of cache hits as 'hits', misses as 'misses', cached comparison
+        data as 'size' and the largest number of them as 'maxsize'
+    : rtype: dict
+
+    Example:
+        >>> compare(compositeA, compositeB)
+        ...
+        >>> compare(compositeA, compositeB)
+        ...
+        >>> comparison_cache_info()
+        {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 128}
+        >>>
+    """
+    return {
+        **_comparison_cache_stats,
+        "size": len(_comparison_cache),
+        "maxsize": _comparison_cache_maxsize,
+    }
+
+
+def clear_comparison_cache(maxsize: int | None = None) -> None:
+    """Clear the cache of comparison data and its statistics, and optionally change the
+    largest number of cached comparison data, where the least recently used ones are
+    evicted first.
+
+    : param `maxsize`: largest number of cached comparison data, 0 to disable caching,
+        or None to keep the current one
+    : type: int | None
+    : raise TypeError: If `maxsize` is neither None nor an int
+    : raise ValueError: If `maxsize` is negative
+    : rtype: None
+    """
+    global _comparison_cache_maxsize
+
+    # Check for TypeError and ValueError
+    if maxsize is not None:
+        if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+            raise TypeError("Expect maxsize to be None or an int object")
+        if maxsize < 0:
+            raise ValueError("Expect maxsize to be zero or positive")
+        _comparison_cache_maxsize = maxsize
+
+    _comparison_cache.clear()
+    _comparison_cache_stats.update(hits=0, misses=0)
+
+
+def set_deferred_quantization(enabled: bool = True) -> None:
+    """Switch between immediate and deferred quantization of the computed values of
+    ```Isotropic```, ```Transtropic``` and ```HT``` objects.
+
+    By default every computed value, e.g. shear modulus of isotropic material or
+    every effective elastic property, is quantized to three (3) decimal places (four
+    (4) for Poisson's ratios) right after it is computed and the quantized values are
+    fed into later formulae. When deferred, all values are computed at full precision
+    of the current decimal context and are rounded only when ``display``, ``save``,
+    ``plot`` and ``doc`` emit them, which avoids a quantize call per operation and the
+    compounding of rounding error. See ``quantization_report``.
+
+    : param `enabled`: True to defer quantization or False to quantize immediately
+    : type: bool
+    : raise TypeError: If `enabled` is not a bool
+    : rtype: None
+
+    Example:
+        >>> set_deferred_quantization(True)
+        >>> Isotropic("Epoxy", 2.8, 0.3).shear_modulus
+        Decimal('1.076923076923076923076923077')
+        >>> set_deferred_quantization(False)
+        >>> Isotropic("Epoxy", 2.8, 0.3).shear_modulus
+        Decimal('1.077')
+        >>>
+    """
+    global _deferred_quantization
+
+    # Check for TypeError
+    if not isinstance(enabled, bool):
+        raise TypeError("Expect argument to be a bool object")
+
+    _deferred_quantization = enabled
+
+
+def quantization_report(*materials: HT, repeat: int = 3) -> dict:
+    """Print and return a report on the speed gain and the accuracy drift removed by
+    deferred quantization, where all effective elastic properties of every UD composite
+    are computed with immediate and with deferred quantization. The speed is the best
+    time of `repeat` runs and the drift is the largest absolute difference between the
+    two modes over the full range of fiber volume fraction. The current quantization
+    mode is restored afterwards.
+
+    : param `materials`: one or more UD composites
+    : type: ```HT```
+    : param `repeat`: number of timed runs per mode, at least 1. Default is 3
+    : type: int
+    : raise TypeError: If no UD composite is given, any material is not ```HT```
+        object, or `repeat` is not int
+    : raise ValueError: If `repeat` is less than 1
+    : return: For every composite name, the times in seconds as 'immediate' and
+        'deferred', the 'speedup' and the 'drift' of every effective elastic property
+    : rtype: dict
+
+    Example:
+        >>> report = quantization_report(composite)
+        +--------------+-------------+------------+------------+---------+-- ...
+        | Composite    |   Immediate |   Deferred |   Speed-up |   Drift |   ...
+        |              |        (ms) |       (ms) |        (x) |   E1eff |   ...
+        +==============+=============+============+============+=========+== ...
+        | Carbon-Epoxy |      3.5442 |     1.9492 |     1.8182 |  0.0000 |   ...
+        +--------------+-------------+------------+------------+---------+-- ...
+        >>> round(report["Carbon-Epoxy"]["drift"]["E2eff"], 4)
+        Decimal('0.0014')
+        >>>
+    """
+    # Check for TypeError and ValueError
+    if len(materials) == 0:
+        raise TypeError("Expect at least 1 UD composite of 'HT' object")
+    for material in materials:
+        if material is None or not isinstance(material, HT):
+            raise TypeError("Expect UD composite of 'HT' object")
+    if not isinstance(repeat, int) or isinstance(repeat, bool):
+        raise TypeError("Expect keyword parameter repeat to be an int object")
+    if repeat < 1:
+        raise ValueError("Expect keyword parameter repeat to be at least 1")
+
+    # Time and compute every effective property in both modes
+    estimates: dict = {
+        "E1eff": HT._estimate_E1eff,
+        "E2eff": HT._estimate_E2eff,
+        "G12eff": HT._estimate_G12eff,
+        "v12eff": HT._estimate_v12eff,
+        "G23eff": HT._estimate_G23eff,
+        "K23eff": HT._estimate_K23eff,
+    }
+    previous_mode: bool = _deferred_quantization
+    report: dict = {}
+    try:
+        for material in materials:
+            times: dict = {}
+            values: dict = {}
+            for mode, deferred in (("immediate", False), ("deferred", True)):
+                set_deferred_quantization(deferred)
+                best: float = float("inf")
+                for _ in range(repeat):
+                    start: float = time.perf_counter()
+                    values[mode] = {
+                        key: estimate(material) for key, estimate in estimates.items()
+                    }
+                    best = min(best, time.perf_counter() - start)
+                times[mode] = best
+            report[material.name] = {
+                **times,
+                "speedup": times["immediate"] / times["deferred"],
+                "drift": {
+                    key: max(
+                        abs(x - y)
+                        for x, y in zip(
+                            values["immediate"][key], values["deferred"][key]
+                        )
+                    )
+                    for key in estimates
+                },
+            }
+    finally:
+        set_deferred_quantization(previous_mode)
+
+    # Print report
+    rows: list = [
+        {
+            "Composite": name,
+            "Immediate\n(ms)": result["immediate"] * 1000,
+            "Deferred\n(ms)": result["deferred"] * 1000,
+            "Speed-up\n(x)": result["speedup"],
+            **{f"Drift\n{key}": float(drift) for key, drift in result["drift"].items()},
+        }
+        for name, result in report.items()
+    ]
+    _emit(tabulate(rows, headers="keys", tablefmt="grid", floatfmt=".4f"))
+
+    # Return report
+    return report
+
+
+def _quantize(value: Decimal, exponent: str = "1.000") -> Decimal:
+    """Quantize a computed value unless quantization is deferred.
+
+    Note: A helper function to the computed elastic constants of ```Isotropic```,
+    ```Transtropic``` and ```HT``` objects.
+
+    : param `value`: computed value
+    : type: Decimal
+    : param `exponent`: decimal places of quantized value, e.g. "1.000"
+    : type: str
+    : return: quantized value, or `value` itself when quantization is deferred
+    : rtype: Decimal
+    """
+    if _deferred_quantization:
+        return value
+    return value.quantize(Decimal(exponent))
+
+
+def _present(value, exponent: str = "1.000"):
+    """Round a Decimal value that carries more decimal places than `exponent` for
+    presentation, i.e. the values computed with deferred quantization. Any other value
+    is returned unchanged.
+
+    Note: A helper function to the functions that emit values, e.g. ``save``.
+
+    : param `value`: value to be emitted
+    : type: Any
+    : param `exponent`: decimal places of presented value, e.g. "1.000"
+    : type: str
+    : return: rounded value or `value` itself
+    : rtype: Any
+    """
+    if (
+        isinstance(value, Decimal)
+        and value.is_finite()
+        and value.as_tuple().exponent < Decimal(exponent).as_tuple().exponent
+    ):
+        return value.quantize(Decimal(exponent))
+    return value
+
+
+@contextlib.contextmanager
+def quiet(summary: bool = True) -> Iterator[OutputBuffer]:
+    """Context manager of a quiet mode where ``HT.E1eff`` and its siblings,
+    ``display``, ``compare``, ``save``, ``save_compare``, ``plot``, ``plot_compare``,
+    ``doc`` and ``doc_compare`` write their rendered text and confirmation notices to
+    one ```OutputBuffer``` instead of printing them. The previous output mode is
+    restored on exit.
+
+    : param `summary`: True to print a single summary of the confirmation notices on
+        exit, if any, or False to print nothing. Default is True
+    : type: bool
+    : raise TypeError: If `summary` is not a bool
+    : return: Buffer of the rendered text and confirmation notices
+    : rtype: ```OutputBuffer```
+
+    Example:
+        >>> with quiet() as output:
+        ...     save(composite)
+        ...
+        ============================= 3 files saved! =============================
+        >>> output.notices[-1]
+        ('Carbon-Epoxy_eff_moduli.csv', True)
+        >>>
+    """
+    global _output_buffer
+
+    # Check for TypeError
+    if not isinstance(summary, bool):
+        raise TypeError("Expect summary to be a bool object")
+
+    previous_buffer: OutputBuffer | None = _output_buffer
+    buffer = OutputBuffer()
+    _output_buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _output_buffer = previous_buffer
+    if summary and len(buffer):
+        _emit(buffer.summary())
+
+
+@contextlib.contextmanager
+def _paged() -> Iterator[None]:
+    """Context manager that streams printed output to the standard input of the
+    system pager, i.e. the command of MANPAGER or PAGER environment variable or else
+    less, or more on Windows, line by line as it is printed rather than after the
+    whole output is rendered. Output is printed as usual when standard input or output is not a
+    terminal. Quitting the pager early stops the output.
+
+    Note: A helper function to both ``display`` and ``compare`` function.
+
+    : rtype: Iterator[None]
+    """
+    command: str = (
+        os.environ.get("MANPAGER")
+        or os.environ.get("PAGER")
+        or ("more" if os.name == "nt" else "less")
+    )
+    if not (sys.stdin.isatty() and sys.stdout.isatty()) or command == "cat":
+        yield
+        return
+
+    # Write printed output to pager as it is printed until pager quits
+    process = subprocess.Popen(
+        command, shell=True, stdin=subprocess.PIPE, text=True, errors="replace"
+    )
+    try:
+        with contextlib.redirect_stdout(process.stdin):
+            yield
+        process.stdin.close()
+    except BrokenPipeError:
+        pass
+    finally:
+        with contextlib.suppress(OSError):
+            process.stdin.close()
+        process.wait()
+
+
+def _emit(*values, sep: str = " ", end: str = "\n") -> None:
+    """Print values or write them to the active ```OutputBuffer``` of ``quiet`` mode.
+
+    Note: A helper function to every function that prints its rendered text.
+
+    : param `values`: values to be emitted
+    : type: Any
+    : param `sep`: string inserted between values. Default is a space
+    : type: str
+    : param `end`: string appended after the last value. Default is a newline
+    : type: str
+    : rtype: None
+    """
+    if _output_buffer is None:
+        print(*values, sep=sep, end=end)
+    else:
+        _output_buffer.write(*values, sep=sep, end=end)
+
+
+def _emit_notice(status: bool | None = None, file_name: str | None = None) -> None:
+    """Print confirmation notice of a file or record it in the active
+    ```OutputBuffer``` of ``quiet`` mode.
+
+    Note: A helper function that is called by ``save``, ``save_compare``, ``plot`` and
+    ``plot_compare`` function
+
+    : param `status`: True or False wether file exists or not respectively
+    : type: bool | None
+    : param `file_name`: Name of the file
+    : type: str | None
+    : raise TypeError: If `status` is None and not boolean type or if `file_name` is
+        None and not str type
+    : rtype: None
+    """
+    notice: str = _get_confirmation_notices(status, file_name)
+    if _output_buffer is None:
+        print(notice)
+    else:
+        _output_buffer.notice(status, file_name)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,14 @@
-from project import Isotropic, Transtropic, HT  # classes in project.py
+from project import Isotropic, Transtropic, HT, HybridHT, MaterialLibrary  # classes
+from project import VfIndex
+from project import set_deferred_quantization, quantization_report
+from project import OutputBuffer, quiet
+from project import AggregateIndex, aggregate
+from project import ResultIndex, NeighborIndex
+from project import rank, pairwise, compare, crossovers, save_compare
+from project import comparison_cache_info, clear_comparison_cache
+from project import _render_table, quickplot
+from project import save_npz, load_npz
+from project import ResultStore, StoredHT
 from project import (  # ``display`` & helper functions that support ``display`` major function
     display,
     _get_main_title_for_UD_composite,
@@ -30,9 +40,12 @@ from project import (  # ``plot`` function & helper functions that support ``plo
     _plot_and_save,
 )
 from decimal import *
+from tabulate import tabulate
+import numpy as np
 import pytest
 import csv
 import os
+import sys
 
 
 # Unit tests conducted only on:
@@ -40,6 +53,31 @@ import os
 #   - Test_Display class: ``display`` major function and all its helper functions
 #   - Test_Save class: ``save`` major function and all its helper functions
 #   - Test_Plot class: ``plot`` major function and all its helper functions
+#   - Test_Temperature class: temperature-dependent constituents and ``HT`` sweep
+#   - Test_Void class: void content dimension of ``HT`` with ``save`` & ``plot``
+#   - Test_HybridHT class: two-fiber ```HybridHT``` and its hybrid ratio sweep
+#   - Test_Quantization class: deferred quantization mode and its report
+#   - Test_MaterialLibrary class: deduplicating ```MaterialLibrary``` and batch sweep
+#   - Test_VfIndex class: index of uniform and non-uniform grids of fiber volume fraction
+#   - Test_Array class: zero-copy float arrays of ``HT`` results
+#   - Test_Query class: vectorized multi-point ``HT.query``
+#   - Test_IterRows class: lazy row generator ``HT.iter_rows`` and streamed tables
+#   - Test_Quiet class: buffered output mode ``quiet`` and ```OutputBuffer```
+#   - Test_Aggregate class: range aggregates of ```AggregateIndex``` & ``aggregate``
+#   - Test_ResultIndex class: filter expressions over ```ResultIndex```
+#   - Test_NeighborIndex class: k-d tree search of ```NeighborIndex```
+#   - Test_Rank class: ``rank`` of any number of UD composites to a baseline
+#   - Test_Pairwise class: all-pairs percentage difference of ``pairwise``
+#   - Test_CompareProperties class: several properties in a single ``compare``
+#   - Test_Crossovers class: crossover detection of ``crossovers``
+#   - Test_Analytics class: slope, curvature and knee of ``HT.analytics``
+#   - Test_ComparisonCache class: shared cache of comparison data
+#   - Test_StreamTable class: streaming table renderer and pager
+#   - Test_QuickPlot class: text-mode plot of ``quickplot``
+#   - Test_Npz class: binary columnar export and import of ``save_npz``/``load_npz``
+#   - Test_ResultStore class: memory-mapped result store of ```ResultStore```
+#   - Test_ConcurrentSave class: concurrent csv writing of ``save``/``save_compare``
+#   - Test_IncrementalBuild class: content-hash manifest of ``save``/``plot``
 
 
 class Test_Isotropic:
@@ -13017,3 +13055,1641 @@ class Test_Plot:
             plot(composite1, none_arg)  # one of the arguments is None
         with pytest.raises(TypeError):
             plot(composite1, carbon)  # one of the arguments is not HT object
+
+
+class Test_Temperature:
+    """
+    Test suite for temperature tables of constituent materials and the vectorized
+    ``temperature_sweep`` method of ```HT``` object.
+    """
+
+    @pytest.fixture
+    def carbon(self):
+        """
+        Provide transversely isotropic carbon fiber without temperature table
+        """
+        return Transtropic("Carbon", 250, 25, 20, 10, 0.28)
+
+    @pytest.fixture
+    def epoxy(self):
+        """
+        Provide isotropic epoxy matrix with temperature table
+        """
+        return Isotropic("Epoxy", 2.8, 0.3, {120: (1.9, 0.33), 23: (2.8, 0.3)})
+
+    def test_temperature_table_output(self, epoxy):
+        """
+        Test that temperature table rows are validated, quantized and sorted
+        """
+        assert epoxy.temperature_table == (
+            (Decimal("23.000"), Decimal("2.800"), Decimal("0.300")),
+            (Decimal("120.000"), Decimal("1.900"), Decimal("0.330")),
+        )
+        assert Isotropic("Epoxy", 2.8, 0.3).temperature_table == ()
+
+    def test_temperature_table_with_invalid_inputs(self, epoxy, carbon):
+        """
+        Test that invalid temperature tables raise TypeError or ValueError
+        """
+        with pytest.raises(TypeError):
+            epoxy.temperature_table = [(23, 2.8, 0.3)]  # not a dict
+        with pytest.raises(TypeError):
+            epoxy.temperature_table = {23: (2.8,)}  # missing Poisson's ratio
+        with pytest.raises(ValueError):
+            epoxy.temperature_table = {}  # empty table
+        with pytest.raises(ValueError):
+            epoxy.temperature_table = {"hot": (2.8, 0.3)}  # invalid temperature
+        with pytest.raises(ValueError):
+            epoxy.temperature_table = {23: (2.8, 0.6)}  # invalid Poisson's ratio
+        with pytest.raises(ValueError):
+            carbon.temperature_table = {23: (250, -25, 20, 10, 0.28)}  # invalid E2
+
+    def test_temperature_sweep_output(self, carbon, epoxy):
+        """
+        Test that sweep at reference temperature agrees with ```HT``` values and that
+        the matrix is interpolated linearly in between table rows
+        """
+        composite = HT(carbon, epoxy)
+        sweep = composite.temperature_sweep([23, 71.5, 120, 200])
+        assert sweep["E2eff"].shape == (4, 101)
+        for key, values in (
+            ("E1eff", composite.eff_axial_youngs_moduli),
+            ("E2eff", composite.eff_transverse_youngs_moduli),
+            ("G12eff", composite.eff_axial_shear_moduli),
+            ("v12eff", composite.eff_major_poissons_ratios),
+            ("G23eff", composite.eff_transverse_shear_moduli),
+            ("K23eff", composite.eff_pstrain_bulk_moduli),
+        ):
+            assert sweep[key][0] == pytest.approx(
+                [float(value) for value in values], abs=2e-3
+            )
+        # Matrix-only composite at Vf = 0 follows matrix table
+        assert sweep["E1eff"][:, 0] == pytest.approx([2.8, 2.35, 1.9, 1.9])
+        assert sweep["v12eff"][:, 0] == pytest.approx([0.3, 0.315, 0.33, 0.33])
+        # Fiber-only composite at Vf = 1 is not temperature-dependent
+        assert sweep["E1eff"][:, 100] == pytest.approx([250.0] * 4)
+
+    def test_temperature_sweep_with_invalid_inputs(self, carbon, epoxy):
+        """
+        Test that invalid temperatures raise TypeError or ValueError
+        """
+        composite = HT(carbon, epoxy)
+        with pytest.raises(TypeError):
+            composite.temperature_sweep(None)
+        with pytest.raises(TypeError):
+            composite.temperature_sweep("23")
+        with pytest.raises(ValueError):
+            composite.temperature_sweep([])
+        with pytest.raises(ValueError):
+            composite.temperature_sweep([23, float("nan")])
+
+
+class Test_Void:
+    """
+    Test suite for the void content dimension of ```HT``` object and the void outputs
+    of ``save`` and ``plot``.
+    """
+
+    @pytest.fixture
+    def composite(self):
+        """
+        Provide carbon-epoxy UD composite
+        """
+        return HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Epoxy", 2.8, 0.3)
+        )
+
+    def test_void_sweep_output(self, composite):
+        """
+        Test that void-free sweep agrees with ```HT``` values and that voids degrade
+        every stiffness monotonically while matrix Poisson's ratio is unchanged
+        """
+        sweep = composite.void_sweep([0, 0.02, 0.05])
+        assert sweep["G23eff"].shape == (3, 101)
+        assert sweep["E2eff"][0] == pytest.approx(
+            [float(value) for value in composite.eff_transverse_youngs_moduli],
+            abs=2e-3,
+        )
+        assert sweep["E1eff"][:, 0] == pytest.approx([2.8, 2.744, 2.66])
+        assert sweep["v12eff"][:, 0] == pytest.approx([0.3] * 3)
+        for key in ("E1eff", "E2eff", "G12eff", "G23eff", "K23eff"):
+            assert (sweep[key][1:, :100] < sweep[key][:-1, :100]).all()
+        # Fiber-only composite at Vf = 1 has no matrix to degrade
+        assert sweep["E1eff"][:, 100] == pytest.approx([250.0] * 3)
+
+    def test_void_sweep_with_invalid_inputs(self, composite):
+        """
+        Test that invalid void contents raise TypeError or ValueError
+        """
+        with pytest.raises(TypeError):
+            composite.void_sweep(None)
+        with pytest.raises(ValueError):
+            composite.void_sweep([0.02, 1])
+        with pytest.raises(ValueError):
+            composite.void_sweep([-0.01])
+
+    def test_save_and_plot_void_output(self, composite):
+        """
+        Test that ``save`` and ``plot`` write the 2-D void outputs
+        """
+        save(composite, folder="void_csv", void_contents=[0.01, 0.03])
+        with open("./void_csv/Carbon-Epoxy_void_eff_moduli.csv") as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 2 * 101
+        assert rows[0]["Vv"] == "0.010" and rows[0]["Vf"] == "0.00"
+        assert rows[101]["Vv"] == "0.030" and rows[-1]["Vf"] == "1.00"
+        plot(composite, folder="void_png", void_contents=[0.01, 0.03])
+        for key in ("E1eff", "E2eff", "G12eff", "G23eff", "K23eff", "v12eff"):
+            assert os.path.exists(f"./void_png/Carbon-Epoxy_{key}_voids.png")
+
+        # Remove folders and files created by the test
+        for folder in ("void_csv", "void_png"):
+            for filename in os.listdir(folder):
+                os.remove(os.path.join(folder, filename))
+            os.rmdir(folder)
+
+    def test_save_and_plot_void_with_invalid_inputs(self, composite):
+        """
+        Test that invalid void contents raise before any file is saved
+        """
+        with pytest.raises(ValueError):
+            save(composite, folder="void_csv", void_contents=[1.5])
+        with pytest.raises(TypeError):
+            plot(composite, folder="void_png", void_contents="0.02")
+        assert not os.path.exists("./void_csv")
+        assert not os.path.exists("./void_png")
+
+
+class Test_HybridHT:
+    """
+    Test suite for hybrid UD composite of two fibers, ```HybridHT```, and its vectorized
+    ``ratio_sweep`` method.
+    """
+
+    @pytest.fixture
+    def hybrid(self):
+        """
+        Provide carbon/fiberglass-epoxy hybrid UD composite
+        """
+        return HybridHT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28),
+            Isotropic("Fiberglass", 120, 0.29),
+            Isotropic("Epoxy", 2.8, 0.3),
+            0.3,
+        )
+
+    def test_hybrid_output(self, hybrid):
+        """
+        Test attributes of hybrid UD composite and its equivalent fiber
+        """
+        assert isinstance(hybrid, HT)
+        assert hybrid.name == "Carbon_Fiberglass-Epoxy"
+        assert hybrid.hybrid_ratio == Decimal("0.300")
+        assert hybrid.fiber.axial_youngs_modulus == Decimal("211.000")
+        assert hybrid.fiber_1.name == "Carbon" and hybrid.fiber_2.name == "Fiberglass"
+
+    def test_hybrid_with_invalid_inputs(self, hybrid):
+        """
+        Test that invalid constituents or hybrid ratio raise TypeError or ValueError
+        """
+        with pytest.raises(TypeError):
+            HybridHT(hybrid.fiber_1, None, hybrid.matrix)
+        with pytest.raises(TypeError):
+            HybridHT(hybrid.fiber_1, hybrid.fiber_2, hybrid.matrix, None)
+        with pytest.raises(ValueError):
+            HybridHT(hybrid.fiber_1, hybrid.fiber_2, hybrid.matrix, 1.2)
+        with pytest.raises(ValueError):
+            HybridHT(hybrid.fiber_1, hybrid.fiber_2, hybrid.matrix, "half")
+
+    def test_ratio_sweep_output(self, hybrid):
+        """
+        Test that the end ratios of sweep agree with single-fiber ```HT``` values and
+        the current hybrid ratio agrees with the hybrid UD composite
+        """
+        sweep = hybrid.ratio_sweep([0, 0.3, 1])
+        assert sweep["K23eff"].shape == (3, 101)
+        for row, composite in (
+            (0, HT(hybrid.fiber_1, hybrid.matrix)),
+            (1, hybrid),
+            (2, HT(hybrid.fiber_2, hybrid.matrix)),
+        ):
+            assert sweep["E2eff"][row] == pytest.approx(
+                [float(value) for value in composite.eff_transverse_youngs_moduli],
+                abs=5e-3,
+            )
+        with pytest.raises(TypeError):
+            hybrid.ratio_sweep(None)
+        with pytest.raises(ValueError):
+            hybrid.ratio_sweep([0.5, 1.5])
+
+
+class Test_Quantization:
+    """
+    Test suite for deferred quantization mode and ``quantization_report``.
+    """
+
+    @pytest.fixture
+    def composite(self):
+        """
+        Provide carbon-epoxy UD composite and restore immediate quantization after test
+        """
+        yield HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Epoxy", 2.8, 0.3)
+        )
+        set_deferred_quantization(False)
+
+    def test_deferred_quantization_output(self, composite):
+        """
+        Test that deferred values keep full precision but are rounded when emitted
+        """
+        set_deferred_quantization(True)
+        assert composite.matrix.shear_modulus == Decimal(str(2.8)) / Decimal("2.6")
+        E2eff = composite.eff_transverse_youngs_moduli[60]
+        assert E2eff.as_tuple().exponent < -3
+        set_deferred_quantization(False)
+        assert composite.matrix.shear_modulus == Decimal("1.077")
+        assert abs(composite.eff_transverse_youngs_moduli[60] - E2eff) < Decimal("0.002")
+
+        set_deferred_quantization(True)
+        _save_csv_file(
+            [{"Vf": Decimal("0.6"), "E2*\n(GPa)": E2eff, "v12*": Decimal("0.29012")}],
+            "csv_quantize",
+            "quantize.csv",
+        )
+        with open("./csv_quantize/quantize.csv") as file:
+            row = list(csv.DictReader(file))[0]
+        assert row["E2*\n(GPa)"] == str(E2eff.quantize(Decimal("1.000")))
+        assert row["v12*"] == "0.2901" and row["Vf"] == "0.6"
+        os.remove("./csv_quantize/quantize.csv")
+        os.rmdir("./csv_quantize")
+
+    def test_quantization_report_output(self, composite, capsys):
+        """
+        Test that report covers every effective property and restores the mode
+        """
+        report = quantization_report(composite, repeat=1)
+        result = report["Carbon-Epoxy"]
+        assert set(result) == {"immediate", "deferred", "speedup", "drift"}
+        assert result["drift"]["E1eff"] == 0
+        assert 0 < result["drift"]["E2eff"] < Decimal("0.002")
+        assert "Carbon-Epoxy" in capsys.readouterr().out
+        assert composite.matrix.shear_modulus == Decimal("1.077")
+
+    def test_quantization_with_invalid_inputs(self, composite):
+        """
+        Test that invalid arguments raise TypeError or ValueError
+        """
+        with pytest.raises(TypeError):
+            set_deferred_quantization("yes")
+        with pytest.raises(TypeError):
+            quantization_report()
+        with pytest.raises(TypeError):
+            quantization_report(composite, repeat=1.5)
+        with pytest.raises(ValueError):
+            quantization_report(composite, repeat=0)
+
+
+class Test_MaterialLibrary:
+    """
+    Test suite for deduplicating ```MaterialLibrary``` container and its batch
+    evaluation mapped back to aliases.
+    """
+
+    @pytest.fixture
+    def library(self):
+        """
+        Provide library of fibers with exact and near duplicates
+        """
+        return MaterialLibrary(
+            [
+                Transtropic("Carbon", 250, 25, 20, 10, 0.28),
+                Isotropic("Fiberglass", 120, 0.29),
+                Transtropic("Carbon_B", 250.1, 25, 20, 10, 0.28),  # near duplicate
+                Isotropic("Glass", 120, 0.29),  # exact duplicate
+                Transtropic("Carbon", 250, 25, 20, 10, 0.28),  # same name interned
+                Isotropic("Basalt", 89, 0.26),
+            ]
+        )
+
+    def test_library_output(self, library):
+        """
+        Test name index, duplicates collapsing and aliases
+        """
+        assert len(library) == 5
+        assert library.names == ("Carbon", "Fiberglass", "Carbon_B", "Glass", "Basalt")
+        assert [constituent.name for constituent in library.unique] == [
+            "Carbon",
+            "Fiberglass",
+            "Basalt",
+        ]
+        assert library["Glass"].name == "Fiberglass"
+        assert library.aliases("Carbon_B") == ("Carbon", "Carbon_B")
+        assert "Basalt" in library and "Kevlar" not in library
+        assert MaterialLibrary(library.unique + library.unique, tolerance=0).names == (
+            "Carbon",
+            "Fiberglass",
+            "Basalt",
+        )
+
+    def test_library_with_invalid_inputs(self, library):
+        """
+        Test that invalid constituents or tolerance raise TypeError or ValueError
+        """
+        with pytest.raises(TypeError):
+            library.add(None)
+        with pytest.raises(TypeError):
+            MaterialLibrary(tolerance="0.1")
+        with pytest.raises(ValueError):
+            MaterialLibrary(tolerance=-1)
+        with pytest.raises(ValueError):
+            library.add(Isotropic("Basalt", 90, 0.26))  # same name, other constants
+        with pytest.raises(ValueError):
+            library.batch_sweep(Isotropic("Epoxy", 2.8, 0.3), role="laminate")
+
+    def test_batch_sweep_output(self, library):
+        """
+        Test that batch sweep agrees with ```HT``` values for every alias and that
+        composites are shared by aliases
+        """
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        sweep = library.batch_sweep(epoxy)
+        assert sweep["names"] == library.names
+        assert sweep["G23eff"].shape == (5, 101)
+        composites = library.composites(epoxy)
+        assert composites["Glass"] is composites["Fiberglass"]
+        for row, name in enumerate(library.names):
+            assert sweep["E2eff"][row] == pytest.approx(
+                [
+                    float(value)
+                    for value in composites[name].eff_transverse_youngs_moduli
+                ],
+                abs=2e-3,
+            )
+        matrix_sweep = library.batch_sweep(epoxy, role="matrix")
+        assert matrix_sweep["E1eff"][:, 100] == pytest.approx([2.8] * 5)
+
+
+class Test_VfIndex:
+    """
+    Test suite for the index of fiber volume fraction of ```HT``` object.
+    """
+
+    def test_get_vf_index_output(self):
+        """
+        Test that hash lookup agrees with searching the tuple of fiber volume fraction
+        """
+        for value in (0, 1, 0.0, 0.005, 0.015, 0.285, 0.5, 0.71154, 0.995, 1.0):
+            assert HT._get_vf_index(value) == HT._fiber_volfract.index(
+                Decimal(round(value, 2)).quantize(Decimal("1.000"))
+            )
+        assert HT._get_vf_indices([0.5, 0.555, 0.6]).tolist() == [50, 56, 60]
+
+    def test_get_vf_index_with_invalid_inputs(self):
+        """
+        Test that invalid fiber volume fractions raise TypeError or ValueError
+        """
+        with pytest.raises(TypeError):
+            HT._get_vf_index("0.5")
+        with pytest.raises(ValueError):
+            HT._get_vf_index(1.2)
+        with pytest.raises(ValueError):
+            HT._get_vf_indices([0.5, -0.1])
+        with pytest.raises(ValueError):
+            HT._vf_index.window(None, 0.5)
+        with pytest.raises(ValueError):
+            VfIndex([0.5, 0.3])
+
+    def test_non_uniform_grid(self):
+        """
+        Test that a non-uniform grid finds exact matches and rejects off-grid values
+        """
+        index = VfIndex([0.3, 0.5, 0.55, 0.6, 0.8])
+        assert not index.uniform and HT._vf_index.uniform
+        assert index.indices([0.8, 0.3, 0.549, 0.6]).tolist() == [4, 0, 2, 3]
+        assert index.window(0.5, 0.6) == (1, 3)
+        assert index.window() == (0, 4)
+        with pytest.raises(ValueError):
+            index.index(0.4)
+        with pytest.raises(ValueError):
+            index.indices([0.5, 0.9])
+        with pytest.raises(TypeError):
+            index.index(True)
+
+
+class Test_Array:
+    """
+    Test suite for the zero-copy float table and arrays of ```HT``` object.
+    """
+
+    @pytest.fixture
+    def composite(self):
+        """
+        Provide carbon-epoxy UD composite
+        """
+        return HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Epoxy", 2.8, 0.3)
+        )
+
+    def test_array_output(self, composite):
+        """
+        Test that arrays equal the Decimal values and are read-only views of table
+        """
+        table = np.asarray(composite)
+        assert table.shape == (7, 101)
+        for array, values in (
+            (composite.Vf_array, composite.fiber_volfract),
+            (composite.E1_array, composite.eff_axial_youngs_moduli),
+            (composite.E2_array, composite.eff_transverse_youngs_moduli),
+            (composite.G12_array, composite.eff_axial_shear_moduli),
+            (composite.v12_array, composite.eff_major_poissons_ratios),
+            (composite.G23_array, composite.eff_transverse_shear_moduli),
+            (composite.K23_array, composite.eff_pstrain_bulk_moduli),
+        ):
+            assert array.tolist() == [float(value) for value in values]
+            assert np.shares_memory(array, table)
+        view = composite.table_range(0.5, 0.6)
+        assert view.shape == (7, 11) and np.shares_memory(view, table)
+        assert view[0, 0] == 0.5 and view[0, -1] == 0.6
+        with pytest.raises(ValueError):
+            composite.E1_array[0] = 0.0
+        assert np.asarray(composite, dtype=np.float32).dtype == np.float32
+
+    def test_array_with_changed_constituent(self, composite):
+        """
+        Test that table is rebuilt after elastic constants of matrix change
+        """
+        table = composite.table
+        assert composite.table is table
+        composite.matrix.youngs_modulus = 3.5
+        assert composite.table is not table
+        assert composite.E1_array[0] == 3.5
+
+    def test_table_range_with_invalid_inputs(self, composite):
+        """
+        Test that invalid range raises TypeError or ValueError
+        """
+        with pytest.raises(TypeError):
+            composite.table_range("0.5", 0.6)
+        with pytest.raises(ValueError):
+            composite.table_range(0.6, 0.5)
+        with pytest.raises(ValueError):
+            composite.table_range(0.5, 1.5)
+
+
+class Test_Query:
+    """
+    Test suite for vectorized multi-point ``query`` method of ```HT``` object.
+    """
+
+    @pytest.fixture
+    def composite(self):
+        """
+        Provide carbon-epoxy UD composite
+        """
+        return HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Epoxy", 2.8, 0.3)
+        )
+
+    def test_query_output(self, composite):
+        """
+        Test that query returns column arrays in the order of requested points
+        """
+        result = composite.query(np.array([0.573, 0.6, 0.55, 0]), ["E1eff", "v12eff"])
+        assert list(result) == ["Vf", "E1eff", "v12eff"]
+        assert result["Vf"].tolist() == [0.57, 0.6, 0.55, 0.0]
+        assert result["E1eff"].tolist() == [
+            float(composite.eff_axial_youngs_moduli[i]) for i in (57, 60, 55, 0)
+        ]
+        assert len(composite.query((1, 0.5))) == 7
+        assert composite.query([0.5], "K23eff")["K23eff"][0] == float(
+            composite.eff_pstrain_bulk_moduli[50]
+        )
+
+    def test_query_with_invalid_inputs(self, composite):
+        """
+        Test that invalid points or properties raise TypeError or ValueError
+        """
+        with pytest.raises(TypeError):
+            composite.query(None)
+        with pytest.raises(TypeError):
+            composite.query([0.5], properties=1)
+        with pytest.raises(ValueError):
+            composite.query([0.5, 1.01])
+        with pytest.raises(ValueError):
+            composite.query([0.5], ["E3eff"])
+
+
+class Test_IterRows:
+    """
+    Test suite for lazy row generator ``iter_rows`` method of ```HT``` object.
+    """
+
+    @pytest.fixture
+    def composite(self):
+        """
+        Provide carbon-epoxy UD composite
+        """
+        return HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Epoxy", 2.8, 0.3)
+        )
+
+    def test_iter_rows_output(self, composite):
+        """
+        Test that rows are yielded lazily and agree with ``save`` rows
+        """
+        rows = composite.iter_rows(0.5, 0.52, ["E1eff", "v12eff"])
+        assert next(rows) == {
+            "Vf": Decimal("0.5"),
+            "E1*\n(GPa)": Decimal("126.400"),
+            "v12*": Decimal("0.2900"),
+        }
+        assert len(list(rows)) == 2
+        assert (
+            list(composite.iter_rows())
+            == _get_effective_elastic_moduli_and_filename(composite)[0]
+        )
+        assert len(list(composite.iter_rows(vf_max=0.1))) == 11
+
+    def test_iter_rows_with_invalid_inputs(self, composite):
+        """
+        Test that invalid arguments raise on call, before any row is requested
+        """
+        with pytest.raises(TypeError):
+            composite.iter_rows("0.5")
+        with pytest.raises(ValueError):
+            composite.iter_rows(0.6, 0.5)
+        with pytest.raises(ValueError):
+            composite.iter_rows(properties=["E1eff", "E3eff"])
+
+    def test_iter_rows_streamed(self, composite):
+        """
+        Test that ``display`` tables and ``save`` files are streamed from rows
+        """
+        with quiet(summary=False) as output:
+            _render_table(composite.iter_rows, "rows")
+        assert output.text.rstrip("\n") == _print_tabulate(
+            _get_effective_properties_versus_full_range_Vf(composite), "keys"
+        )
+        with pytest.raises(ValueError):
+            _render_table(composite.iter_rows, "keys")
+        _save_csv_file(composite.iter_rows(), "stream_test", "rows.csv")
+        _save_csv_file(list(composite.iter_rows()), "stream_test", "list.csv")
+        with open("./stream_test/rows.csv") as rows:
+            with open("./stream_test/list.csv") as values:
+                assert rows.read() == values.read()
+        with pytest.raises(ValueError):
+            _save_csv_file([], "stream_test", "empty.csv")
+        with pytest.raises(ValueError):
+            _save_csv_file(iter([]), "stream_test", "e.csv")
+        for file_name in ("rows.csv", "list.csv"):
+            os.remove(f"./stream_test/{file_name}")
+        os.rmdir("./stream_test")
+
+
+class Test_Quiet:
+    """
+    Test suite for buffered output mode ``quiet`` and its ```OutputBuffer```.
+    """
+
+    @pytest.fixture
+    def composite(self):
+        """
+        Provide carbon-epoxy UD composite
+        """
+        return HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Epoxy", 2.8, 0.3)
+        )
+
+    def test_quiet_buffers_text(self, composite, capsys):
+        """
+        Test that rendered text is written to buffer instead of console
+        """
+        with quiet() as output:
+            composite.E1eff(0.5)
+            display(composite, 0.5)
+        assert capsys.readouterr().out == ""
+        assert output.text.startswith("Vf : E1*\n0.5 : 126.400\n")
+        assert "Carbon-Epoxy" in output.text
+        composite.E1eff(0.5)
+        assert capsys.readouterr().out == "Vf : E1*\n0.5 : 126.400\n"
+
+    def test_quiet_summarizes_notices(self, composite, capsys):
+        """
+        Test that confirmation notices of ``save`` are printed as a single summary
+        """
+        with quiet() as output:
+            save(composite, folder="quiet_csv")
+        assert capsys.readouterr().out == (" 3 files saved! ".center(74, "=") + "\n")
+        assert output.notices[-1] == ("Carbon-Epoxy_eff_moduli.csv", True)
+        assert len(output) == 3
+        for file_name in os.listdir("./quiet_csv"):
+            os.remove(os.path.join("./quiet_csv", file_name))
+        os.rmdir("./quiet_csv")
+
+    def test_output_buffer_summary_and_invalid_inputs(self):
+        """
+        Test summary of missing files and invalid arguments
+        """
+        buffer = OutputBuffer()
+        buffer.write("a", 1, sep="-")
+        buffer.notice(True, "a.csv")
+        buffer.notice(False, "b.csv")
+        assert buffer.text == "a-1\n"
+        assert buffer.summary().splitlines() == [
+            " 1 file saved! ".center(74, "="),
+            " b.csv is missing! ".center(74, "="),
+        ]
+        with pytest.raises(TypeError):
+            buffer.notice("True", "a.csv")
+        with pytest.raises(TypeError):
+            with quiet(summary=None):
+                pass
+
+
+class Test_Aggregate:
+    """
+    Test suite for range aggregates of ```AggregateIndex``` and ``aggregate`` function.
+    """
+
+    @pytest.fixture
+    def composite(self):
+        """
+        Provide carbon-epoxy UD composite
+        """
+        return HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Epoxy", 2.8, 0.3)
+        )
+
+    def test_aggregate_index_output(self, composite):
+        """
+        Test that every aggregate agrees with a direct computation over the window
+        """
+        index = composite.aggregate_index
+        assert isinstance(index, AggregateIndex)
+        assert composite.aggregate_index is index
+        window = composite.table_range(0.55, 0.65)
+        assert index.aggregate(0.55, 0.65, "G12eff") == pytest.approx(window[3].mean())
+        assert index.aggregate(0.55, 0.65, "G12eff", "sum") == pytest.approx(
+            window[3].sum()
+        )
+        assert index.aggregate(0.55, 0.65, "G12eff", "min") == 3.178
+        assert index.aggregate(0.55, 0.65, "G12eff", "max") == 4.096
+        assert index.aggregate(0, 1, "E1eff", "integral") == pytest.approx(126.4)
+        assert index.aggregate([0.5, 0.55], [0.6, 0.65], "G12eff", "max").tolist() == [
+            3.592,
+            4.096,
+        ]
+        assert index.aggregate(0.6, 0.6, "E2eff", "min") == composite.E2_array[60]
+
+    def test_aggregate_batch_output(self, composite):
+        """
+        Test that batch aggregate returns one row per composite and one column per window
+        """
+        other = HT(Isotropic("Fiberglass", 120, 0.29), Isotropic("Epoxy", 2.8, 0.3))
+        result = aggregate(
+            [composite, other], [(0.55, 0.65), (0, 0.1)], "G12eff", "max"
+        )
+        assert result.shape == (2, 2)
+        assert result[0, 0] == 4.096
+        assert result[1, 0] == 4.6
+
+    def test_aggregate_with_invalid_inputs(self, composite):
+        """
+        Test that invalid windows, properties and statistics raise
+        """
+        index = composite.aggregate_index
+        with pytest.raises(ValueError):
+            index.aggregate(0.6, 0.5)
+        with pytest.raises(ValueError):
+            index.aggregate([0.5, 0.6], [0.7])
+        with pytest.raises(ValueError):
+            index.aggregate(0.5, 0.6, "E1eff", "median")
+        with pytest.raises(TypeError):
+            index.aggregate(0.5, 0.6, statistic=1)
+        with pytest.raises(TypeError):
+            aggregate([composite, "Carbon-Epoxy"], [(0.5, 0.6)])
+        with pytest.raises(TypeError):
+            aggregate([composite], [0.5])
+
+
+class Test_ResultIndex:
+    """
+    Test suite for filter expressions over library-wide ```ResultIndex```.
+    """
+
+    @pytest.fixture
+    def index(self):
+        """
+        Provide result index of carbon-epoxy and fiberglass-epoxy UD composites
+        """
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        return ResultIndex(
+            [
+                HT(Transtropic("Carbon", 250, 25, 20, 10, 0.28), epoxy),
+                HT(Isotropic("Fiberglass", 120, 0.29), epoxy),
+            ]
+        )
+
+    def test_filter_output(self, index):
+        """
+        Test that hits are the contiguous Vf intervals where the expression holds
+        """
+        assert index.names == ("Carbon-Epoxy", "Fiberglass-Epoxy")
+        assert index.filter("E1eff > 150 and v12eff < 0.3", 0.5, 0.65) == [
+            ("Carbon-Epoxy", 0.6, 0.65)
+        ]
+        assert index.filter("(E1eff > 150 or E2eff >= 10) and v12eff < 0.3") == [
+            ("Carbon-Epoxy", 0.6, 1.0),
+            ("Fiberglass-Epoxy", 0.63, 1.0),
+        ]
+        assert index.filter("E1eff > 1000") == []
+
+    def test_mask_output(self, index):
+        """
+        Test that mask agrees with a direct comparison of the tables
+        """
+        mask = index.mask("G12eff > 5 or E2eff < 4")
+        carbon = HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Epoxy", 2.8, 0.3)
+        )
+        assert mask.shape == (2, 101)
+        expected = (carbon.G12_array > 5) | (carbon.E2_array < 4)
+        assert mask[0].tolist() == expected.tolist()
+        assert not index.mask("E1eff >= 0", 0.2, 0.3)[:, 31:].any()
+
+    def test_filter_with_invalid_inputs(self, index):
+        """
+        Test that malformed expressions, unknown properties and windows raise
+        """
+        with pytest.raises(TypeError):
+            index.filter(150)
+        with pytest.raises(TypeError):
+            ResultIndex(["Carbon-Epoxy"])
+        carbon = Transtropic("Carbon", 250, 25, 20, 10, 0.28)
+        glass = Isotropic("Glass", 70, 0.2)
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        with pytest.raises(ValueError):
+            ResultIndex([HybridHT(carbon, glass, epoxy, r) for r in (0.2, 0.5, 0.8)])
+        for expression in ("E1eff >", "E3eff > 1", "(E1eff > 1", "E1eff ! 1", ""):
+            with pytest.raises(ValueError):
+                index.filter(expression)
+        with pytest.raises(ValueError):
+            index.filter("E1eff > 1", 0.6, 0.5)
+
+
+class Test_NeighborIndex:
+    """
+    Test suite for nearest-neighbor and radius search of ```NeighborIndex```.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide UD composites of epoxy matrix and fibers of various stiffness
+        """
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        return [
+            HT(Isotropic(f"Fiber{i}", 50 + 7 * i, 0.2 + i / 400), epoxy)
+            for i in range(40)
+        ]
+
+    def _brute_force(self, composites, target):
+        """
+        Return normalized distances of all points in the order of insertion
+        """
+        points = np.concatenate([c.table[[1, 2, 3, 4]].T for c in composites])
+        weights = 1 / np.ptp(points, axis=0)
+        return np.sqrt((((points - target) * weights) ** 2).sum(axis=1))
+
+    def test_nearest_and_within_output(self, composites):
+        """
+        Test that k-NN and radius search agree with brute force after insertions
+        """
+        index = NeighborIndex(composites[:10], leaf_size=4)
+        for i in range(10, 40, 3):
+            index.insert(composites[i : i + 3])
+        assert len(index) == 40 * 101
+        target = [180, 6, 2.5, 0.27]
+        distances = self._brute_force(composites, np.array(target))
+        expected = np.sort(distances)[:5]
+        hits = index.nearest(target, k=5)
+        assert [hit[2] for hit in hits] == pytest.approx(expected)
+        radius = float((expected[3] + expected[4]) / 2)
+        assert len(index.within(target, radius)) == 4
+        name, vf, _ = hits[0]
+        row = composites[index.names.index(name)].query([vf], ["E1eff", "v12eff"])
+        assert abs(row["E1eff"][0] - 180) < 10
+
+    def test_nearest_with_target_dict(self, composites):
+        """
+        Test that a target keyed by property equals the same target in order
+        """
+        index = NeighborIndex(composites, properties=["E2eff", "G12eff"])
+        assert index.properties == ("E2eff", "G12eff")
+        assert index.nearest({"G12eff": 2.5, "E2eff": 6}, 3) == index.nearest(
+            (6, 2.5), 3
+        )
+
+    def test_neighbor_index_with_invalid_inputs(self, composites):
+        """
+        Test that invalid composites, targets and arguments raise
+        """
+        index = NeighborIndex(composites[:2])
+        with pytest.raises(ValueError):
+            index.insert(composites[:1])
+        with pytest.raises(TypeError):
+            index.insert(["Carbon-Epoxy"])
+        carbon = Transtropic("Carbon", 250, 25, 20, 10, 0.28)
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        hybrids = [HybridHT(carbon, composites[5].fiber, epoxy, r) for r in (0.2, 0.8)]
+        with pytest.raises(ValueError):
+            NeighborIndex(hybrids)
+        with pytest.raises(ValueError):
+            index.insert(hybrids)
+        assert len(index) == 2 * 101
+        with pytest.raises(ValueError):
+            index.nearest([180, 6])
+        with pytest.raises(ValueError):
+            index.nearest([180, 6, 2.5, 0.27], k=0)
+        with pytest.raises(TypeError):
+            index.within([180, 6, 2.5, 0.27], "0.1")
+        with pytest.raises(ValueError):
+            NeighborIndex(properties=["E3eff"])
+
+
+class Test_Rank:
+    """
+    Test suite for ``rank`` of any number of UD composites to a baseline.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide carbon-phenolic baseline followed by 20 fiberglass-epoxy candidates
+        """
+        baseline = HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Phenolic", 5, 0.3)
+        )
+        return [baseline] + [
+            HT(Isotropic(f"Glass{i}", 60 + 3 * i, 0.25), Isotropic("Epoxy", 2.8, 0.3))
+            for i in range(20)
+        ]
+
+    def test_rank_output(self, composites, capsys):
+        """
+        Test that top composites agree with a full sort of percentage differences
+        """
+        result = rank(*composites, property="E1eff", min=0.55, max=0.65, top=3)
+        baseline = composites[0].table_range(0.55, 0.65)[1]
+        means = [
+            ((c.table_range(0.55, 0.65)[1] - baseline) / baseline * 100).mean()
+            for c in composites[1:]
+        ]
+        order = np.argsort(means)[::-1][:3]
+        assert result["names"] == tuple(composites[i + 1].name for i in order)
+        assert result["score"] == pytest.approx(np.array(means)[order])
+        assert result["diff"].shape == (3, 11)
+        assert result["Vf"][0] == 0.55
+        output = capsys.readouterr().out
+        assert "Ranking of 3 of 20 UD Composites on E1* to CARBON-PHENOLIC" in output
+        assert output.count("Glass") == 3
+
+    def test_rank_specific_value_and_ascending(self, composites, capsys):
+        """
+        Test ranking at a specific Vf, smallest first, beyond the number of composites
+        """
+        result = rank(*composites, property="G12eff", min=0.6, top=50, descending=False)
+        assert len(result["names"]) == 20
+        assert list(result["score"]) == sorted(result["score"])
+        assert result["diff"].shape == (20, 1)
+
+    def test_rank_with_invalid_inputs(self, composites):
+        """
+        Test that invalid composites and arguments raise
+        """
+        with pytest.raises(ValueError):
+            rank(composites[0])
+        with pytest.raises(TypeError):
+            rank(composites[0], "Carbon-Epoxy")
+        with pytest.raises(ValueError):
+            rank(*composites, property="E3eff")
+        with pytest.raises(ValueError):
+            rank(*composites, max=0.5)
+        with pytest.raises(ValueError):
+            rank(*composites, min=0.7, max=0.5)
+        with pytest.raises(ValueError):
+            rank(*composites, top=0)
+        with pytest.raises(ValueError):
+            rank(*composites, statistic="median")
+
+
+class Test_Pairwise:
+    """
+    Test suite for all-pairs percentage difference of ``pairwise`` function.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide carbon-phenolic, carbon-epoxy and fiberglass-phenolic UD composites
+        """
+        carbon = Transtropic("Carbon", 250, 25, 20, 10, 0.28)
+        phenolic = Isotropic("Phenolic", 5, 0.3)
+        return (
+            HT(carbon, phenolic),
+            HT(carbon, Isotropic("Epoxy", 2.8, 0.3)),
+            HT(Isotropic("Fiberglass", 120, 0.29), phenolic),
+        )
+
+    def test_pairwise_output(self, composites):
+        """
+        Test that every pair agrees with the percentage difference of ``compare``
+        """
+        result = pairwise(*composites, property="E2eff", min=0.5, max=0.6, full=True)
+        assert result["names"] == (
+            "Carbon-Phenolic",
+            "Carbon-Epoxy",
+            "Fiberglass-Phenolic",
+        )
+        assert result["diff"].shape == (3, 3, 11)
+        assert not result["diff"][[0, 1, 2], [0, 1, 2]].any()
+        first, second = composites[0].E2_array[55], composites[1].E2_array[55]
+        assert result["diff"][0, 1, 5] == pytest.approx((second - first) / first * 100)
+        assert result["max_abs"].round(2).tolist()[1] == [57.19, 0.0, 108.23]
+        summary = pairwise(*composites * 30, property="E2eff", min=0.5, max=0.6)
+        assert "diff" not in summary
+        assert summary["max_abs"][[1, 61], 32].round(2).tolist() == [108.23] * 2
+
+    def test_pairwise_with_invalid_inputs(self, composites):
+        """
+        Test that invalid composites and arguments raise
+        """
+        with pytest.raises(ValueError):
+            pairwise(composites[0])
+        with pytest.raises(TypeError):
+            pairwise(composites[0], "Carbon-Epoxy")
+        with pytest.raises(ValueError):
+            pairwise(*composites, property="E3eff")
+        with pytest.raises(ValueError):
+            pairwise(*composites, min=0.7, max=0.5)
+        with pytest.raises(TypeError):
+            pairwise(*composites, full=None)
+
+
+class Test_CompareProperties:
+    """
+    Test suite for several effective elastic properties in a single ``compare``.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide carbon-phenolic and carbon-epoxy UD composites
+        """
+        carbon = Transtropic("Carbon", 250, 25, 20, 10, 0.28)
+        return (
+            HT(carbon, Isotropic("Phenolic", 5, 0.3)),
+            HT(carbon, Isotropic("Epoxy", 2.8, 0.3)),
+        )
+
+    def test_compare_several_properties(self, composites, capsys):
+        """
+        Test that shared sub-tables are printed once and every property is compared
+        """
+        compare(*composites, property=["G23eff", "K23eff"], min=0.5)
+        output = capsys.readouterr().out
+        assert output.count("Fibers on Plane-Strain Bulk Modulus Comparison") == 1
+        assert output.count("Comparison of Effective Elastic Property") == 1
+        assert "|    G23* |" in output and "|    K23* |" in output
+
+    def test_compare_all_properties(self, composites, capsys):
+        """
+        Test that 'all' equals the single-property comparisons of every property
+        """
+        compare(*composites, property="all", min=0.4, max=0.42)
+        output = capsys.readouterr().out
+        assert "vi) 2 Matrices on Plane-Strain Bulk Modulus Comparison" in output
+        for key in ("E1eff", "E2eff", "G12eff", "v12eff", "G23eff", "K23eff"):
+            compare(*composites, property=key, min=0.4, max=0.42)
+            single = capsys.readouterr().out
+            table = single[single.index("D) Comparison") :].split("\n", 2)[2]
+            assert table in output
+        compare(*composites, property="E2eff")
+        assert "Phenolic |   Epoxy" in capsys.readouterr().out
+
+    def test_compare_with_invalid_properties(self, composites):
+        """
+        Test that unknown properties raise before anything is printed
+        """
+        with pytest.raises(ValueError):
+            compare(*composites, property=["E1eff", "E3eff"])
+        with pytest.raises(ValueError):
+            compare(*composites, property=[])
+        with pytest.raises(ValueError):
+            compare(*composites, property=None)
+
+
+class Test_Crossovers:
+    """
+    Test suite for crossover detection of ``crossovers`` function.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide carbon-epoxy, kevlar-phenolic and fiberglass-epoxy UD composites
+        """
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        return (
+            HT(Transtropic("Carbon", 250, 25, 20, 10, 0.28), epoxy),
+            HT(
+                Transtropic("Kevlar", 130, 5, 3, 2, 0.35), Isotropic("Phenolic", 5, 0.3)
+            ),
+            HT(Isotropic("Fiberglass", 120, 0.29), epoxy),
+        )
+
+    def test_crossovers_output(self, composites, capsys):
+        """
+        Test that every crossover is a root between grid points of opposite order
+        """
+        hits = crossovers(*composites, property="G12eff")
+        assert [hit[:2] for hit in hits] == [
+            ("Carbon-Epoxy", "Kevlar-Phenolic"),
+            ("Kevlar-Phenolic", "Fiberglass-Epoxy"),
+        ]
+        first, second, vf, value, higher = hits[0]
+        assert vf == pytest.approx(0.402162, abs=1e-6)
+        assert value == pytest.approx(2.294, abs=1e-3)
+        assert higher == "Carbon-Epoxy"
+        index = int(vf * 100)
+        below = composites[0].G12_array[index] - composites[1].G12_array[index]
+        above = composites[0].G12_array[index + 1] - composites[1].G12_array[index + 1]
+        assert below < 0 < above
+        assert "Crossovers of G12* between 3 UD Composites" in capsys.readouterr().out
+
+    def test_crossovers_window(self, composites, capsys):
+        """
+        Test that crossovers outside the window of fiber volume fraction are ignored
+        """
+        assert crossovers(*composites, property="G12eff", min=0.5, max=1) == []
+        assert len(crossovers(*composites, property="E2eff", min=0.3, max=0.4)) == 2
+
+    def test_crossovers_with_invalid_inputs(self, composites):
+        """
+        Test that invalid composites and arguments raise
+        """
+        with pytest.raises(ValueError):
+            crossovers(composites[0])
+        with pytest.raises(TypeError):
+            crossovers(composites[0], "Carbon-Epoxy")
+        with pytest.raises(TypeError):
+            crossovers(*composites, property=["E1eff"])
+        with pytest.raises(ValueError):
+            crossovers(*composites, min=0.7, max=0.5)
+
+
+class Test_Analytics:
+    """
+    Test suite for slope, curvature and knee of ``analytics`` method of ```HT```.
+    """
+
+    @pytest.fixture
+    def composite(self):
+        """
+        Provide carbon-epoxy UD composite
+        """
+        return HT(
+            Transtropic("Carbon", 250, 25, 20, 10, 0.28), Isotropic("Epoxy", 2.8, 0.3)
+        )
+
+    def test_analytics_output(self, composite):
+        """
+        Test columns against the rounded table and the slope of rule of mixtures
+        """
+        result = composite.analytics()
+        assert len(result["Vf"]) == len(result["dE2eff"]) == len(result["d2K23eff"])
+        assert np.abs(result["G12eff"] - composite.G12_array).max() < 0.002
+        assert result["dE1eff"] == pytest.approx(np.full(101, 250 - 2.8))
+        assert result["d2v12eff"] == pytest.approx(np.zeros(101), abs=1e-9)
+        assert (result["dG23eff"] > 0).all() and (result["d2G23eff"] > 0).all()
+        assert result["knee"] == {
+            "E1eff": None,
+            "E2eff": 0.71,
+            "G12eff": 0.76,
+            "v12eff": None,
+            "G23eff": 0.72,
+            "K23eff": 0.69,
+        }
+
+    def test_analytics_with_invalid_inputs(self, composite):
+        """
+        Test that only requested columns are returned and unknown properties raise
+        """
+        keys = {"Vf", "knee", "E2eff", "dE2eff", "d2E2eff"}
+        assert set(composite.analytics("E2eff")) == keys
+        with pytest.raises(ValueError):
+            composite.analytics("E3eff")
+        with pytest.raises(TypeError):
+            composite.analytics(1)
+
+
+class Test_ComparisonCache:
+    """
+    Test suite for least-recently-used cache of comparison data.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide carbon-phenolic and carbon-epoxy UD composites and an empty cache
+        """
+        clear_comparison_cache()
+        carbon = Transtropic("Carbon", 250, 25, 20, 10, 0.28)
+        yield (
+            HT(carbon, Isotropic("Phenolic", 5, 0.3)),
+            HT(carbon, Isotropic("Epoxy", 2.8, 0.3)),
+        )
+        clear_comparison_cache(maxsize=128)
+
+    def test_cache_hits_and_invalidation(self, composites, capsys):
+        """
+        Test that repeated comparisons hit the cache until a constituent changes
+        """
+        compare(*composites, property="G12eff", min=0.5)
+        first = capsys.readouterr().out
+        compare(*composites, property="G12eff", min=0.5)
+        assert capsys.readouterr().out == first
+        assert comparison_cache_info() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "maxsize": 128,
+        }
+        composites[1].matrix.youngs_modulus = 3.5
+        compare(*composites, property="G12eff", min=0.5)
+        assert capsys.readouterr().out != first
+        assert comparison_cache_info()["misses"] == 2
+
+    def test_cache_shared_by_save_compare_and_eviction(self, composites, capsys):
+        """
+        Test that a second save_compare reuses all six tables and eviction bounds size
+        """
+        save_compare(*composites, test_name="cache", folder="cache_csv")
+        save_compare(*composites, test_name="cache", folder="cache_csv")
+        assert comparison_cache_info()["hits"] == 6
+        for file_name in os.listdir("./cache_csv"):
+            os.remove(os.path.join("./cache_csv", file_name))
+        os.rmdir("./cache_csv")
+        clear_comparison_cache(maxsize=2)
+        for key in ("E1eff", "E2eff", "G12eff"):
+            compare(*composites, property=key, min=0.5)
+        assert comparison_cache_info()["size"] == 2
+        with pytest.raises(ValueError):
+            clear_comparison_cache(maxsize=-1)
+
+
+class Test_StreamTable:
+    """
+    Test suite for streaming table renderer of ``display`` and ``compare``.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide carbon-phenolic and glass-epoxy UD composites
+        """
+        return (
+            HT(
+                Transtropic("Carbon", 250, 25, 20, 10, 0.28),
+                Isotropic("Phenolic", 5, 0.3),
+            ),
+            HT(Isotropic("Glass", 70, 0.2), Isotropic("Epoxy", 2.8, 0.3)),
+        )
+
+    def test_identical_to_tabulate(self, composites):
+        """
+        Test that display and compare layouts are rendered exactly as tabulate does
+        """
+        tables = [
+            (_get_effective_properties_versus_full_range_Vf(composites[0]), "keys"),
+            (
+                _get_effective_properties_versus_specific_value_Vf(composites[0], 50),
+                "firstrow",
+            ),
+            (_get_fiber_and_matrix_properties(composites[0])[0], "firstrow"),
+            ({"h4": [Decimal("0.0"), Decimal("-0.0")]}, "keys"),
+            ({"h4": [0.0, -0.004, 0.001], "E1*\n(GPa)": [1.0, 2.0, -0.0]}, "keys"),
+        ]
+        for table, fields in tables:
+            assert _print_tabulate(table, fields) == tabulate(
+                table, headers=fields, tablefmt="grid", floatfmt=".2f"
+            )
+
+    def test_render_in_chunks(self, composites, capsys):
+        """
+        Test that chunked output equals the printed table
+        """
+        table = _get_effective_properties_versus_full_range_Vf(composites[1])
+        _render_table(table, "keys", chunk=7)
+        assert capsys.readouterr().out == _print_tabulate(table, "keys") + "\n"
+
+    def test_pager(self, composites, capsys, monkeypatch, tmp_path):
+        """
+        Test that pager receives the whole output of display and compare
+        """
+        display(composites[0], pager=True)  # not a terminal, hence printed
+        printed = capsys.readouterr().out
+        display(composites[0])
+        assert printed == capsys.readouterr().out
+        paged = tmp_path / "paged.txt"
+        monkeypatch.setattr(sys.stdin, "isatty", lambda: True, raising=False)
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+        monkeypatch.delenv("MANPAGER", raising=False)
+        monkeypatch.setenv("PAGER", f"cat > {paged}")
+        display(composites[0], pager=True)
+        assert capsys.readouterr().out == ""
+        assert paged.read_text() == printed
+        compare(*composites, property="all", min=0.5, pager=True)
+        compare(*composites, property="all", min=0.5)
+        assert paged.read_text() == capsys.readouterr().out
+        with pytest.raises(TypeError):
+            display(composites[0], pager=1)
+
+
+class Test_QuickPlot:
+    """
+    Test suite for braille and sparkline text plots of ``quickplot``.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide carbon-epoxy and glass-epoxy UD composites
+        """
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        return (
+            HT(Transtropic("Carbon", 250, 25, 20, 10, 0.28), epoxy),
+            HT(Isotropic("Glass", 70, 0.2), epoxy),
+        )
+
+    def test_sparkline(self, composites, capsys):
+        """
+        Test that sparklines rise with E2* on a common scale of both UD composites
+        """
+        text = quickplot(*composites, property="E2eff", style="spark", width=20)
+        assert capsys.readouterr().out == text + "\n\n"
+        lines = text.splitlines()
+        assert lines[1] == "E2* (GPa) versus Vf from 0.00 to 1.00"
+        assert lines[3].startswith("[1] ▁") and lines[3].endswith("Carbon-Epoxy")
+        assert lines[4][23] == "█" and lines[3][23] != "█"
+
+    def test_braille_canvas(self, composites, capsys):
+        """
+        Test that braille canvas has the requested size and labelled bounds
+        """
+        text = quickplot(*composites, min=0.2, max=0.8, width=30, height=5)
+        canvas = text.splitlines()[3:8]
+        assert all(len(line) == 41 for line in canvas)
+        assert canvas[0].startswith("   200.56 ┤")
+        assert canvas[-1][11:].count(chr(0x2800)) < 30
+        assert "[2] Glass-Epoxy" in text
+
+    def test_braille_markers(self, composites, capsys):
+        """
+        Test that every curve of several UD composites is marked by its legend number
+        """
+        lines = quickplot(*composites, width=30, height=5).splitlines()[3:8]
+        canvas = "".join(line[11:] for line in lines)
+        assert canvas.count("1") == 1 and canvas.count("2") == 1
+        lines = quickplot(composites[0], width=30).splitlines()[3:15]
+        assert "1" not in "".join(line[11:] for line in lines)
+        with pytest.raises(ValueError):
+            quickplot(*(composites * 18))
+        assert quickplot(*(composites * 18), style="spark").count("\n[") == 36
+
+    def test_errors(self, composites):
+        """
+        Test invalid arguments of ``quickplot``
+        """
+        with pytest.raises(ValueError):
+            quickplot()
+        with pytest.raises(ValueError):
+            quickplot(composites[0], style="dots")
+        with pytest.raises(TypeError):
+            quickplot(composites[0], width=2.5)
+
+
+class Test_Npz:
+    """
+    Test suite for binary columnar export and import of ``save_npz`` and ``load_npz``.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide carbon-epoxy and fiberglass-epoxy UD composites and remove npz folder
+        """
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        yield (
+            HT(Transtropic("Carbon", 250, 25, 20, 10, 0.28), epoxy),
+            HT(Isotropic("Fiberglass", 120, 0.29), epoxy),
+        )
+        if os.path.isdir("./npz_test"):
+            for file_name in os.listdir("./npz_test"):
+                os.remove(os.path.join("./npz_test", file_name))
+            os.rmdir("./npz_test")
+
+    def test_library_round_trip(self, composites, capsys):
+        """
+        Test that a library file reads back every column and constituent
+        """
+        save_npz(*composites, folder="npz_test", library="suppliers")
+        assert "suppliers.npz file saved!" in capsys.readouterr().out
+        loaded = load_npz("npz_test/suppliers.npz")
+        assert list(loaded) == ["Carbon-Epoxy", "Fiberglass-Epoxy"]
+        keys = ("Vf", "E1eff", "E2eff", "G12eff", "v12eff", "G23eff", "K23eff")
+        for composite in composites:
+            columns = loaded[composite.name]
+            table = np.vstack([columns[key] for key in keys])
+            assert np.array_equal(table, composite.table)
+        fiber = loaded["Carbon-Epoxy"]["fiber"]
+        assert isinstance(fiber, Transtropic)
+        assert fiber.major_poissons_ratio == Decimal("0.280")
+        assert loaded["Fiberglass-Epoxy"]["fiber"].youngs_modulus == Decimal("120.000")
+
+    def test_file_per_composite(self, composites, capsys):
+        """
+        Test that a file is saved for every UD composite
+        """
+        save_npz(*composites, folder="npz_test")
+        assert sorted(os.listdir("./npz_test")) == [
+            "Carbon-Epoxy_eff_moduli.npz",
+            "Fiberglass-Epoxy_eff_moduli.npz",
+        ]
+        loaded = load_npz("npz_test/Fiberglass-Epoxy_eff_moduli.npz")
+        assert loaded["Fiberglass-Epoxy"]["E1eff"][50] == float(
+            composites[1].eff_axial_youngs_moduli[50]
+        )
+
+    def test_errors(self, composites):
+        """
+        Test invalid arguments of ``save_npz`` and ``load_npz``
+        """
+        with pytest.raises(TypeError):
+            save_npz()
+        with pytest.raises(TypeError):
+            save_npz(composites[0], library=1)
+        with pytest.raises(TypeError):
+            load_npz(None)
+        fiber = Transtropic("Carbon", 250, 25, 20, 10, 0.28)
+        glass = Isotropic("Glass", 70, 0.22)
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        hybrids = [HybridHT(fiber, glass, epoxy, ratio) for ratio in (0.3, 0.7)]
+        with pytest.raises(ValueError):
+            save_npz(*hybrids, folder="npz_test", library="hybrids")
+        with pytest.raises(ValueError):
+            save_npz(*hybrids, folder="npz_test")
+        assert not os.path.exists("./npz_test")
+        np.savez_compressed("npz_twice.npz", names=np.array(["Carbon", "Carbon"]))
+        with pytest.raises(ValueError):
+            load_npz("npz_twice.npz")
+        os.remove("npz_twice.npz")
+
+
+class Test_ResultStore:
+    """
+    Test suite for memory-mapped result store of ```ResultStore``` and ```StoredHT```.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide carbon-epoxy and fiberglass-phenolic UD composites and remove store
+        """
+        yield (
+            HT(
+                Transtropic("Carbon", 250, 25, 20, 10, 0.28),
+                Isotropic("Epoxy", 2.8, 0.3),
+            ),
+            HT(Isotropic("Fiberglass", 120, 0.29), Isotropic("Phenolic", 5, 0.3)),
+        )
+        for file_name in ("library.npy", "library.json"):
+            if os.path.isfile(os.path.join("./store_test", file_name)):
+                os.remove(os.path.join("./store_test", file_name))
+        if os.path.isdir("./store_test"):
+            os.rmdir("./store_test")
+
+    def test_create_and_open(self, composites):
+        """
+        Test that a reopened store holds zero-copy tables and constituents
+        """
+        ResultStore.create("store_test/library", composites)
+        store = ResultStore("store_test/library")
+        assert len(store) == 2 and "Carbon-Epoxy" in store
+        assert isinstance(store.data, np.memmap)
+        stored = store["Fiberglass-Phenolic"]
+        assert isinstance(stored, StoredHT) and stored is store["Fiberglass-Phenolic"]
+        assert np.shares_memory(stored.table, store.data)
+        assert np.array_equal(store.table("Carbon-Epoxy"), composites[0].table)
+        assert stored.matrix.youngs_modulus == Decimal("5.000")
+
+    def test_display_and_compare(self, composites, capsys):
+        """
+        Test that stored UD composites print the same as computed ones
+        """
+        store = ResultStore.create("store_test/library", composites)
+        stored = store.composites()
+        ratios = composites[0].eff_major_poissons_ratios
+        assert stored[0].eff_major_poissons_ratios == ratios
+        display(composites[0], 0.5)
+        compare(*composites, property="all", min=0.2, max=0.3)
+        computed = capsys.readouterr().out
+        display(stored[0], 0.5)
+        compare(*stored, property="all", min=0.2, max=0.3)
+        assert capsys.readouterr().out == computed
+
+    def test_errors(self, composites):
+        """
+        Test invalid arguments of ```ResultStore```
+        """
+        with pytest.raises(TypeError):
+            ResultStore(None)
+        with pytest.raises(TypeError):
+            ResultStore.create("store_test/library", [composites[0], "Epoxy"])
+        with pytest.raises(ValueError):
+            ResultStore.create("store_test/library", [composites[0], composites[0]])
+        with pytest.raises(FileNotFoundError):
+            ResultStore("store_test/missing")
+
+
+class Test_ConcurrentSave:
+    """
+    Test suite for concurrent csv writing of ``save`` and ``save_compare``.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide three UD composites and remove csv folders
+        """
+        epoxy = Isotropic("Epoxy", 2.8, 0.3)
+        yield (
+            HT(Transtropic("Carbon", 250, 25, 20, 10, 0.28), epoxy),
+            HT(Isotropic("Fiberglass", 120, 0.29), epoxy),
+            HT(Isotropic("Glass", 70, 0.2), Isotropic("Phenolic", 5, 0.3)),
+        )
+        for folder in ("./serial_test", "./workers_test"):
+            if os.path.isdir(folder):
+                for file_name in os.listdir(folder):
+                    os.remove(os.path.join(folder, file_name))
+                os.rmdir(folder)
+
+    def test_identical_files(self, composites, capsys):
+        """
+        Test that threads write the same files as serial saving
+        """
+        save(*composites, folder="serial_test", void_contents=[0, 0.02])
+        save_compare(*composites, folder="serial_test")
+        save(*composites, folder="workers_test", void_contents=[0, 0.02], workers=3)
+        save_compare(*composites, folder="workers_test", workers=2)
+        file_names = sorted(os.listdir("./serial_test"))
+        assert file_names == sorted(os.listdir("./workers_test"))
+        for file_name in file_names:
+            with open(os.path.join("./serial_test", file_name)) as serial:
+                with open(os.path.join("./workers_test", file_name)) as threaded:
+                    assert serial.read() == threaded.read()
+
+    def test_same_filenames(self, composites, capsys):
+        """
+        Test that files of the same filename are written in argument order
+        """
+        fibers = (composites[0].fiber, composites[1].fiber)
+        matrix = composites[0].matrix
+        hybrids = [HybridHT(*fibers, matrix, ratio / 10) for ratio in range(10)]
+        save(*hybrids, folder="serial_test")
+        capsys.readouterr()
+        save(*hybrids, folder="workers_test", workers=4)
+        summary = capsys.readouterr().out.splitlines()[-1]
+        assert summary == " 3 files saved! ".center(74, "=")
+        file_names = sorted(os.listdir("./serial_test"))
+        assert file_names == sorted(os.listdir("./workers_test"))
+        for file_name in file_names:
+            with open(os.path.join("./serial_test", file_name)) as serial:
+                with open(os.path.join("./workers_test", file_name)) as threaded:
+                    assert serial.read() == threaded.read()
+
+    def test_aggregate_status(self, composites, capsys):
+        """
+        Test that confirmations are notified as a single summary
+        """
+        save(*composites, folder="workers_test", workers=2)
+        assert capsys.readouterr().out.splitlines() == [
+            "Folder ./workers_test created",
+            " 7 files saved! ".center(74, "="),
+        ]
+        with quiet(summary=False) as output:
+            save_compare(*composites, folder="workers_test", workers=4)
+        assert [status for _, status in output.notices] == [True] * 6
+
+    def test_errors(self, composites):
+        """
+        Test invalid number of workers
+        """
+        with pytest.raises(TypeError):
+            save(composites[0], folder="workers_test", workers=2.0)
+        with pytest.raises(ValueError):
+            save_compare(*composites, folder="workers_test", workers=0)
+
+
+class Test_IncrementalBuild:
+    """
+    Test suite for incremental builds of ``save`` and ``plot``.
+    """
+
+    @pytest.fixture
+    def composites(self):
+        """
+        Provide two UD composites and remove incremental folders
+        """
+        yield [
+            HT(
+                Transtropic("Carbon", 250, 25, 20, 10, 0.28),
+                Isotropic("Epoxy", 2.8, 0.3),
+            ),
+            HT(Isotropic("Glass", 70, 0.2), Isotropic("Phenolic", 5, 0.3)),
+        ]
+        for folder in ("./incremental_csv", "./incremental_png", "./full_csv"):
+            if os.path.isdir(folder):
+                for file_name in os.listdir(folder):
+                    os.remove(os.path.join(folder, file_name))
+                os.rmdir(folder)
+
+    def test_skip_unchanged(self, composites, capsys):
+        """
+        Test that unchanged composites are skipped and edited ones rebuilt
+        """
+        save(*composites, folder="incremental_csv", incremental=True)
+        file_names = sorted(os.listdir("./incremental_csv"))
+        assert ".manifest.json" in file_names
+        mtimes = [
+            os.stat(f"./incremental_csv/{name}").st_mtime_ns for name in file_names
+        ]
+        capsys.readouterr()
+        save(*composites, folder="incremental_csv", incremental=True)
+        assert capsys.readouterr().out.splitlines() == [
+            " 5 files up to date ".center(74, "-")
+        ]
+        assert mtimes == [
+            os.stat(f"./incremental_csv/{name}").st_mtime_ns for name in file_names
+        ]
+        composites[1].matrix.youngs_modulus = 4.5
+        save(*composites, folder="incremental_csv", incremental=True)
+        output = capsys.readouterr().out.splitlines()
+        assert output[0] == " 3 files up to date ".center(74, "-")
+        assert len(output) == 3
+        assert all("Glass-Phenolic" in line for line in output[1:])
+
+    def test_same_names(self, composites, capsys):
+        """
+        Test that composites of the same name leave the files of a full build
+        """
+        fiber, matrix = composites[0].fiber, composites[0].matrix
+        glass = composites[1].fiber
+        hybrids = [HybridHT(fiber, glass, matrix, ratio) for ratio in (0.3, 0.7)]
+        save(*hybrids, folder="full_csv")
+        save(*hybrids, folder="incremental_csv", incremental=True)
+        capsys.readouterr()
+        save(*hybrids, folder="incremental_csv", incremental=True)
+        assert capsys.readouterr().out.splitlines() == [
+            " 3 files up to date ".center(74, "-")
+        ]
+        for file_name in os.listdir("./full_csv"):
+            with open(os.path.join("./full_csv", file_name)) as full:
+                with open(os.path.join("./incremental_csv", file_name)) as incremental:
+                    assert full.read() == incremental.read()
+
+    def test_missing_file(self, composites, capsys):
+        """
+        Test that deleted artifacts are regenerated
+        """
+        plot(composites[0], folder="incremental_png", incremental=True)
+        os.remove("./incremental_png/Carbon-Epoxy_G12eff.png")
+        capsys.readouterr()
+        plot(composites[0], folder="incremental_png", incremental=True)
+        assert capsys.readouterr().out.splitlines() == [
+            " Carbon-Epoxy_E1eff.png file saved! ".center(74, "="),
+            " Carbon-Epoxy_E2eff.png file saved! ".center(74, "="),
+            " Carbon-Epoxy_G12eff.png file saved! ".center(74, "="),
+            " Carbon-Epoxy_G23eff.png file saved! ".center(74, "="),
+            " Carbon-Epoxy_K23eff.png file saved! ".center(74, "="),
+            " Carbon-Epoxy_v12eff.png file saved! ".center(74, "="),
+        ]
+
+    def test_errors(self, composites):
+        """
+        Test invalid incremental flag
+        """
+        with pytest.raises(TypeError):
+            save(*composites, folder="incremental_csv", incremental=1)
+        with pytest.raises(TypeError):
+            plot(*composites, folder="incremental_png", incremental=None)